@@ -4,6 +4,8 @@ API Package for Elixir Backend
 This package contains all API-related modules:
 - http_routes: REST HTTP endpoints
 - websocket_routes: WebSocket endpoints for real-time data
+- stream_routes: Server-Sent Events stream for dashboard live state
 - shared: Common dependencies and models
+- descriptions: OpenAPI endpoint descriptions referenced by the routes
 - routes: Main router that combines everything
 """ 
\ No newline at end of file
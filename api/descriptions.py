@@ -0,0 +1,235 @@
+"""
+Route descriptions for the OpenAPI documentation.
+
+The long-form endpoint descriptions live here instead of inline in the route
+decorators, keeping the route modules readable. Routes reference them by
+handler name, e.g. ``description=DESC["toggle_ac"]``.
+"""
+
+DESC = {
+    # === PLC CONTROL ROUTES ===
+    "reload_plc_config": "Reload PLC address configuration from file. Useful after updating address mappings without restarting the server.",
+    "get_all_addresses": "Retrieve all configured PLC addresses organized by functional categories (authentication, control panel, pressure control, etc.).",
+    "search_address": "Search for all functions that use a specific PLC memory address. Useful for debugging and understanding address mappings.",
+    "show_password_screen": "Display the password authentication screen on the hyperbaric chamber interface.",
+    "proceed_from_password": "Proceed from the password screen after successful authentication.",
+    "back_from_password": "Navigate back from the password screen to the previous interface.",
+    "set_password_input": "Submit password input for authentication. The password will be verified against stored credentials.",
+    "get_auth_status": "Retrieve current authentication status including proceed status, password change status, and stored passwords.",
+    "switch_language": "Toggle between English and Chinese language interfaces for the hyperbaric chamber display.",
+    "get_current_language": "Retrieve the current language setting showing which language is active (English or Chinese).",
+    "shutdown_system": "⚠️ WARNING: Trigger a controlled shutdown of the hyperbaric chamber system. Use with extreme caution.",
+    "toggle_ac": "Toggle the air conditioning system on or off. Controls climate control within the chamber.",
+    "toggle_ceiling_lights": "Toggle the main ceiling lighting system within the hyperbaric chamber.",
+    "toggle_reading_lights": "Toggle the reading lights for focused illumination during treatment sessions.",
+    "toggle_door_lights": "Toggle the door lighting system for entry and exit illumination.",
+    "toggle_intercom": "Toggle the intercom communication system between chamber and operator station. ⚠️ Ensure functional before treatment.",
+    "get_control_status": "Retrieve current status of all control panel components (AC, lights, intercom, shutdown status).",
+    "add_pressure": "Increase the pressure setpoint by 10 units with safety limits enforced by PLC.",
+    "subtract_pressure": "Decrease the pressure setpoint by 10 units for controlled pressure reduction.",
+    "set_pressure_setpoint": "Set pressure setpoint to a specific value. ⚠️ Use with caution - ensure target is within safe operating ranges (1.3-3.0 ATA).",
+    "get_pressure_readings": "Retrieve real-time pressure readings from all sensors including setpoint and dual internal pressure sensors.",
+    "start_session": "Start hyperbaric treatment session with pressurization, safety checks, and database logging. ⚠️ Ensure all safety requirements met.",
+    "end_session": "End treatment session with controlled depressurization and database finalization. ⚠️ Do not interrupt depressurization once started.",
+    "toggle_equalise": "Toggle the equalise/pause state during treatment session. Use to pause treatment for patient comfort or safety assessments.",
+    "confirm_depressurization": "Confirm and acknowledge the depressurization process for operator verification and safety compliance.",
+    "set_operating_mode": "Set treatment operating mode (rest, health, professional, custom, o2_100, o2_120) with optional duration override.",
+    "set_compression_mode": "Set compression mode for pressurization rate: beginner (slow), normal (standard), or fast (rapid).",
+    "set_oxygen_mode": "Set oxygen delivery mode: continuous (constant delivery) or intermittent (alternating cycles with air breaks).",
+    "set_ac_mode": "Configure AC fan mode: auto (temperature-based), low, mid, or high speed for optimal climate control.",
+    "set_temperature_setpoint": "Set target temperature for chamber climate control. Range: 18°C-28°C with ±0.5°C accuracy.",
+    "toggle_heating_cooling": "Toggle between heating and cooling modes for the HVAC system to reach target temperature.",
+    "get_sensor_readings": "Retrieve real-time readings from all environmental and safety sensors (temperature, humidity, oxygen, pressure).",
+    "calibrate_pressure_sensor": "Initiate pressure sensor calibration procedure. ⚠️ Requires atmospheric pressure, no active sessions, and qualified technician.",
+    "calibrate_oxygen_sensor": "Initiate oxygen sensor calibration using air and pure oxygen references. ⚠️ Use certified gases only with proper ventilation.",
+    "toggle_manual_mode": "⚠️ WARNING: Enable/disable manual control mode bypassing automatic safety systems. Use only with qualified supervision.",
+    "set_manual_control": "⚠️ CRITICAL: Set individual component controls in manual mode. Bypasses safety systems - qualified personnel only.",
+    "get_system_status": "Retrieve comprehensive system status including session states, timers, and system health indicators for monitoring.",
+    "get_status_snapshot": "Retrieve control panel, pressure and sensor status in one response, read from the PLC together. Use instead of polling the individual status endpoints.",
+    "get_websocket_status": "Retrieve current WebSocket connection status for debugging and monitoring purposes.",
+    "read_custom_plc_address": "Read a value from a custom PLC memory address for development and debugging purposes.",
+    "write_custom_plc_address": "⚠️ WARNING: Write a value to a custom PLC memory address. Use with extreme caution in development only.",
+    "add_address_monitoring": "Add a PLC address to the WebSocket real-time monitoring stream.",
+    "remove_address_monitoring": "Remove a PLC address from the WebSocket real-time monitoring stream.",
+    "list_monitored_addresses": "Get the list of PLC addresses currently being monitored in real-time.",
+
+    # === SESSION HISTORY ROUTES ===
+    "initialize_database": """
+    Initialize the session history database tables.
+    
+    This endpoint creates all necessary database tables for storing session
+    history, parameters, data points, and events. Safe to call multiple times.
+    
+    **Use Cases:**
+    - Initial system setup
+    - Database recovery
+    - Schema updates
+    
+    **Note:** This operation is idempotent and will not affect existing data.
+    """,
+    "get_database_information": """
+    Retrieve information about the database connection and schema.
+    
+    Returns details about:
+    - Database connection URL
+    - Database engine information
+    - Available tables
+    - Connection status
+    """,
+    "create_session_record": """
+    Create a new session record in the database with initial parameters.
+    
+    This endpoint creates a session record that can be used to track the
+    complete lifecycle of a hyperbaric treatment session including:
+    
+    **Session Information:**
+    - Treatment and compression modes
+    - Target parameters (pressure, temperature)
+    - Patient identification (optional)
+    - Operator notes and metadata
+    
+    **Automatic Features:**
+    - Unique session UUID generation
+    - Sequential session numbering
+    - Session start timestamp
+    - Initial event logging
+    
+    **Note:** This is separate from the PLC session start and can be used
+    for pre-session planning and documentation.
+    """,
+    "end_current_session": """
+    End the current active session with completion details.
+    
+    This endpoint finalizes the current session record by:
+    - Setting the end timestamp
+    - Recording completion reason
+    - Calculating final statistics
+    - Logging session end event
+    
+    **Completion Reasons:**
+    - `normal`: Planned completion
+    - `emergency_stop`: Emergency termination
+    - `manual_abort`: Operator-initiated abort
+    - `error`: System error termination
+    
+    **Final Statistics:**
+    Session statistics are automatically calculated from recorded data points
+    including pressure ranges, temperature averages, and oxygen levels.
+    """,
+    "get_current_session": """
+    Retrieve information about the currently active session.
+    
+    Returns complete session details including:
+    - Session identification and timing
+    - Treatment parameters and modes
+    - Current status and progress
+    - Recorded events and parameters
+    - Data points summary
+    
+    **Use Cases:**
+    - Real-time session monitoring
+    - Progress tracking
+    - Status verification
+    """,
+    "get_session_history": """
+    Retrieve paginated session history with optional filtering.
+    
+    This endpoint provides comprehensive session history with support for:
+    
+    **Filtering Options:**
+    - **Status**: Filter by session status (started, running, completed, aborted)
+    - **Date Range**: Filter sessions within specific date ranges
+    - **Pagination**: Limit and offset for large datasets
+    
+    **Sorting:**
+    - Sessions are returned in reverse chronological order (newest first)
+    
+    **Response Format:**
+    - Paginated results with metadata
+    - Session summaries (detailed view available separately)
+    - `has_more` tells whether another page exists
+    - `total_count` of all matching sessions when `include_total=true` (null otherwise)
+    
+    **Use Cases:**
+    - Session history review
+    - Treatment tracking
+    - Compliance reporting
+    - Statistical analysis
+    """,
+    "get_session_details": """
+    Retrieve comprehensive details for a specific session.
+    
+    This endpoint provides complete session information including:
+    
+    **Session Overview:**
+    - Session identification and timing
+    - Treatment parameters and final statistics
+    - Completion status and reason
+    
+    **Session Parameters:**
+    - All recorded session parameters
+    - Parameter categories and types
+    - Recording timestamps
+    
+    **Session Events:**
+    - State changes and operator actions
+    - System events and alarms
+    - Event severity and descriptions
+    
+    **Data Points (Optional):**
+    - Real-time sensor readings throughout session
+    - System status at each recording
+    - Pressure, temperature, and oxygen trends
+    
+    **Use Cases:**
+    - Detailed session review
+    - Clinical documentation
+    - Troubleshooting and analysis
+    - Compliance and audit trails
+    """,
+    "get_session_events": """
+    Retrieve all events for a specific session.
+    
+    Events include:
+    - State changes (pressurizing, running, depressurizing)
+    - Operator actions (mode changes, manual controls)
+    - System alerts and alarms
+    - Safety-related events
+    
+    **Event Categories:**
+    - `state_change`: Session phase transitions
+    - `operator_action`: User-initiated actions
+    - `system_event`: Automated system events
+    - `alarm`: Safety alerts and warnings
+    
+    **Severity Levels:**
+    - `info`: Informational events
+    - `warning`: Important notifications
+    - `error`: Error conditions
+    - `critical`: Critical safety events
+    """,
+    "get_session_statistics": """
+    Retrieve summary statistics for session history.
+    
+    Provides aggregated statistics including:
+    - Total number of sessions
+    - Sessions by status
+    - Sessions by treatment mode
+    - Average session durations
+    - Recent activity summary
+    
+    **Time Periods:**
+    - All time totals
+    - Last 30 days summary
+    - Current month statistics
+    
+    **Use Cases:**
+    - Dashboard statistics
+    - Usage reporting
+    - Performance metrics
+    - Trend analysis
+    """,
+
+    # === STREAM ROUTES ===
+    "stream_status": "Server-Sent Events stream of control, pressure, sensor, language and authentication status. An event is pushed whenever a value changes, replacing polling of the individual status endpoints.",
+}
@@ -11,13 +11,21 @@ ARCHITECTURAL PRINCIPLE:
 All routes send simple commands to the PLC and let the PLC handle the actual logic.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+import asyncio
+import hashlib
+import os
+import time
+from typing import Any, Dict, Tuple, get_args
+
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from pydantic import BaseModel
 
+from .descriptions import DESC
+from .stream_routes import schedule_next_tick
 from .shared import (
-    get_plc, logger, Addresses, get_plc_config, reload_config, ContextLogger,
+    get_plc_async, logger, Addresses, get_plc_config, reload_config, ContextLogger, read_loader, status_cache, command_queue,
     PLCResponse, PasswordRequest, PressureRequest, TemperatureRequest, 
-    ModeRequest, ManualControlRequest
+    ModeRequest, ManualControlRequest, CompressionMode, OxygenMode, ACMode
 )
 
 # Import session service for database integration
@@ -26,13 +34,54 @@ from core.session_service import session_service
 # Create router
 router = APIRouter()
 
+# Handlers doing blocking PLC or database I/O are plain `def` so FastAPI runs
+# them in its threadpool; async handlers must hand PLC calls to a thread.
+
+# Mark the polled status GETs as deprecated in favour of /api/stream
+STATUS_POLLING_DEPRECATED = os.getenv("STATUS_POLLING_DEPRECATED", "false").lower() == "true"
+
+# Seconds a status GET response is reused (0 disables caching); measured
+# values get a shorter window than the control and mode flags
+STATUS_CACHE_TTL = float(os.getenv("STATUS_CACHE_TTL", "1.0"))
+READINGS_CACHE_TTL = float(os.getenv("READINGS_CACHE_TTL", "0.25"))
+
+async def read_fields(fields: Dict[str, Tuple[str, str]]) -> Dict[str, Any]:
+    """Read a response key -> (category, function) map in one batched fetch"""
+    addresses = get_plc_config().get_addresses(fields.values())
+    values = await read_loader.load_many(addresses)
+    return dict(zip(fields, values))
+
+def render_status(response: PLCResponse) -> Tuple[str, str]:
+    """Return the JSON body and data ETag of a status response"""
+    digest = hashlib.blake2b(response.model_dump_json(include={"data"}).encode(), digest_size=8)
+    return response.model_dump_json(), f'W/"{digest.hexdigest()}"'
+
+async def cached_response(key: str, ttl: float, read_status, request: Request) -> Response:
+    """
+    Serve read_status() through status_cache as pre-rendered JSON.
+    
+    The PLCResponse is serialized once per cache fill; cache hits return the
+    stored body without FastAPI re-validating and re-encoding the model.
+    The ETag covers the data only (not the timestamp), so a client sending
+    If-None-Match gets an empty 304 while the PLC values are unchanged.
+    """
+    async def render():
+        return render_status(await read_status())
+
+    body, etag = await status_cache.get_or_compute(key, ttl, render)
+    headers = {"ETag": etag, "Cache-Control": "max-age=0, must-revalidate"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # === CONFIGURATION MANAGEMENT ===
 @router.post(
     "/api/config/reload", 
     response_model=PLCResponse,
     tags=["Configuration Management"],
     summary="Reload PLC Configuration",
-    description="Reload PLC address configuration from file. Useful after updating address mappings without restarting the server.",
+    description=DESC["reload_plc_config"],
     responses={
         200: {"description": "Configuration reloaded successfully"},
         500: {"description": "Failed to reload configuration"}
@@ -45,7 +94,7 @@ async def reload_plc_config():
         logger.info("PLC configuration reloaded successfully")
         return PLCResponse(success=True, message="PLC configuration reloaded")
     except Exception as e:
-        logger.error(f"Failed to reload PLC configuration: {e}")
+        logger.error("Failed to reload PLC configuration: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
@@ -53,7 +102,7 @@ async def reload_plc_config():
     response_model=PLCResponse,
     tags=["Configuration Management"],
     summary="Get All PLC Addresses",
-    description="Retrieve all configured PLC addresses organized by functional categories (authentication, control panel, pressure control, etc.).",
+    description=DESC["get_all_addresses"],
     responses={
         200: {"description": "Address configuration retrieved successfully"},
         500: {"description": "Failed to retrieve address configuration"}
@@ -71,7 +120,7 @@ async def get_all_addresses():
             }
         )
     except Exception as e:
-        logger.error(f"Failed to get PLC addresses: {e}")
+        logger.error("Failed to get PLC addresses: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
@@ -79,7 +128,7 @@ async def get_all_addresses():
     response_model=PLCResponse,
     tags=["Configuration Management"],
     summary="Search Functions by Address",
-    description="Search for all functions that use a specific PLC memory address. Useful for debugging and understanding address mappings.",
+    description=DESC["search_address"],
     responses={
         200: {"description": "Search completed successfully"},
         500: {"description": "Search operation failed"}
@@ -98,7 +147,7 @@ async def search_address(address: str):
             }
         )
     except Exception as e:
-        logger.error(f"Failed to search address: {e}")
+        logger.error("Failed to search address: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === AUTHENTICATION/PASSWORD ROUTES ===
@@ -107,13 +156,13 @@ async def search_address(address: str):
     response_model=PLCResponse,
     tags=["Authentication & Security"],
     summary="Show Password Screen",
-    description="Display the password authentication screen on the hyperbaric chamber interface.",
+    description=DESC["show_password_screen"],
     responses={
         200: {"description": "Password screen displayed successfully"},
         500: {"description": "Failed to display password screen"}
     }
 )
-async def show_password_screen(plc = Depends(get_plc)):
+def show_password_screen(plc = Depends(get_plc_async)):
     """Show the password screen"""
     try:
         with ContextLogger(logger, operation="AUTH_SHOW"):
@@ -122,7 +171,7 @@ async def show_password_screen(plc = Depends(get_plc)):
             logger.info("Password screen display requested")
             return PLCResponse(success=True, message="Password screen shown")
     except Exception as e:
-        logger.error(f"Failed to show password screen: {e}")
+        logger.error("Failed to show password screen: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -130,13 +179,13 @@ async def show_password_screen(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Authentication & Security"],
     summary="Proceed from Password Screen",
-    description="Proceed from the password screen after successful authentication.",
+    description=DESC["proceed_from_password"],
     responses={
         200: {"description": "Successfully proceeded from password screen"},
         500: {"description": "Failed to proceed from password screen"}
     }
 )
-async def proceed_from_password(plc = Depends(get_plc)):
+def proceed_from_password(plc = Depends(get_plc_async)):
     """Proceed from password screen"""
     try:
         with ContextLogger(logger, operation="AUTH_PROCEED"):
@@ -145,7 +194,7 @@ async def proceed_from_password(plc = Depends(get_plc)):
             logger.info("Password proceed requested")
             return PLCResponse(success=True, message="Password proceed triggered")
     except Exception as e:
-        logger.error(f"Failed to proceed from password: {e}")
+        logger.error("Failed to proceed from password: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -153,13 +202,13 @@ async def proceed_from_password(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Authentication & Security"],
     summary="Go Back from Password Screen",
-    description="Navigate back from the password screen to the previous interface.",
+    description=DESC["back_from_password"],
     responses={
         200: {"description": "Successfully navigated back from password screen"},
         500: {"description": "Failed to navigate back from password screen"}
     }
 )
-async def back_from_password(plc = Depends(get_plc)):
+def back_from_password(plc = Depends(get_plc_async)):
     """Go back from password screen"""
     try:
         with ContextLogger(logger, operation="AUTH_BACK"):
@@ -168,7 +217,7 @@ async def back_from_password(plc = Depends(get_plc)):
             logger.info("Password back requested")
             return PLCResponse(success=True, message="Password back triggered")
     except Exception as e:
-        logger.error(f"Failed to go back from password: {e}")
+        logger.error("Failed to go back from password: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -176,13 +225,13 @@ async def back_from_password(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Authentication & Security"],
     summary="Set Password Input",
-    description="Submit password input for authentication. The password will be verified against stored credentials.",
+    description=DESC["set_password_input"],
     responses={
         200: {"description": "Password input submitted successfully"},
         500: {"description": "Failed to submit password input"}
     }
 )
-async def set_password_input(request: PasswordRequest, plc = Depends(get_plc)):
+def set_password_input(request: PasswordRequest, plc = Depends(get_plc_async)):
     """Set password input"""
     try:
         with ContextLogger(logger, operation="AUTH_INPUT", password_length=len(str(request.password or ""))):
@@ -191,37 +240,37 @@ async def set_password_input(request: PasswordRequest, plc = Depends(get_plc)):
             logger.info("Password input set")
             return PLCResponse(success=True, message="Password input set")
     except Exception as e:
-        logger.error(f"Failed to set password input: {e}")
+        logger.error("Failed to set password input: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+AUTH_STATUS_FIELDS = {
+    "proceed_status": ("authentication", "proceed_status"),
+    "change_pw_status": ("authentication", "change_password_status"),
+    "user_pw": ("authentication", "user_password"),
+    "admin_pw": ("authentication", "admin_password")
+}
+
 @router.get(
     "/api/auth/status", 
     response_model=PLCResponse,
+    deprecated=STATUS_POLLING_DEPRECATED,
     tags=["Authentication & Security"],
     summary="Get Authentication Status",
-    description="Retrieve current authentication status including proceed status, password change status, and stored passwords.",
+    description=DESC["get_auth_status"],
     responses={
         200: {"description": "Authentication status retrieved successfully"},
         500: {"description": "Failed to retrieve authentication status"}
     }
 )
-async def get_auth_status(plc = Depends(get_plc)):
+async def get_auth_status(request: Request, plc = Depends(get_plc_async)):
     """Get authentication status"""
+    async def read_status():
+        return PLCResponse(success=True, data=await read_fields(AUTH_STATUS_FIELDS))
+
     try:
-        proceed_status = plc.getMem(Addresses.auth("proceed_status"))
-        change_pw_status = plc.getMem(Addresses.auth("change_password_status"))
-        
-        return PLCResponse(
-            success=True,
-            data={
-                "proceed_status": proceed_status,
-                "change_pw_status": change_pw_status,
-                "user_pw": plc.getMem(Addresses.auth("user_password")),
-                "admin_pw": plc.getMem(Addresses.auth("admin_password"))
-            }
-        )
+        return await cached_response("auth", STATUS_CACHE_TTL, read_status, request)
     except Exception as e:
-        logger.error(f"Failed to get auth status: {e}")
+        logger.error("Failed to get auth status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === LANGUAGE ROUTES ===
@@ -230,13 +279,13 @@ async def get_auth_status(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Language & Localization"],
     summary="Switch System Language",
-    description="Toggle between English and Chinese language interfaces for the hyperbaric chamber display.",
+    description=DESC["switch_language"],
     responses={
         200: {"description": "Language switched successfully"},
         500: {"description": "Failed to switch language"}
     }
 )
-async def switch_language(plc = Depends(get_plc)):
+def switch_language(plc = Depends(get_plc_async)):
     """Switch between English and Chinese"""
     try:
         with ContextLogger(logger, operation="LANG_SWITCH"):
@@ -245,36 +294,37 @@ async def switch_language(plc = Depends(get_plc)):
             logger.info("Language switch requested")
             return PLCResponse(success=True, message="Language switch triggered")
     except Exception as e:
-        logger.error(f"Failed to switch language: {e}")
+        logger.error("Failed to switch language: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+LANGUAGE_FIELDS = {
+    "english": ("language", "english_active"),
+    "chinese": ("language", "chinese_active")
+}
+
 @router.get(
     "/api/language/current", 
     response_model=PLCResponse,
+    deprecated=STATUS_POLLING_DEPRECATED,
     tags=["Language & Localization"],
     summary="Get Current Language Setting",
-    description="Retrieve the current language setting showing which language is active (English or Chinese).",
+    description=DESC["get_current_language"],
     responses={
         200: {"description": "Current language retrieved successfully"},
         500: {"description": "Failed to retrieve language status"}
     }
 )
-async def get_current_language(plc = Depends(get_plc)):
+async def get_current_language(request: Request, plc = Depends(get_plc_async)):
     """Get current language setting"""
+    async def read_status():
+        data = await read_fields(LANGUAGE_FIELDS)
+        data["current"] = "english" if data["english"] else "chinese"
+        return PLCResponse(success=True, data=data)
+
     try:
-        eng_lang = plc.getMem(Addresses.language("english_active"))
-        chin_lang = plc.getMem(Addresses.language("chinese_active"))
-        
-        return PLCResponse(
-            success=True,
-            data={
-                "english": eng_lang,
-                "chinese": chin_lang,
-                "current": "english" if eng_lang else "chinese"
-            }
-        )
+        return await cached_response("language", STATUS_CACHE_TTL, read_status, request)
     except Exception as e:
-        logger.error(f"Failed to get language status: {e}")
+        logger.error("Failed to get language status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === CONTROL PANEL ROUTES ===
@@ -283,13 +333,13 @@ async def get_current_language(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Control Panel & System"],
     summary="Initiate System Shutdown",
-    description="⚠️ WARNING: Trigger a controlled shutdown of the hyperbaric chamber system. Use with extreme caution.",
+    description=DESC["shutdown_system"],
     responses={
         200: {"description": "System shutdown initiated successfully"},
         500: {"description": "Failed to initiate system shutdown"}
     }
 )
-async def shutdown_system(plc = Depends(get_plc)):
+def shutdown_system(plc = Depends(get_plc_async)):
     """Trigger system shutdown"""
     try:
         with ContextLogger(logger, operation="SYSTEM_SHUTDOWN"):
@@ -298,7 +348,7 @@ async def shutdown_system(plc = Depends(get_plc)):
             logger.warning("System shutdown requested")
             return PLCResponse(success=True, message="System shutdown initiated")
     except Exception as e:
-        logger.error(f"Failed to shutdown system: {e}")
+        logger.error("Failed to shutdown system: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -306,23 +356,21 @@ async def shutdown_system(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Control Panel & System"],
     summary="Toggle Air Conditioning",
-    description="Toggle the air conditioning system on or off. Controls climate control within the chamber.",
+    description=DESC["toggle_ac"],
     responses={
         200: {"description": "AC toggled successfully", "content": {"application/json": {"example": {"success": True, "data": {"ac_state": True}, "message": "AC toggled"}}}},
         500: {"description": "Failed to toggle AC"}
     }
 )
-async def toggle_ac(plc = Depends(get_plc)):
+def toggle_ac(plc = Depends(get_plc_async)):
     """Toggle AC on/off"""
     try:
         with ContextLogger(logger, operation="AC_TOGGLE"):
-            address = Addresses.control("ac_state")
-            current_state = plc.getMem(address)
-            plc.writeMem(address, not current_state)
-            logger.info(f"AC toggled to {'ON' if not current_state else 'OFF'}")
-            return PLCResponse(success=True, data={"ac_state": not current_state}, message="AC toggled")
+            new_state = plc.toggleBit(Addresses.control("ac_state"))
+            logger.info("AC toggled to %s", 'ON' if new_state else 'OFF')
+            return PLCResponse(success=True, data={"ac_state": new_state}, message="AC toggled")
     except Exception as e:
-        logger.error(f"Failed to toggle AC: {e}")
+        logger.error("Failed to toggle AC: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -330,23 +378,21 @@ async def toggle_ac(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Control Panel & System"],
     summary="Toggle Ceiling Lights",
-    description="Toggle the main ceiling lighting system within the hyperbaric chamber.",
+    description=DESC["toggle_ceiling_lights"],
     responses={
         200: {"description": "Ceiling lights toggled successfully"},
         500: {"description": "Failed to toggle ceiling lights"}
     }
 )
-async def toggle_ceiling_lights(plc = Depends(get_plc)):
+def toggle_ceiling_lights(plc = Depends(get_plc_async)):
     """Toggle ceiling lights"""
     try:
         with ContextLogger(logger, operation="CEILING_LIGHTS_TOGGLE"):
-            address = Addresses.control("ceiling_light_state")
-            current_state = plc.getMem(address)
-            plc.writeMem(address, not current_state)
-            logger.info(f"Ceiling lights toggled to {'ON' if not current_state else 'OFF'}")
-            return PLCResponse(success=True, data={"ceiling_lights": not current_state}, message="Ceiling lights toggled")
+            new_state = plc.toggleBit(Addresses.control("ceiling_light_state"))
+            logger.info("Ceiling lights toggled to %s", 'ON' if new_state else 'OFF')
+            return PLCResponse(success=True, data={"ceiling_lights": new_state}, message="Ceiling lights toggled")
     except Exception as e:
-        logger.error(f"Failed to toggle ceiling lights: {e}")
+        logger.error("Failed to toggle ceiling lights: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -354,23 +400,21 @@ async def toggle_ceiling_lights(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Control Panel & System"],
     summary="Toggle Reading Lights",
-    description="Toggle the reading lights for focused illumination during treatment sessions.",
+    description=DESC["toggle_reading_lights"],
     responses={
         200: {"description": "Reading lights toggled successfully"},
         500: {"description": "Failed to toggle reading lights"}
     }
 )
-async def toggle_reading_lights(plc = Depends(get_plc)):
+def toggle_reading_lights(plc = Depends(get_plc_async)):
     """Toggle reading lights"""
     try:
         with ContextLogger(logger, operation="READING_LIGHTS_TOGGLE"):
-            address = Addresses.control("reading_lights")
-            current_state = plc.getMem(address)
-            plc.writeMem(address, not current_state)
-            logger.info(f"Reading lights toggled to {'ON' if not current_state else 'OFF'}")
-            return PLCResponse(success=True, data={"reading_lights": not current_state}, message="Reading lights toggled")
+            new_state = plc.toggleBit(Addresses.control("reading_lights"))
+            logger.info("Reading lights toggled to %s", 'ON' if new_state else 'OFF')
+            return PLCResponse(success=True, data={"reading_lights": new_state}, message="Reading lights toggled")
     except Exception as e:
-        logger.error(f"Failed to toggle reading lights: {e}")
+        logger.error("Failed to toggle reading lights: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -378,23 +422,21 @@ async def toggle_reading_lights(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Control Panel & System"],
     summary="Toggle Door Lights",
-    description="Toggle the door lighting system for entry and exit illumination.",
+    description=DESC["toggle_door_lights"],
     responses={
         200: {"description": "Door lights toggled successfully"},
         500: {"description": "Failed to toggle door lights"}
     }
 )
-async def toggle_door_lights(plc = Depends(get_plc)):
+def toggle_door_lights(plc = Depends(get_plc_async)):
     """Toggle door lights"""
     try:
         with ContextLogger(logger, operation="DOOR_LIGHTS_TOGGLE"):
-            address = Addresses.control("door_light")
-            current_state = plc.getMem(address)
-            plc.writeMem(address, not current_state)
-            logger.info(f"Door lights toggled to {'ON' if not current_state else 'OFF'}")
-            return PLCResponse(success=True, data={"door_lights": not current_state}, message="Door lights toggled")
+            new_state = plc.toggleBit(Addresses.control("door_light"))
+            logger.info("Door lights toggled to %s", 'ON' if new_state else 'OFF')
+            return PLCResponse(success=True, data={"door_lights": new_state}, message="Door lights toggled")
     except Exception as e:
-        logger.error(f"Failed to toggle door lights: {e}")
+        logger.error("Failed to toggle door lights: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -402,52 +444,54 @@ async def toggle_door_lights(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Control Panel & System"],
     summary="Toggle Intercom System",
-    description="Toggle the intercom communication system between chamber and operator station. ⚠️ Ensure functional before treatment.",
+    description=DESC["toggle_intercom"],
     responses={
         200: {"description": "Intercom toggled successfully"},
         500: {"description": "Failed to toggle intercom"}
     }
 )
-async def toggle_intercom(plc = Depends(get_plc)):
+def toggle_intercom(plc = Depends(get_plc_async)):
     """Toggle intercom"""
     try:
         with ContextLogger(logger, operation="INTERCOM_TOGGLE"):
-            address = Addresses.control("intercom_state")
-            current_state = plc.getMem(address)
-            plc.writeMem(address, not current_state)
-            logger.info(f"Intercom toggled to {'ON' if not current_state else 'OFF'}")
-            return PLCResponse(success=True, data={"intercom": not current_state}, message="Intercom toggled")
+            new_state = plc.toggleBit(Addresses.control("intercom_state"))
+            logger.info("Intercom toggled to %s", 'ON' if new_state else 'OFF')
+            return PLCResponse(success=True, data={"intercom": new_state}, message="Intercom toggled")
     except Exception as e:
-        logger.error(f"Failed to toggle intercom: {e}")
+        logger.error("Failed to toggle intercom: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+# Response key -> (category, function) for the control panel status read
+CONTROL_STATUS_FIELDS = {
+    "ac_state": ("control_panel", "ac_state"),
+    "ceiling_lights": ("control_panel", "ceiling_light_state"),
+    "intercom": ("control_panel", "intercom_state"),
+    "reading_lights": ("control_panel", "reading_lights"),
+    "door_light": ("control_panel", "door_light"),
+    "shutdown_status": ("control_panel", "shutdown_status"),
+}
+
 @router.get(
     "/api/control/status", 
     response_model=PLCResponse,
+    deprecated=STATUS_POLLING_DEPRECATED,
     tags=["Control Panel & System"],
     summary="Get Control Panel Status",
-    description="Retrieve current status of all control panel components (AC, lights, intercom, shutdown status).",
+    description=DESC["get_control_status"],
     responses={
         200: {"description": "Control panel status retrieved successfully"},
         500: {"description": "Failed to retrieve control panel status"}
     }
 )
-async def get_control_status(plc = Depends(get_plc)):
+async def get_control_status(request: Request, plc = Depends(get_plc_async)):
     """Get current control panel status"""
+    async def read_status():
+        return PLCResponse(success=True, data=await read_fields(CONTROL_STATUS_FIELDS))
+
     try:
-        return PLCResponse(
-            success=True,
-            data={
-                "ac_state": plc.getMem(Addresses.control("ac_state")),
-                "ceiling_lights": plc.getMem(Addresses.control("ceiling_light_state")),
-                "intercom": plc.getMem(Addresses.control("intercom_state")),
-                "reading_lights": plc.getMem(Addresses.control("reading_lights")),
-                "door_light": plc.getMem(Addresses.control("door_light")),
-                "shutdown_status": plc.getMem(Addresses.control("shutdown_status"))
-            }
-        )
+        return await cached_response("control", STATUS_CACHE_TTL, read_status, request)
     except Exception as e:
-        logger.error(f"Failed to get control status: {e}")
+        logger.error("Failed to get control status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === PRESSURE CONTROL ROUTES ===
@@ -456,13 +500,13 @@ async def get_control_status(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Pressure Control"],
     summary="Increase Pressure Setpoint",
-    description="Increase the pressure setpoint by 10 units with safety limits enforced by PLC.",
+    description=DESC["add_pressure"],
     responses={
         200: {"description": "Pressure setpoint increased successfully"},
         500: {"description": "Failed to increase pressure setpoint"}
     }
 )
-async def add_pressure(plc = Depends(get_plc)):
+def add_pressure(plc = Depends(get_plc_async)):
     """Add 10 to pressure setpoint"""
     try:
         with ContextLogger(logger, operation="PRESSURE_ADD"):
@@ -471,7 +515,7 @@ async def add_pressure(plc = Depends(get_plc)):
             logger.info("Pressure add button pressed")
             return PLCResponse(success=True, message="Pressure increased")
     except Exception as e:
-        logger.error(f"Failed to add pressure: {e}")
+        logger.error("Failed to add pressure: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -479,13 +523,13 @@ async def add_pressure(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Pressure Control"],
     summary="Decrease Pressure Setpoint",
-    description="Decrease the pressure setpoint by 10 units for controlled pressure reduction.",
+    description=DESC["subtract_pressure"],
     responses={
         200: {"description": "Pressure setpoint decreased successfully"},
         500: {"description": "Failed to decrease pressure setpoint"}
     }
 )
-async def subtract_pressure(plc = Depends(get_plc)):
+def subtract_pressure(plc = Depends(get_plc_async)):
     """Subtract 10 from pressure setpoint"""
     try:
         with ContextLogger(logger, operation="PRESSURE_SUBTRACT"):
@@ -494,7 +538,7 @@ async def subtract_pressure(plc = Depends(get_plc)):
             logger.info("Pressure minus button pressed")
             return PLCResponse(success=True, message="Pressure decreased")
     except Exception as e:
-        logger.error(f"Failed to subtract pressure: {e}")
+        logger.error("Failed to subtract pressure: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -502,75 +546,87 @@ async def subtract_pressure(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Pressure Control"],
     summary="Set Pressure Setpoint Directly",
-    description="Set pressure setpoint to a specific value. ⚠️ Use with caution - ensure target is within safe operating ranges (1.3-3.0 ATA).",
+    description=DESC["set_pressure_setpoint"],
     responses={
         200: {"description": "Pressure setpoint updated successfully"},
         400: {"description": "Invalid pressure value"},
         500: {"description": "Failed to set pressure setpoint"}
     }
 )
-async def set_pressure_setpoint(request: PressureRequest, plc = Depends(get_plc)):
+def set_pressure_setpoint(request: PressureRequest, plc = Depends(get_plc_async)):
     """Set pressure setpoint directly"""
     try:
         with ContextLogger(logger, operation="PRESSURE_SETPOINT", value=request.setpoint):
             address = Addresses.pressure("pressure_setpoint")
             plc.writeMem(address, request.setpoint)
-            logger.info(f"Pressure setpoint set to {request.setpoint}")
+            logger.info("Pressure setpoint set to %s", request.setpoint)
             return PLCResponse(success=True, data={"setpoint": request.setpoint}, message="Pressure setpoint updated")
     except Exception as e:
-        logger.error(f"Failed to set pressure setpoint: {e}")
+        logger.error("Failed to set pressure setpoint: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+PRESSURE_READING_FIELDS = {
+    "setpoint": ("pressure_control", "pressure_setpoint"),
+    "internal_pressure_1": ("pressure_control", "internal_pressure_1"),
+    "internal_pressure_2": ("pressure_control", "internal_pressure_2")
+}
+
 @router.get(
     "/api/pressure/current", 
     response_model=PLCResponse,
+    deprecated=STATUS_POLLING_DEPRECATED,
     tags=["Pressure Control"],
     summary="Get Current Pressure Readings",
-    description="Retrieve real-time pressure readings from all sensors including setpoint and dual internal pressure sensors.",
+    description=DESC["get_pressure_readings"],
     responses={
         200: {"description": "Pressure readings retrieved successfully", "content": {"application/json": {"example": {"success": True, "data": {"setpoint": 2.0, "internal_pressure_1": 1.95, "internal_pressure_2": 1.97}}}}},
         500: {"description": "Failed to retrieve pressure readings"}
     }
 )
-async def get_pressure_readings(plc = Depends(get_plc)):
+async def get_pressure_readings(request: Request, plc = Depends(get_plc_async)):
     """Get current pressure readings"""
+    async def read_status():
+        return PLCResponse(success=True, data=await read_fields(PRESSURE_READING_FIELDS))
+
     try:
-        return PLCResponse(
-            success=True,
-            data={
-                "setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2"))
-            }
-        )
+        return await cached_response("pressure", READINGS_CACHE_TTL, read_status, request)
     except Exception as e:
-        logger.error(f"Failed to get pressure readings: {e}")
+        logger.error("Failed to get pressure readings: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === SESSION CONTROL ROUTES ===
+# Readings recorded with a new session, in unpacking order
+SESSION_START_READINGS = [
+    ("pressure_control", "pressure_setpoint"),
+    ("temperature_control", "temperature_setpoint"),
+    ("pressure_control", "internal_pressure_1"),
+    ("pressure_control", "internal_pressure_2"),
+    ("sensors", "current_temperature"),
+    ("sensors", "ambient_o2")
+]
+
 @router.post(
     "/api/session/start", 
     response_model=PLCResponse,
     tags=["Session Management"],
     summary="Start Treatment Session",
-    description="Start hyperbaric treatment session with pressurization, safety checks, and database logging. ⚠️ Ensure all safety requirements met.",
+    description=DESC["start_session"],
     responses={
         200: {"description": "Treatment session started successfully"},
         500: {"description": "Failed to start treatment session"}
     }
 )
-async def start_session(plc = Depends(get_plc)):
+async def start_session(plc = Depends(get_plc_async)):
     """Start session and pressurize"""
     try:
         with ContextLogger(logger, operation="SESSION_START"):
             # Get current system readings for session record
             try:
-                pressure_setpoint = plc.getMem(Addresses.pressure("pressure_setpoint"))
-                temp_setpoint = plc.getMem(Addresses.temperature("temperature_setpoint"))
-                current_pressure_1 = plc.getMem(Addresses.pressure("internal_pressure_1"))
-                current_pressure_2 = plc.getMem(Addresses.pressure("internal_pressure_2"))
-                current_temp = plc.getMem(Addresses.sensors("current_temperature"))
-                current_o2 = plc.getMem(Addresses.sensors("ambient_o2"))
+                # One multi-variable read instead of six round-trips
+                (pressure_setpoint, temp_setpoint, current_pressure_1,
+                 current_pressure_2, current_temp, current_o2) = await asyncio.to_thread(
+                    plc.getMemBatch, get_plc_config().get_addresses(SESSION_START_READINGS)
+                )
                 
                 # Get current mode settings (these might be None if not set)
                 # We'll determine them from PLC state or use defaults
@@ -579,58 +635,63 @@ async def start_session(plc = Depends(get_plc)):
                 oxygen_mode = "continuous"       # Default, could be enhanced to read from PLC
                 
             except Exception as e:
-                logger.warning(f"Failed to read some initial parameters: {e}")
+                logger.warning("Failed to read some initial parameters: %s", e)
                 pressure_setpoint = None
                 temp_setpoint = None
+                current_pressure_1 = None
+                current_pressure_2 = None
+                current_temp = None
+                current_o2 = None
                 treatment_mode = None
                 compression_mode = None
                 oxygen_mode = None
             
-            # Create database session record
-            try:
-                session_id = session_service.create_session(
-                    treatment_mode=treatment_mode,
-                    compression_mode=compression_mode,
-                    oxygen_mode=oxygen_mode,
-                    target_pressure_ata=pressure_setpoint,
-                    target_temperature_c=temp_setpoint,
-                    operator_notes="Session started via API"
-                )
-                
-                # Log initial system parameters
-                initial_params = {
-                    "pressure_setpoint_ata": pressure_setpoint,
-                    "temperature_setpoint_c": temp_setpoint,
-                    "initial_pressure_1_ata": current_pressure_1,
-                    "initial_pressure_2_ata": current_pressure_2,
-                    "initial_temperature_c": current_temp,
-                    "initial_oxygen_percent": current_o2,
-                    "plc_start_command": True
-                }
-                session_service.log_session_parameters(session_id, initial_params)
-                
-                logger.info(f"Created database session record {session_id}")
-                
-            except Exception as e:
-                logger.error(f"Failed to create database session: {e}")
-                # Continue with PLC operation even if database fails
-                session_id = None
+            initial_params = {
+                "pressure_setpoint_ata": pressure_setpoint,
+                "temperature_setpoint_c": temp_setpoint,
+                "initial_pressure_1_ata": current_pressure_1,
+                "initial_pressure_2_ata": current_pressure_2,
+                "initial_temperature_c": current_temp,
+                "initial_oxygen_percent": current_o2,
+                "plc_start_command": True
+            }
+            start_event = {
+                "event_type": "operator_action",
+                "event_category": "session",
+                "event_name": "plc_start_command",
+                "event_description": "Session start command sent to PLC",
+                "severity": "info",
+                "event_data": {"pressure_setpoint": pressure_setpoint, "temperature_setpoint": temp_setpoint}
+            }
             
-            # Send start command to PLC
+            def create_db_session():
+                """Create database session record with its initial logs, None if the database fails"""
+                try:
+                    return session_service.create_session_with_initial_logs(
+                        treatment_mode=treatment_mode,
+                        compression_mode=compression_mode,
+                        oxygen_mode=oxygen_mode,
+                        target_pressure_ata=pressure_setpoint,
+                        target_temperature_c=temp_setpoint,
+                        operator_notes="Session started via API",
+                        parameters=initial_params,
+                        events=[start_event]
+                    )
+                except Exception as e:
+                    logger.error("Failed to create database session: %s", e)
+                    # Continue with PLC operation even if database fails
+                    return None
+            
+            # The database record and the PLC start command are independent,
+            # so send the start command while the record is being written
             address = Addresses.session("start_session")
-            plc.writeMem(address, True)
+            session_id, _ = await asyncio.gather(
+                asyncio.to_thread(create_db_session),
+                asyncio.to_thread(plc.writeMem, address, True)
+            )
             
-            # Log session start event in database
             if session_id:
-                session_service.log_session_event(
-                    session_id,
-                    event_type="operator_action",
-                    event_category="session",
-                    event_name="plc_start_command",
-                    event_description="Session start command sent to PLC",
-                    severity="info",
-                    event_data={"pressure_setpoint": pressure_setpoint, "temperature_setpoint": temp_setpoint}
-                )
+                logger.info("Created database session record %s", session_id)
             
             logger.info("Session start requested")
             
@@ -642,7 +703,7 @@ async def start_session(plc = Depends(get_plc)):
             return PLCResponse(success=True, data=response_data, message="Session started")
             
     except Exception as e:
-        logger.error(f"Failed to start session: {e}")
+        logger.error("Failed to start session: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -650,26 +711,30 @@ async def start_session(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Session Management"],
     summary="End Treatment Session",
-    description="End treatment session with controlled depressurization and database finalization. ⚠️ Do not interrupt depressurization once started.",
+    description=DESC["end_session"],
     responses={
         200: {"description": "Treatment session ended successfully"},
         500: {"description": "Failed to end treatment session"}
     }
 )
-async def end_session(plc = Depends(get_plc)):
+async def end_session(plc = Depends(get_plc_async)):
     """End treatment session with controlled depressurization"""
     try:
         with ContextLogger(logger, operation="SESSION_END"):
-            # Write to PLC to end session
-            address = Addresses.session("end_session")
-            plc.writeMem(address, True)
+            def end_db_session():
+                """Try to end current session in database"""
+                try:
+                    if session_service.end_session(completion_reason="manual_end"):
+                        logger.info("Session ended in database")
+                except Exception as db_error:
+                    logger.warning("Database session end failed: %s", db_error)
             
-            # Try to end current session in database
-            try:
-                session_service.end_current_session("manual_end")
-                logger.info("Session ended in database")
-            except Exception as db_error:
-                logger.warning(f"Database session end failed: {db_error}")
+            # Write to PLC to end session while the database record is closed
+            address = Addresses.session("end_session")
+            await asyncio.gather(
+                asyncio.to_thread(plc.writeMem, address, True),
+                asyncio.to_thread(end_db_session)
+            )
             
             logger.info("Session end command sent to PLC")
             return PLCResponse(
@@ -677,7 +742,7 @@ async def end_session(plc = Depends(get_plc)):
                 message="Session end initiated - depressurization will begin"
             )
     except Exception as e:
-        logger.error(f"Failed to end session: {e}")
+        logger.error("Failed to end session: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -685,23 +750,18 @@ async def end_session(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Session Management"],
     summary="Toggle Session Equalise State",
-    description="Toggle the equalise/pause state during treatment session. Use to pause treatment for patient comfort or safety assessments.",
+    description=DESC["toggle_equalise"],
     responses={
         200: {"description": "Session equalise state toggled successfully"},
         500: {"description": "Failed to toggle equalise state"}
     }
 )
-async def toggle_equalise(plc = Depends(get_plc)):
+def toggle_equalise(plc = Depends(get_plc_async)):
     """Toggle session equalise/pause state"""
     try:
         with ContextLogger(logger, operation="SESSION_EQUALISE"):
-            # Read current equalise state
-            equalise_address = Addresses.session("equalise_state")
-            current_state = plc.getMem(equalise_address)
-            
-            # Toggle the equalise state
-            new_state = not current_state
-            plc.writeMem(equalise_address, new_state)
+            # Flip the equalise state in one locked read-modify-write
+            new_state = plc.toggleBit(Addresses.session("equalise_state"))
             
             # Log the event in database if possible
             try:
@@ -717,20 +777,20 @@ async def toggle_equalise(plc = Depends(get_plc)):
                         event_description=f"Session equalise state changed to: {new_state}",
                         event_data={"equalise_state": new_state}
                     )
-                    logger.info(f"Session equalise event logged: {action}")
+                    logger.info("Session equalise event logged: %s", action)
                 else:
                     logger.info("No active session to log equalise event")
             except Exception as db_error:
-                logger.warning(f"Database event logging failed: {db_error}")
+                logger.warning("Database event logging failed: %s", db_error)
             
-            logger.info(f"Session equalise toggled to: {new_state}")
+            logger.info("Session equalise toggled to: %s", new_state)
             return PLCResponse(
                 success=True,
                 data={"equalise_state": new_state},
                 message=f"Session {'equalised' if new_state else 'resumed'}"
             )
     except Exception as e:
-        logger.error(f"Failed to toggle equalise state: {e}")
+        logger.error("Failed to toggle equalise state: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -738,71 +798,73 @@ async def toggle_equalise(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Session Management"],
     summary="Confirm Depressurization",
-    description="Confirm and acknowledge the depressurization process for operator verification and safety compliance.",
+    description=DESC["confirm_depressurization"],
     responses={
         200: {"description": "Depressurization confirmed successfully"},
         500: {"description": "Failed to confirm depressurization"}
     }
 )
-async def confirm_depressurization(plc = Depends(get_plc)):
+def confirm_depressurization(plc = Depends(get_plc_async)):
     """Confirm depressurization"""
     try:
-        with ContextLogger(logger, operation="DEPRESSURIZE_CONFIRM"):
-            address = Addresses.session("depressurisation_confirm")
-            plc.writeMem(address, True)
-            logger.info("Depressurization confirmed")
-            return PLCResponse(success=True, message="Depressurization confirmed")
+        plc.writeMem(Addresses.session("depressurisation_confirm"), True)
     except Exception as e:
-        logger.error(f"Failed to confirm depressurization: {e}")
+        logger.error("Failed to confirm depressurization: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    
+    logger.info("Depressurization confirmed", extra={"operation": "DEPRESSURIZE_CONFIRM"})
+    return PLCResponse(success=True, message="Depressurization confirmed")
 
 # === MODE CONTROL ROUTES ===
+# Mutually exclusive mode flags: request values, their index and the
+# (category, function) of each flag in the same order
+OPERATING_MODES = ("rest", "health", "professional", "custom", "o2_100", "o2_120")
+OPERATING_MODE_INDEX = {mode: index for index, mode in enumerate(OPERATING_MODES)}
+OPERATING_MODE_FLAGS = tuple(("operating_modes", f"mode_{mode}") for mode in OPERATING_MODES)
+
+COMPRESSION_MODES = get_args(CompressionMode)
+COMPRESSION_MODE_INDEX = {mode: index for index, mode in enumerate(COMPRESSION_MODES)}
+COMPRESSION_MODE_FLAGS = tuple(("operating_modes", f"compression_{mode}") for mode in COMPRESSION_MODES)
+
+def select_flag(flags: Tuple[Tuple[str, str], ...], selected: int) -> Dict[str, bool]:
+    """Map each flag address to True for the selected index and False otherwise"""
+    addresses = get_plc_config().get_addresses(flags)
+    return {address: index == selected for index, address in enumerate(addresses)}
+
 @router.post(
     "/api/modes/set", 
     response_model=PLCResponse,
     tags=["Treatment Modes"],
     summary="Set Operating Mode",
-    description="Set treatment operating mode (rest, health, professional, custom, o2_100, o2_120) with optional duration override.",
+    description=DESC["set_operating_mode"],
     responses={
         200: {"description": "Operating mode set successfully"},
         400: {"description": "Invalid mode specified"},
         500: {"description": "Failed to set operating mode"}
     }
 )
-async def set_operating_mode(request: ModeRequest, plc = Depends(get_plc)):
+def set_operating_mode(request: ModeRequest, plc = Depends(get_plc_async)):
     """Set operating mode"""
     try:
         with ContextLogger(logger, operation="MODE_SET", mode=request.mode):
-            mode_mappings = {
-                "rest": "mode_rest",
-                "health": "mode_health", 
-                "professional": "mode_professional",
-                "custom": "mode_custom",
-                "o2_100": "mode_o2_100",
-                "o2_120": "mode_o2_120"
-            }
-            
-            if request.mode not in mode_mappings:
+            selected = OPERATING_MODE_INDEX.get(request.mode)
+            if selected is None:
                 raise HTTPException(status_code=400, detail="Invalid mode")
             
-            # Reset all modes first
-            for mode_function in mode_mappings.values():
-                address = Addresses.modes(mode_function)
-                plc.writeMem(address, False)
-            
-            # Set the requested mode
-            selected_address = Addresses.modes(mode_mappings[request.mode])
-            plc.writeMem(selected_address, True)
-            
-            # Set duration if provided
-            if request.duration:
-                duration_address = Addresses.modes("set_duration")
-                plc.writeMem(duration_address, request.duration)
+            # Mode flags and duration go to the PLC together in one write request
+            with plc.pipeline() as batch:
+                # Clear the other modes and set the requested one
+                for address, value in select_flag(OPERATING_MODE_FLAGS, selected).items():
+                    batch.writeMem(address, value)
+                
+                # Set duration if provided
+                if request.duration:
+                    batch.writeMem(Addresses.modes("set_duration"), request.duration)
             
-            logger.info(f"Operating mode set to {request.mode}")
+            logger.info("Operating mode set to %s", request.mode)
             return PLCResponse(success=True, data={"mode": request.mode, "duration": request.duration}, message="Mode updated")
     except Exception as e:
-        logger.error(f"Failed to set operating mode: {e}")
+        logger.error("Failed to set operating mode: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -810,39 +872,22 @@ async def set_operating_mode(request: ModeRequest, plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Treatment Modes"],
     summary="Set Compression Mode",
-    description="Set compression mode for pressurization rate: beginner (slow), normal (standard), or fast (rapid).",
+    description=DESC["set_compression_mode"],
     responses={
         200: {"description": "Compression mode set successfully"},
-        400: {"description": "Invalid compression mode"},
         500: {"description": "Failed to set compression mode"}
     }
 )
-async def set_compression_mode(mode: str, plc = Depends(get_plc)):
+def set_compression_mode(mode: CompressionMode, plc = Depends(get_plc_async)):
     """Set compression mode"""
     try:
-        with ContextLogger(logger, operation="COMPRESSION_MODE", mode=mode):
-            compression_mappings = {
-                "beginner": "compression_beginner",
-                "normal": "compression_normal",
-                "fast": "compression_fast"
-            }
-            
-            if mode not in compression_mappings:
-                raise HTTPException(status_code=400, detail="Invalid compression mode")
-            
-            # Reset all compression modes first
-            for mode_function in compression_mappings.values():
-                address = Addresses.modes(mode_function)
-                plc.writeMem(address, False)
-            
-            # Set the requested mode
-            selected_address = Addresses.modes(compression_mappings[mode])
-            plc.writeMem(selected_address, True)
-            
-            logger.info(f"Compression mode set to {mode}")
-            return PLCResponse(success=True, data={"compression_mode": mode}, message="Compression mode updated")
+        # Clear the other compression modes and set the requested one in a single write
+        plc.writeBits(select_flag(COMPRESSION_MODE_FLAGS, COMPRESSION_MODE_INDEX[mode]))
+        
+        logger.info("Compression mode set to %s", mode, extra={"operation": "COMPRESSION_MODE", "mode": mode})
+        return PLCResponse(success=True, data={"compression_mode": mode}, message="Compression mode updated")
     except Exception as e:
-        logger.error(f"Failed to set compression mode: {e}")
+        logger.error("Failed to set compression mode: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -850,76 +895,57 @@ async def set_compression_mode(mode: str, plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Treatment Modes"],
     summary="Set Oxygen Delivery Mode",
-    description="Set oxygen delivery mode: continuous (constant delivery) or intermittent (alternating cycles with air breaks).",
+    description=DESC["set_oxygen_mode"],
     responses={
         200: {"description": "Oxygen delivery mode set successfully"},
-        400: {"description": "Invalid oxygen mode"},
         500: {"description": "Failed to set oxygen mode"}
     }
 )
-async def set_oxygen_mode(mode: str, plc = Depends(get_plc)):
+def set_oxygen_mode(mode: OxygenMode, plc = Depends(get_plc_async)):
     """Set oxygen delivery mode"""
     try:
-        with ContextLogger(logger, operation="OXYGEN_MODE", mode=mode):
-            if mode == "continuous":
-                plc.writeMem(Addresses.modes("continuous_o2_flag"), True)
-                plc.writeMem(Addresses.modes("intermittent_o2_flag"), False)
-                plc.writeMem(Addresses.modes("continuous_o2_selection"), True)
-                plc.writeMem(Addresses.modes("intermittent_o2_selection"), False)
-            elif mode == "intermittent":
-                plc.writeMem(Addresses.modes("intermittent_o2_flag"), True)
-                plc.writeMem(Addresses.modes("continuous_o2_flag"), False)
-                plc.writeMem(Addresses.modes("intermittent_o2_selection"), True)
-                plc.writeMem(Addresses.modes("continuous_o2_selection"), False)
-            else:
-                raise HTTPException(status_code=400, detail="Invalid oxygen mode")
-            
-            logger.info(f"Oxygen mode set to {mode}")
-            return PLCResponse(success=True, data={"oxygen_mode": mode}, message="Oxygen mode updated")
+        # The flags sit in three different bytes; writeBits still sends them in one request
+        continuous = mode == "continuous"
+        plc.writeBits({
+            Addresses.modes("continuous_o2_flag"): continuous,
+            Addresses.modes("intermittent_o2_flag"): not continuous,
+            Addresses.modes("continuous_o2_selection"): continuous,
+            Addresses.modes("intermittent_o2_selection"): not continuous
+        })
+        
+        logger.info("Oxygen mode set to %s", mode, extra={"operation": "OXYGEN_MODE", "mode": mode})
+        return PLCResponse(success=True, data={"oxygen_mode": mode}, message="Oxygen mode updated")
     except Exception as e:
-        logger.error(f"Failed to set oxygen mode: {e}")
+        logger.error("Failed to set oxygen mode: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === TEMPERATURE/AC CONTROL ROUTES ===
+# AC fan speed flags, see OPERATING_MODES
+AC_MODES = get_args(ACMode)
+AC_MODE_INDEX = {mode: index for index, mode in enumerate(AC_MODES)}
+AC_MODE_FLAGS = tuple(("temperature_control", f"ac_{mode}") for mode in AC_MODES)
+
 @router.post(
     "/api/ac/mode", 
     response_model=PLCResponse,
     tags=["Climate Control"],
     summary="Set Air Conditioning Mode",
-    description="Configure AC fan mode: auto (temperature-based), low, mid, or high speed for optimal climate control.",
+    description=DESC["set_ac_mode"],
     responses={
         200: {"description": "AC mode set successfully"},
-        400: {"description": "Invalid AC mode specified"},
         500: {"description": "Failed to set AC mode"}
     }
 )
-async def set_ac_mode(mode: str, plc = Depends(get_plc)):
+def set_ac_mode(mode: ACMode, plc = Depends(get_plc_async)):
     """Set AC fan mode"""
     try:
-        with ContextLogger(logger, operation="AC_MODE", mode=mode):
-            mode_mappings = {
-                "auto": "ac_auto",
-                "low": "ac_low",
-                "mid": "ac_mid",
-                "high": "ac_high"
-            }
-            
-            if mode not in mode_mappings:
-                raise HTTPException(status_code=400, detail="Invalid AC mode")
-            
-            # Reset all AC modes first
-            for mode_function in mode_mappings.values():
-                address = Addresses.temperature(mode_function)
-                plc.writeMem(address, False)
-            
-            # Set the requested mode
-            selected_address = Addresses.temperature(mode_mappings[mode])
-            plc.writeMem(selected_address, True)
-            
-            logger.info(f"AC mode set to {mode}")
-            return PLCResponse(success=True, data={"ac_mode": mode}, message="AC mode updated")
+        # Clear the other AC modes and set the requested one in a single write
+        plc.writeBits(select_flag(AC_MODE_FLAGS, AC_MODE_INDEX[mode]))
+        
+        logger.info("AC mode set to %s", mode, extra={"operation": "AC_MODE", "mode": mode})
+        return PLCResponse(success=True, data={"ac_mode": mode}, message="AC mode updated")
     except Exception as e:
-        logger.error(f"Failed to set AC mode: {e}")
+        logger.error("Failed to set AC mode: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -927,79 +953,79 @@ async def set_ac_mode(mode: str, plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Climate Control"],
     summary="Set Temperature Setpoint",
-    description="Set target temperature for chamber climate control. Range: 18°C-28°C with ±0.5°C accuracy.",
+    description=DESC["set_temperature_setpoint"],
     responses={
         200: {"description": "Temperature setpoint updated successfully"},
         400: {"description": "Temperature value out of range"},
         500: {"description": "Failed to set temperature setpoint"}
     }
 )
-async def set_temperature_setpoint(request: TemperatureRequest, plc = Depends(get_plc)):
+def set_temperature_setpoint(request: TemperatureRequest, plc = Depends(get_plc_async)):
     """Set temperature setpoint"""
     try:
-        with ContextLogger(logger, operation="TEMP_SETPOINT", value=request.setpoint):
-            address = Addresses.temperature("temperature_setpoint")
-            plc.writeMem(address, request.setpoint)
-            logger.info(f"Temperature setpoint set to {request.setpoint}")
-            return PLCResponse(success=True, data={"temperature_setpoint": request.setpoint}, message="Temperature setpoint updated")
+        plc.writeMem(Addresses.temperature("temperature_setpoint"), request.setpoint)
     except Exception as e:
-        logger.error(f"Failed to set temperature setpoint: {e}")
+        logger.error("Failed to set temperature setpoint: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    
+    logger.info("Temperature setpoint set to %s", request.setpoint, extra={"operation": "TEMP_SETPOINT", "value": request.setpoint})
+    return PLCResponse(success=True, data={"temperature_setpoint": request.setpoint}, message="Temperature setpoint updated")
 
 @router.post(
     "/api/ac/heating-cooling/toggle", 
     response_model=PLCResponse,
     tags=["Climate Control"],
     summary="Toggle Heating/Cooling Mode",
-    description="Toggle between heating and cooling modes for the HVAC system to reach target temperature.",
+    description=DESC["toggle_heating_cooling"],
     responses={
         200: {"description": "HVAC mode toggled successfully"},
         500: {"description": "Failed to toggle heating/cooling mode"}
     }
 )
-async def toggle_heating_cooling(plc = Depends(get_plc)):
+def toggle_heating_cooling(plc = Depends(get_plc_async)):
     """Toggle between heating and cooling"""
     try:
-        with ContextLogger(logger, operation="HEATING_COOLING_TOGGLE"):
-            address = Addresses.temperature("heating_cooling_toggle")
-            current_state = plc.getMem(address)
-            plc.writeMem(address, not current_state)
-            mode = "cooling" if not current_state else "heating"
-            logger.info(f"HVAC mode toggled to {mode}")
-            return PLCResponse(success=True, data={"hvac_mode": mode}, message="HVAC mode toggled")
+        # Flip the flag in one locked read-modify-write so concurrent toggles cannot interleave
+        new_state = plc.toggleBit(Addresses.temperature("heating_cooling_toggle"))
+        mode = "cooling" if new_state else "heating"
+        logger.info("HVAC mode toggled to %s", mode, extra={"operation": "HEATING_COOLING_TOGGLE"})
+        return PLCResponse(success=True, data={"hvac_mode": mode}, message="HVAC mode toggled")
     except Exception as e:
-        logger.error(f"Failed to toggle heating/cooling: {e}")
+        logger.error("Failed to toggle heating/cooling: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === SENSOR READINGS ===
+SENSOR_READING_FIELDS = {
+    "current_temp": ("sensors", "current_temperature"),
+    "current_humidity": ("sensors", "current_humidity"),
+    "ambient_o2": ("sensors", "ambient_o2"),
+    "ambient_o2_2": ("sensors", "ambient_o2_2"),
+    "internal_pressure_1": ("pressure_control", "internal_pressure_1"),
+    "internal_pressure_2": ("pressure_control", "internal_pressure_2"),
+    "ambient_o2_check_flag": ("sensors", "ambient_o2_check_flag")
+}
+
 @router.get(
     "/api/sensors/readings", 
     response_model=PLCResponse,
+    deprecated=STATUS_POLLING_DEPRECATED,
     tags=["Sensors & Monitoring"],
     summary="Get All Sensor Readings",
-    description="Retrieve real-time readings from all environmental and safety sensors (temperature, humidity, oxygen, pressure).",
+    description=DESC["get_sensor_readings"],
     responses={
         200: {"description": "Sensor readings retrieved successfully"},
         500: {"description": "Failed to retrieve sensor readings"}
     }
 )
-async def get_sensor_readings(plc = Depends(get_plc)):
+async def get_sensor_readings(request: Request, plc = Depends(get_plc_async)):
     """Get all sensor readings"""
+    async def read_status():
+        return PLCResponse(success=True, data=await read_fields(SENSOR_READING_FIELDS))
+
     try:
-        return PLCResponse(
-            success=True,
-            data={
-                "current_temp": plc.getMem(Addresses.sensors("current_temperature")),
-                "current_humidity": plc.getMem(Addresses.sensors("current_humidity")),
-                "ambient_o2": plc.getMem(Addresses.sensors("ambient_o2")),
-                "ambient_o2_2": plc.getMem(Addresses.sensors("ambient_o2_2")),
-                "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2")),
-                "ambient_o2_check_flag": plc.getMem(Addresses.sensors("ambient_o2_check_flag"))
-            }
-        )
+        return await cached_response("sensors", READINGS_CACHE_TTL, read_status, request)
     except Exception as e:
-        logger.error(f"Failed to get sensor readings: {e}")
+        logger.error("Failed to get sensor readings: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === CALIBRATION ROUTES ===
@@ -1008,22 +1034,22 @@ async def get_sensor_readings(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Calibration & Maintenance"],
     summary="Calibrate Pressure Sensors",
-    description="Initiate pressure sensor calibration procedure. ⚠️ Requires atmospheric pressure, no active sessions, and qualified technician.",
+    description=DESC["calibrate_pressure_sensor"],
     responses={
         200: {"description": "Pressure sensor calibration initiated"},
         500: {"description": "Failed to start pressure sensor calibration"}
     }
 )
-async def calibrate_pressure_sensor(plc = Depends(get_plc)):
+async def calibrate_pressure_sensor(plc = Depends(get_plc_async)):
     """Calibrate pressure sensor"""
     try:
         with ContextLogger(logger, operation="PRESSURE_CALIBRATION"):
-            address = Addresses.calibration("pressure_sensor_calibration")
-            plc.writeMem(address, True)
-            logger.info("Pressure sensor calibration initiated")
-            return PLCResponse(success=True, message="Pressure sensor calibration started")
+            # Calibration is a one-shot pulse; the command queue sends it in the background
+            command_queue.submit(Addresses.calibration("pressure_sensor_calibration"), True)
+            logger.info("Pressure sensor calibration requested")
+            return PLCResponse(success=True, message="Pressure sensor calibration requested")
     except Exception as e:
-        logger.error(f"Failed to calibrate pressure sensor: {e}")
+        logger.error("Failed to calibrate pressure sensor: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post(
@@ -1031,22 +1057,21 @@ async def calibrate_pressure_sensor(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Calibration & Maintenance"],
     summary="Calibrate Oxygen Sensors",
-    description="Initiate oxygen sensor calibration using air and pure oxygen references. ⚠️ Use certified gases only with proper ventilation.",
+    description=DESC["calibrate_oxygen_sensor"],
     responses={
         200: {"description": "Oxygen sensor calibration initiated"},
         500: {"description": "Failed to start oxygen sensor calibration"}
     }
 )
-async def calibrate_oxygen_sensor(plc = Depends(get_plc)):
+async def calibrate_oxygen_sensor(plc = Depends(get_plc_async)):
     """Calibrate oxygen sensor"""
     try:
         with ContextLogger(logger, operation="OXYGEN_CALIBRATION"):
-            address = Addresses.calibration("oxygen_sensor_calibration")
-            plc.writeMem(address, True)
-            logger.info("Oxygen sensor calibration initiated")
-            return PLCResponse(success=True, message="Oxygen sensor calibration started")
+            command_queue.submit(Addresses.calibration("oxygen_sensor_calibration"), True)
+            logger.info("Oxygen sensor calibration requested")
+            return PLCResponse(success=True, message="Oxygen sensor calibration requested")
     except Exception as e:
-        logger.error(f"Failed to calibrate oxygen sensor: {e}")
+        logger.error("Failed to calibrate oxygen sensor: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === MANUAL CONTROL ROUTES ===
@@ -1055,107 +1080,193 @@ async def calibrate_oxygen_sensor(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["Manual Control & Override"],
     summary="Toggle Manual Mode",
-    description="⚠️ WARNING: Enable/disable manual control mode bypassing automatic safety systems. Use only with qualified supervision.",
+    description=DESC["toggle_manual_mode"],
     responses={
         200: {"description": "Manual mode toggled successfully"},
         500: {"description": "Failed to toggle manual mode"}
     }
 )
-async def toggle_manual_mode(plc = Depends(get_plc)):
+def toggle_manual_mode(plc = Depends(get_plc_async)):
     """Toggle manual mode on/off"""
     try:
         with ContextLogger(logger, operation="MANUAL_MODE_TOGGLE"):
-            address = Addresses.manual("manual_mode")
-            current_state = plc.getMem(address)
-            plc.writeMem(address, not current_state)
-            logger.info(f"Manual mode toggled to {'ON' if not current_state else 'OFF'}")
-            return PLCResponse(success=True, data={"manual_mode": not current_state}, message="Manual mode toggled")
+            # One locked read-modify-write, so concurrent toggles cannot interleave
+            manual_mode = plc.toggleBit(Addresses.manual("manual_mode"))
+            logger.info("Manual mode toggled to %s", 'ON' if manual_mode else 'OFF')
+            return PLCResponse(success=True, data={"manual_mode": manual_mode}, message="Manual mode toggled")
     except Exception as e:
-        logger.error(f"Failed to toggle manual mode: {e}")
+        logger.error("Failed to toggle manual mode: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+# Request control -> manual_controls function
+MANUAL_CONTROLS = {
+    "release_solenoid": "release_solenoid_manual",
+    "air_pump1": "air_pump1_manual",
+    "air_pump2": "air_pump2_manual",
+    "oxygen_supply1": "oxygen_supply1_manual",
+    "oxygen_supply2": "oxygen_supply2_manual",
+    "release_solenoid_set": "release_solenoid_set"
+}
+
 @router.post(
     "/api/manual/controls", 
     response_model=PLCResponse,
     tags=["Manual Control & Override"],
     summary="Set Manual Control Values",
-    description="⚠️ CRITICAL: Set individual component controls in manual mode. Bypasses safety systems - qualified personnel only.",
+    description=DESC["set_manual_control"],
     responses={
         200: {"description": "Manual control values updated successfully"},
-        400: {"description": "Invalid control parameter or value"},
         500: {"description": "Failed to set manual control values"}
     }
 )
-async def set_manual_control(request: ManualControlRequest, plc = Depends(get_plc)):
+def set_manual_control(request: ManualControlRequest, plc = Depends(get_plc_async)):
     """Set manual controls"""
     try:
         with ContextLogger(logger, operation="MANUAL_CONTROL", control=request.control, value=request.value):
-            control_mappings = {
-                "release_solenoid": "release_solenoid_manual",
-                "air_pump1": "air_pump1_manual",
-                "air_pump2": "air_pump2_manual",
-                "oxygen_supply1": "oxygen_supply1_manual",
-                "oxygen_supply2": "oxygen_supply2_manual",
-                "release_solenoid_set": "release_solenoid_set"
-            }
-            
-            if request.control not in control_mappings:
-                raise HTTPException(status_code=400, detail="Invalid manual control")
-            
-            address = Addresses.manual(control_mappings[request.control])
+            address = Addresses.manual(MANUAL_CONTROLS[request.control])
             plc.writeMem(address, request.value)
-            logger.info(f"Manual control {request.control} set to {request.value}")
+            logger.info("Manual control %s set to %s", request.control, request.value)
             return PLCResponse(success=True, data={request.control: request.value}, message="Manual control updated")
     except Exception as e:
-        logger.error(f"Failed to set manual control: {e}")
+        logger.error("Failed to set manual control: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === STATUS ROUTES ===
+SESSION_STATE_FIELDS = {
+    "running_state": ("session_control", "running_state"),
+    "pressuring_state": ("session_control", "pressuring_state"),
+    "stabilising_state": ("session_control", "stabilising_state"),
+    "depressurise_state": ("session_control", "depressurise_state"),
+    "equalise_state": ("session_control", "equalise_state")
+}
+
+SAFETY_FIELDS = {
+    "ambient_o2": ("sensors", "ambient_o2"),
+    "temperature": ("sensors", "current_temperature")
+}
+
+# Seconds the background reader keeps the system status warm after the last request
+SYSTEM_STATUS_IDLE_TIMEOUT = float(os.getenv("SYSTEM_STATUS_IDLE_TIMEOUT", "10"))
+
+# Monotonic time of the last /api/status/system request
+system_status_requested_at = float("-inf")
+
+async def read_system_status(plc) -> PLCResponse:
+    """Read the session, pressure and safety sections for /api/status/system"""
+    with ContextLogger(logger, operation="SYSTEM_STATUS"):
+        # Sections are requested together, so the loader fetches them in one batch
+        session_state, pressure, safety = await asyncio.gather(
+            read_fields(SESSION_STATE_FIELDS),
+            read_fields(PRESSURE_READING_FIELDS),
+            read_fields(SAFETY_FIELDS)
+        )
+        status_data = {
+            "session": session_state,
+            "pressure": pressure,
+            "safety": safety,
+            "system": {
+                "plc_connected": plc.plc.get_connected() if hasattr(plc.plc, 'get_connected') else True
+            }
+        }
+        
+        return PLCResponse(
+            success=True,
+            data=status_data,
+            message="System status retrieved"
+        )
+
+async def run_system_status_poller():
+    """
+    Background task keeping the cached system status fresh.
+    
+    Started from the application lifespan. While /api/status/system is being
+    polled, the snapshot is re-read every READINGS_CACHE_TTL seconds so
+    requests are answered from memory; a write clearing the cache wakes the
+    reader immediately. Idles when nobody asked recently or caching is off.
+    """
+    logger.info("System status poller started with %.3fs interval", READINGS_CACHE_TTL)
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    
+    while True:
+        idle = time.monotonic() - system_status_requested_at > SYSTEM_STATUS_IDLE_TIMEOUT
+        if idle or READINGS_CACHE_TTL <= 0:
+            await asyncio.sleep(1.0)
+            next_tick = loop.time()
+            continue
+        
+        try:
+            plc = await get_plc_async()
+            
+            async def read_status():
+                return render_status(await read_system_status(plc))
+            
+            # Entries outlive one interval, so a late tick does not force an on-demand read
+            await status_cache.refresh("system", READINGS_CACHE_TTL * 2, read_status)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("System status poll failed: %s", e)
+            await asyncio.sleep(2.0)
+            next_tick = loop.time()
+            continue
+        
+        # Stay on the interval grid; a read after an early wake-up keeps the next tick
+        now = loop.time()
+        if now >= next_tick:
+            next_tick = schedule_next_tick(next_tick, READINGS_CACHE_TTL, now)
+        await status_cache.wait_cleared(next_tick - loop.time())
+
 @router.get(
     "/api/status/system", 
     response_model=PLCResponse,
     tags=["System Status & Monitoring"],
     summary="Get Comprehensive System Status",
-    description="Retrieve comprehensive system status including session states, timers, and system health indicators for monitoring.",
+    description=DESC["get_system_status"],
     responses={
         200: {"description": "System status retrieved successfully"},
         500: {"description": "Failed to retrieve system status"}
     }
 )
-async def get_system_status(plc = Depends(get_plc)):
+async def get_system_status(request: Request, plc = Depends(get_plc_async)):
     """Get comprehensive system status for monitoring"""
+    global system_status_requested_at
+    system_status_requested_at = time.monotonic()
     try:
-        with ContextLogger(logger, operation="SYSTEM_STATUS"):
-            # Read core system status
-            status_data = {
-                "session": {
-                    "running_state": plc.getMem(Addresses.session("running_state")),
-                    "pressuring_state": plc.getMem(Addresses.session("pressuring_state")),
-                    "stabilising_state": plc.getMem(Addresses.session("stabilising_state")),
-                    "depressurise_state": plc.getMem(Addresses.session("depressurise_state")),
-                    "equalise_state": plc.getMem(Addresses.session("equalise_state"))
-                },
-                "pressure": {
-                    "setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                    "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                    "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2"))
-                },
-                "safety": {
-                    "ambient_o2": plc.getMem(Addresses.sensors("ambient_o2")),
-                    "temperature": plc.getMem(Addresses.sensors("current_temperature"))
-                },
-                "system": {
-                    "plc_connected": plc.plc.get_connected() if hasattr(plc.plc, 'get_connected') else True
-                }
-            }
-            
-            return PLCResponse(
-                success=True,
-                data=status_data,
-                message="System status retrieved"
-            )
+        return await cached_response("system", READINGS_CACHE_TTL, lambda: read_system_status(plc), request)
+    except Exception as e:
+        logger.error("Failed to get system status: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get(
+    "/api/status/snapshot", 
+    response_model=PLCResponse,
+    tags=["System Status & Monitoring"],
+    summary="Get Dashboard Snapshot",
+    description=DESC["get_status_snapshot"],
+    responses={
+        200: {"description": "Snapshot retrieved successfully"},
+        500: {"description": "Failed to retrieve snapshot"}
+    }
+)
+async def get_status_snapshot(request: Request, plc = Depends(get_plc_async)):
+    """Get control, pressure and sensor status in one response"""
+    async def read_status():
+        # Sections are requested together, so the loader fetches them in one batch
+        control, pressure, sensors = await asyncio.gather(
+            read_fields(CONTROL_STATUS_FIELDS),
+            read_fields(PRESSURE_READING_FIELDS),
+            read_fields(SENSOR_READING_FIELDS)
+        )
+        return PLCResponse(
+            success=True,
+            data={"control": control, "pressure": pressure, "sensors": sensors}
+        )
+
+    try:
+        return await cached_response("snapshot", READINGS_CACHE_TTL, read_status, request)
     except Exception as e:
-        logger.error(f"Failed to get system status: {e}")
+        logger.error("Failed to get status snapshot: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
@@ -1163,7 +1274,7 @@ async def get_system_status(plc = Depends(get_plc)):
     response_model=PLCResponse,
     tags=["System Status & Monitoring"],
     summary="Get WebSocket Connection Status",
-    description="Retrieve current WebSocket connection status for debugging and monitoring purposes.",
+    description=DESC["get_websocket_status"],
     responses={
         200: {"description": "WebSocket connection status retrieved successfully"},
         500: {"description": "Failed to retrieve WebSocket connection status"}
@@ -1191,7 +1302,7 @@ async def get_websocket_status():
             }
         }
         
-        logger.info(f"WebSocket status requested - Active connections: {connection_count}")
+        logger.info("WebSocket status requested - Active connections: %s", connection_count)
         
         return PLCResponse(
             success=True,
@@ -1199,7 +1310,7 @@ async def get_websocket_status():
             message=f"WebSocket status: {connection_count} active connection(s)"
         )
     except Exception as e:
-        logger.error(f"Failed to get WebSocket status: {e}")
+        logger.error("Failed to get WebSocket status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === CUSTOM PLC ADDRESS MONITORING ===
@@ -1208,14 +1319,14 @@ async def get_websocket_status():
     response_model=PLCResponse,
     tags=["Development & Debugging"],
     summary="Read Custom PLC Address",
-    description="Read a value from a custom PLC memory address for development and debugging purposes.",
+    description=DESC["read_custom_plc_address"],
     responses={
         200: {"description": "PLC address read successfully"},
         400: {"description": "Invalid address format"},
         500: {"description": "Failed to read PLC address"}
     }
 )
-async def read_custom_plc_address(address: str, plc = Depends(get_plc)):
+def read_custom_plc_address(address: str, plc = Depends(get_plc_async)):
     """Read value from a custom PLC address"""
     try:
         with ContextLogger(logger, operation="CUSTOM_READ", address=address):
@@ -1226,7 +1337,7 @@ async def read_custom_plc_address(address: str, plc = Depends(get_plc)):
             # Read the address - use getMem to match the rest of the codebase
             value = plc.getMem(address)
             
-            logger.info(f"Read custom address {address}: {value}")
+            logger.info("Read custom address %s: %s", address, value)
             return PLCResponse(
                 success=True,
                 data={
@@ -1237,7 +1348,7 @@ async def read_custom_plc_address(address: str, plc = Depends(get_plc)):
                 message=f"Address {address} read successfully"
             )
     except Exception as e:
-        logger.error(f"Failed to read custom address {address}: {e}")
+        logger.error("Failed to read custom address %s: %s", address, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 class CustomWriteRequest(BaseModel):
@@ -1248,14 +1359,14 @@ class CustomWriteRequest(BaseModel):
     response_model=PLCResponse,
     tags=["Development & Debugging"],
     summary="Write to Custom PLC Address",
-    description="⚠️ WARNING: Write a value to a custom PLC memory address. Use with extreme caution in development only.",
+    description=DESC["write_custom_plc_address"],
     responses={
         200: {"description": "PLC address written successfully"},
         400: {"description": "Invalid address format or value"},
         500: {"description": "Failed to write to PLC address"}
     }
 )
-async def write_custom_plc_address(address: str, request: CustomWriteRequest, plc = Depends(get_plc)):
+def write_custom_plc_address(address: str, request: CustomWriteRequest, plc = Depends(get_plc_async)):
     """Write value to a custom PLC address"""
     try:
         with ContextLogger(logger, operation="CUSTOM_WRITE", address=address, value=request.value):
@@ -1278,7 +1389,7 @@ async def write_custom_plc_address(address: str, request: CustomWriteRequest, pl
             except:
                 new_value = "unknown"
             
-            logger.warning(f"Custom write to {address}: {old_value} → {request.value} (verified: {new_value})")
+            logger.warning("Custom write to %s: %s → %s (verified: %s)", address, old_value, request.value, new_value)
             return PLCResponse(
                 success=True,
                 data={
@@ -1290,7 +1401,7 @@ async def write_custom_plc_address(address: str, request: CustomWriteRequest, pl
                 message=f"Address {address} written successfully"
             )
     except Exception as e:
-        logger.error(f"Failed to write custom address {address}: {e}")
+        logger.error("Failed to write custom address %s: %s", address, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === CUSTOM ADDRESS MONITORING MANAGEMENT ===
@@ -1299,7 +1410,7 @@ async def write_custom_plc_address(address: str, request: CustomWriteRequest, pl
     response_model=PLCResponse,
     tags=["Development & Debugging"],
     summary="Add Address to Real-time Monitoring",
-    description="Add a PLC address to the WebSocket real-time monitoring stream.",
+    description=DESC["add_address_monitoring"],
     responses={
         200: {"description": "Address added to monitoring successfully"},
         400: {"description": "Invalid address format"},
@@ -1326,7 +1437,7 @@ async def add_address_monitoring(address: str):
             message=f"Address {address} added to real-time monitoring"
         )
     except Exception as e:
-        logger.error(f"Failed to add address {address} to monitoring: {e}")
+        logger.error("Failed to add address %s to monitoring: %s", address, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete(
@@ -1334,7 +1445,7 @@ async def add_address_monitoring(address: str):
     response_model=PLCResponse,
     tags=["Development & Debugging"],
     summary="Remove Address from Real-time Monitoring",
-    description="Remove a PLC address from the WebSocket real-time monitoring stream.",
+    description=DESC["remove_address_monitoring"],
     responses={
         200: {"description": "Address removed from monitoring successfully"},
         500: {"description": "Failed to remove address from monitoring"}
@@ -1357,7 +1468,7 @@ async def remove_address_monitoring(address: str):
             message=f"Address {address} removed from real-time monitoring"
         )
     except Exception as e:
-        logger.error(f"Failed to remove address {address} from monitoring: {e}")
+        logger.error("Failed to remove address %s from monitoring: %s", address, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
@@ -1365,7 +1476,7 @@ async def remove_address_monitoring(address: str):
     response_model=PLCResponse,
     tags=["Development & Debugging"],
     summary="List Monitored Addresses",
-    description="Get the list of PLC addresses currently being monitored in real-time.",
+    description=DESC["list_monitored_addresses"],
     responses={
         200: {"description": "Monitored addresses retrieved successfully"},
         500: {"description": "Failed to retrieve monitored addresses"}
@@ -1388,5 +1499,5 @@ async def list_monitored_addresses():
             message=f"{len(monitored)} addresses currently monitored"
         )
     except Exception as e:
-        logger.error(f"Failed to list monitored addresses: {e}")
+        logger.error("Failed to list monitored addresses: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
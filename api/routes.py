@@ -1,7 +1,7 @@
 """
 Main API Router for Elixir Backend
 
-This module combines HTTP, WebSocket, and Session History routes into a single router
+This module combines HTTP, WebSocket, Stream, and Session History routes into a single router
 for inclusion in the main FastAPI application.
 """
 
@@ -10,6 +10,7 @@ from fastapi import APIRouter
 from . import http_routes
 from . import websocket_routes
 from . import session_routes
+from . import stream_routes
 
 # Create main router
 router = APIRouter()
@@ -20,5 +21,8 @@ router.include_router(http_routes.router, tags=["HTTP"])
 # Include WebSocket routes  
 router.include_router(websocket_routes.router, tags=["WebSocket"])
 
+# Include Server-Sent Events stream routes
+router.include_router(stream_routes.router, tags=["Stream"])
+
 # Include Session History routes
 router.include_router(session_routes.router, tags=["Session History"]) 
\ No newline at end of file
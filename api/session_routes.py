@@ -6,18 +6,22 @@ session history from the database.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from core.session_service import session_service
 from core.database import get_db, init_database, get_database_info
+from .descriptions import DESC
 from .shared import logger, PLCResponse
 
 # Create router
 router = APIRouter()
 
+SessionStatus = Literal["started", "running", "completed", "aborted", "error"]
+
 # Pydantic models for request/response
 class SessionCreateRequest(BaseModel):
     treatment_mode: Optional[str] = Field(None, description="Treatment mode (rest, health, professional, custom, o2_100, o2_120)")
@@ -35,30 +39,42 @@ class SessionEndRequest(BaseModel):
 
 class SessionHistoryResponse(BaseModel):
     sessions: List[Dict[str, Any]]
-    total_count: int
+    total_count: Optional[int]
     page: int
     page_size: int
     has_more: bool
 
+def stream_session_details(session_details: Dict[str, Any], session_id: int, message: str):
+    """
+    Encode a PLCResponse with all data points of a session, batch by batch
+
+    Produces the same JSON as returning the PLCResponse with data_points
+    filled in, but never holds more than one batch of data points.
+    """
+    # PLCResponse field order: success, data, message, timestamp
+    yield b'{"success":true,"data":' + to_json(session_details)[:-1] + b',"data_points":['
+    first = True
+    try:
+        for batch in session_service.iter_data_points(session_id):
+            # An empty batch would leave a stray comma in the array
+            if not batch:
+                continue
+            chunk = to_json(batch)[1:-1]
+            yield chunk if first else b"," + chunk
+            first = False
+    except Exception as e:
+        # Headers are already sent; the client sees a truncated body
+        logger.error("Failed to stream data points of session %s: %s", session_id, e)
+        raise
+    yield b']},"message":' + to_json(message) + b',"timestamp":' + to_json(datetime.now()) + b'}'
+
 # === DATABASE MANAGEMENT ROUTES ===
 @router.post(
     "/api/database/init",
     response_model=PLCResponse,
     tags=["Database Management"],
     summary="Initialize Database",
-    description="""
-    Initialize the session history database tables.
-    
-    This endpoint creates all necessary database tables for storing session
-    history, parameters, data points, and events. Safe to call multiple times.
-    
-    **Use Cases:**
-    - Initial system setup
-    - Database recovery
-    - Schema updates
-    
-    **Note:** This operation is idempotent and will not affect existing data.
-    """,
+    description=DESC["initialize_database"],
     responses={
         200: {"description": "Database initialized successfully"},
         500: {"description": "Failed to initialize database"}
@@ -84,15 +100,7 @@ async def initialize_database():
     response_model=PLCResponse,
     tags=["Database Management"],
     summary="Get Database Information",
-    description="""
-    Retrieve information about the database connection and schema.
-    
-    Returns details about:
-    - Database connection URL
-    - Database engine information
-    - Available tables
-    - Connection status
-    """,
+    description=DESC["get_database_information"],
     responses={
         200: {"description": "Database information retrieved successfully"},
         500: {"description": "Failed to retrieve database information"}
@@ -117,27 +125,7 @@ async def get_database_information():
     response_model=PLCResponse,
     tags=["Session History"],
     summary="Create New Session Record",
-    description="""
-    Create a new session record in the database with initial parameters.
-    
-    This endpoint creates a session record that can be used to track the
-    complete lifecycle of a hyperbaric treatment session including:
-    
-    **Session Information:**
-    - Treatment and compression modes
-    - Target parameters (pressure, temperature)
-    - Patient identification (optional)
-    - Operator notes and metadata
-    
-    **Automatic Features:**
-    - Unique session UUID generation
-    - Sequential session numbering
-    - Session start timestamp
-    - Initial event logging
-    
-    **Note:** This is separate from the PLC session start and can be used
-    for pre-session planning and documentation.
-    """,
+    description=DESC["create_session_record"],
     responses={
         200: {"description": "Session created successfully"},
         400: {"description": "Invalid session parameters"},
@@ -173,25 +161,7 @@ async def create_session_record(request: SessionCreateRequest):
     response_model=PLCResponse,
     tags=["Session History"],
     summary="End Current Session",
-    description="""
-    End the current active session with completion details.
-    
-    This endpoint finalizes the current session record by:
-    - Setting the end timestamp
-    - Recording completion reason
-    - Calculating final statistics
-    - Logging session end event
-    
-    **Completion Reasons:**
-    - `normal`: Planned completion
-    - `emergency_stop`: Emergency termination
-    - `manual_abort`: Operator-initiated abort
-    - `error`: System error termination
-    
-    **Final Statistics:**
-    Session statistics are automatically calculated from recorded data points
-    including pressure ranges, temperature averages, and oxygen levels.
-    """,
+    description=DESC["end_current_session"],
     responses={
         200: {"description": "Session ended successfully"},
         404: {"description": "No active session to end"},
@@ -224,21 +194,7 @@ async def end_current_session(request: SessionEndRequest):
     response_model=PLCResponse,
     tags=["Session History"],
     summary="Get Current Active Session",
-    description="""
-    Retrieve information about the currently active session.
-    
-    Returns complete session details including:
-    - Session identification and timing
-    - Treatment parameters and modes
-    - Current status and progress
-    - Recorded events and parameters
-    - Data points summary
-    
-    **Use Cases:**
-    - Real-time session monitoring
-    - Progress tracking
-    - Status verification
-    """,
+    description=DESC["get_current_session"],
     responses={
         200: {"description": "Current session retrieved successfully"},
         404: {"description": "No active session"},
@@ -270,30 +226,7 @@ async def get_current_session():
     response_model=PLCResponse,
     tags=["Session History"],
     summary="Get Session History",
-    description="""
-    Retrieve paginated session history with optional filtering.
-    
-    This endpoint provides comprehensive session history with support for:
-    
-    **Filtering Options:**
-    - **Status**: Filter by session status (started, running, completed, aborted)
-    - **Date Range**: Filter sessions within specific date ranges
-    - **Pagination**: Limit and offset for large datasets
-    
-    **Sorting:**
-    - Sessions are returned in reverse chronological order (newest first)
-    
-    **Response Format:**
-    - Paginated results with metadata
-    - Session summaries (detailed view available separately)
-    - Total count and pagination information
-    
-    **Use Cases:**
-    - Session history review
-    - Treatment tracking
-    - Compliance reporting
-    - Statistical analysis
-    """,
+    description=DESC["get_session_history"],
     responses={
         200: {"description": "Session history retrieved successfully"},
         400: {"description": "Invalid query parameters"},
@@ -303,14 +236,16 @@ async def get_current_session():
 async def get_session_history(
     limit: int = Query(50, ge=1, le=200, description="Maximum number of sessions to return"),
     offset: int = Query(0, ge=0, description="Number of sessions to skip"),
-    status: Optional[str] = Query(None, description="Filter by session status"),
+    status: Optional[SessionStatus] = Query(None, description="Filter by session status"),
     date_from: Optional[datetime] = Query(None, description="Filter sessions from this date"),
-    date_to: Optional[datetime] = Query(None, description="Filter sessions to this date")
+    date_to: Optional[datetime] = Query(None, description="Filter sessions to this date"),
+    include_total: bool = Query(False, description="Also count all matching sessions")
 ):
     """Get session history with filtering and pagination"""
     try:
+        # One extra row tells whether another page exists without a count query
         sessions = session_service.get_session_history(
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
             status_filter=status,
             date_from=date_from,
@@ -318,12 +253,21 @@ async def get_session_history(
         )
         
         # Calculate pagination info
-        has_more = len(sessions) == limit
+        has_more = len(sessions) > limit
+        sessions = sessions[:limit]
         page = (offset // limit) + 1
         
+        total_count = None
+        if include_total:
+            total_count = session_service.count_sessions(
+                status_filter=status,
+                date_from=date_from,
+                date_to=date_to
+            )
+        
         response_data = {
             "sessions": sessions,
-            "total_count": len(sessions),  # Note: This is the current page count
+            "total_count": total_count,
             "page": page,
             "page_size": limit,
             "has_more": has_more,
@@ -348,37 +292,7 @@ async def get_session_history(
     response_model=PLCResponse,
     tags=["Session History"],
     summary="Get Detailed Session Information",
-    description="""
-    Retrieve comprehensive details for a specific session.
-    
-    This endpoint provides complete session information including:
-    
-    **Session Overview:**
-    - Session identification and timing
-    - Treatment parameters and final statistics
-    - Completion status and reason
-    
-    **Session Parameters:**
-    - All recorded session parameters
-    - Parameter categories and types
-    - Recording timestamps
-    
-    **Session Events:**
-    - State changes and operator actions
-    - System events and alarms
-    - Event severity and descriptions
-    
-    **Data Points (Optional):**
-    - Real-time sensor readings throughout session
-    - System status at each recording
-    - Pressure, temperature, and oxygen trends
-    
-    **Use Cases:**
-    - Detailed session review
-    - Clinical documentation
-    - Troubleshooting and analysis
-    - Compliance and audit trails
-    """,
+    description=DESC["get_session_details"],
     responses={
         200: {"description": "Session details retrieved successfully"},
         404: {"description": "Session not found"},
@@ -391,14 +305,19 @@ async def get_session_details(
 ):
     """Get detailed information for a specific session"""
     try:
-        session_details = session_service.get_session_details(
-            session_id=session_id,
-            include_data_points=include_data_points
-        )
+        session_details = session_service.get_session_details(session_id=session_id)
         
         if not session_details:
             raise HTTPException(status_code=404, detail="Session not found")
         
+        if include_data_points:
+            # Data points can number in the tens of thousands; stream them
+            del session_details["data_points_count"]
+            return StreamingResponse(
+                stream_session_details(session_details, session_id, "Session details retrieved"),
+                media_type="application/json"
+            )
+        
         return PLCResponse(
             success=True,
             data=session_details,
@@ -415,27 +334,7 @@ async def get_session_details(
     response_model=PLCResponse,
     tags=["Session History"],
     summary="Get Session Events",
-    description="""
-    Retrieve all events for a specific session.
-    
-    Events include:
-    - State changes (pressurizing, running, depressurizing)
-    - Operator actions (mode changes, manual controls)
-    - System alerts and alarms
-    - Safety-related events
-    
-    **Event Categories:**
-    - `state_change`: Session phase transitions
-    - `operator_action`: User-initiated actions
-    - `system_event`: Automated system events
-    - `alarm`: Safety alerts and warnings
-    
-    **Severity Levels:**
-    - `info`: Informational events
-    - `warning`: Important notifications
-    - `error`: Error conditions
-    - `critical`: Critical safety events
-    """,
+    description=DESC["get_session_events"],
     responses={
         200: {"description": "Session events retrieved successfully"},
         404: {"description": "Session not found"},
@@ -472,27 +371,7 @@ async def get_session_events(session_id: int):
     response_model=PLCResponse,
     tags=["Session History"],
     summary="Get Session Statistics Summary",
-    description="""
-    Retrieve summary statistics for session history.
-    
-    Provides aggregated statistics including:
-    - Total number of sessions
-    - Sessions by status
-    - Sessions by treatment mode
-    - Average session durations
-    - Recent activity summary
-    
-    **Time Periods:**
-    - All time totals
-    - Last 30 days summary
-    - Current month statistics
-    
-    **Use Cases:**
-    - Dashboard statistics
-    - Usage reporting
-    - Performance metrics
-    - Trend analysis
-    """,
+    description=DESC["get_session_statistics"],
     responses={
         200: {"description": "Statistics retrieved successfully"},
         500: {"description": "Failed to retrieve statistics"}
@@ -501,48 +380,9 @@ async def get_session_events(session_id: int):
 async def get_session_statistics():
     """Get summary statistics for session history"""
     try:
-        # Get sessions from last 30 days for recent statistics
+        # Sessions from the last 30 days count as recent
         thirty_days_ago = datetime.now() - timedelta(days=30)
-        recent_sessions = session_service.get_session_history(
-            limit=1000,  # Large limit to get most recent sessions
-            date_from=thirty_days_ago
-        )
-        
-        # Get all sessions for total statistics (summary only)
-        all_sessions = session_service.get_session_history(limit=1000)
-        
-        # Calculate statistics
-        total_sessions = len(all_sessions)
-        recent_sessions_count = len(recent_sessions)
-        
-        # Status distribution
-        status_counts = {}
-        mode_counts = {}
-        
-        for session in all_sessions:
-            status = session.get("status", "unknown")
-            mode = session.get("treatment_mode", "unknown")
-            
-            status_counts[status] = status_counts.get(status, 0) + 1
-            mode_counts[mode] = mode_counts.get(mode, 0) + 1
-        
-        # Calculate average durations
-        completed_sessions = [s for s in all_sessions if s.get("actual_duration_seconds")]
-        avg_duration_seconds = 0
-        if completed_sessions:
-            total_duration = sum(s["actual_duration_seconds"] for s in completed_sessions)
-            avg_duration_seconds = total_duration / len(completed_sessions)
-        
-        statistics = {
-            "total_sessions": total_sessions,
-            "recent_sessions_30_days": recent_sessions_count,
-            "status_distribution": status_counts,
-            "mode_distribution": mode_counts,
-            "average_duration_seconds": round(avg_duration_seconds),
-            "average_duration_minutes": round(avg_duration_seconds / 60, 1),
-            "completed_sessions": len(completed_sessions),
-            "completion_rate": round(len(completed_sessions) / total_sessions * 100, 1) if total_sessions > 0 else 0
-        }
+        statistics = session_service.get_statistics_summary(recent_since=thirty_days_ago)
         
         return PLCResponse(
             success=True,
@@ -7,9 +7,13 @@ HTTP and WebSocket routes.
 
 from fastapi import HTTPException, Depends
 from fastapi.responses import JSONResponse
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional, Set, Tuple
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 from datetime import datetime
+import asyncio
+import threading
+import time
 
 from plc.plc import S7_200
 from core.logger import setup_logger, ContextLogger
@@ -21,17 +25,257 @@ logger = setup_logger("api.shared")
 # Initialize PLC instance (this should be managed as a singleton in production)
 plc_instance = None
 
+# Guards first-time creation; sync handlers resolve the PLC from several worker threads
+_plc_lock = threading.Lock()
+
 def get_plc():
     """Dependency to get PLC instance"""
     global plc_instance
     if plc_instance is None:
+        with _plc_lock:
+            # Another thread may have connected while we waited
+            if plc_instance is None:
+                try:
+                    plc_instance = S7_200()
+                    logger.info("PLC instance created successfully")
+                except Exception as e:
+                    logger.error("Failed to create PLC instance: %s", e)
+                    raise HTTPException(status_code=503, detail="PLC connection unavailable")
+    return plc_instance
+
+async def get_plc_async():
+    """
+    Route dependency to get PLC instance.
+
+    FastAPI runs sync dependencies in its threadpool on every request; this
+    returns the existing instance directly and only hands the first, blocking
+    connect to a worker thread.
+    """
+    if plc_instance is not None:
+        return plc_instance
+    return await asyncio.to_thread(get_plc)
+
+class PLCReadLoader:
+    """
+    Coalesces concurrent PLC reads into a single multi-variable fetch.
+
+    Reads requested within the same short window are collected into one batch;
+    identical addresses share one Future, so simultaneous clients asking for the
+    same values cost a single PLC round-trip.
+    """
+
+    def __init__(self, window: float = 0.005):
+        self.window = window
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.batch: List[str] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only holds weak references to tasks; keep fetches alive until done
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, address: str) -> Any:
+        """Read one address, sharing the fetch with concurrent callers"""
+        future = self.pending.get(address)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.pending[address] = future
+            self.batch.append(address)
+            if self._timer is None:
+                self._timer = loop.call_later(self.window, self._flush)
+        # Shield so one cancelled request does not cancel the shared read
+        return await asyncio.shield(future)
+
+    async def load_many(self, addresses: List[str]) -> List[Any]:
+        """Read several addresses in the same batch"""
+        return await asyncio.gather(*(self.load(address) for address in addresses))
+
+    def _flush(self):
+        batch, futures = self.batch, self.pending
+        self.batch, self.pending, self._timer = [], {}, None
+        task = asyncio.ensure_future(self._fetch(batch, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: List[str], futures: Dict[str, asyncio.Future]):
         try:
-            plc_instance = S7_200()
-            logger.info("PLC instance created successfully")
+            plc = await get_plc_async()
+            values = await asyncio.to_thread(plc.getMemBatch, batch)
         except Exception as e:
-            logger.error(f"Failed to create PLC instance: {e}")
-            raise HTTPException(status_code=503, detail="PLC connection unavailable")
-    return plc_instance
+            logger.error("Batched PLC read of %s addresses failed: %s", len(batch), e)
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for address, value in zip(batch, values):
+            future = futures[address]
+            if not future.done():
+                future.set_result(value)
+
+read_loader = PLCReadLoader()
+
+class PLCCommandQueue:
+    """
+    Background writer for fire-and-forget PLC commands.
+
+    Handlers enqueue a write and return immediately; a single task sends
+    everything queued since its last write with one writeMulti. No request is
+    waiting for the result, so failures are kept in last_error for /health.
+    Cached status responses are dropped once a write has reached the PLC.
+    """
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.last_error: Optional[Dict[str, Any]] = None
+
+    def submit(self, address: str, value: Any):
+        """Queue a write; must be called from the event loop"""
+        self.queue.put_nowait((address, value))
+
+    def status(self) -> Dict[str, Any]:
+        return {"pending": self.queue.qsize(), "last_error": self.last_error}
+
+    def _drain(self) -> Dict[str, Any]:
+        values = {}
+        while not self.queue.empty():
+            address, value = self.queue.get_nowait()
+            values[address] = value
+        return values
+
+    async def _write(self, values: Dict[str, Any]):
+        try:
+            plc = await get_plc_async()
+            await asyncio.to_thread(plc.writeMulti, values)
+            # The request's own cache clear ran before this write landed
+            status_cache.clear()
+        except Exception as e:
+            logger.error("Queued PLC write of %s failed: %s", list(values), e)
+            self.last_error = {
+                "addresses": list(values),
+                "error": str(e),
+                "timestamp": datetime.now().isoformat()
+            }
+
+    async def run(self):
+        """Writer task, started from the application lifespan"""
+        while True:
+            address, value = await self.queue.get()
+            values = {address: value}
+            values.update(self._drain())
+            await self._write(values)
+
+    async def flush(self):
+        """Send whatever is still queued, e.g. on shutdown"""
+        values = self._drain()
+        if values:
+            await self._write(values)
+
+command_queue = PLCCommandQueue()
+
+class StatusCache:
+    """
+    Short-lived in-process cache for status GET responses.
+
+    Polling bursts within the TTL are answered from memory. The miss path is
+    serialized per key, so concurrent callers wait for one PLC read instead of
+    each issuing their own. With caching disabled (ttl <= 0) concurrent callers
+    still share the read that is in flight.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generation = 0
+        self._cleared = asyncio.Event()
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float):
+        if len(self._entries) >= self.maxsize and key not in self._entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self):
+        """Drop all cached responses, e.g. after a write to the PLC"""
+        self._entries.clear()
+        self._generation += 1
+        self._cleared.set()
+
+    async def wait_cleared(self, timeout: float):
+        """Sleep up to timeout seconds, returning early when the cache is cleared"""
+        self._cleared.clear()
+        try:
+            await asyncio.wait_for(self._cleared.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def refresh(self, key: str, ttl: float, compute):
+        """Await compute() and replace the cached value for key"""
+        generation = self._generation
+        value = await compute()
+        # Do not cache a read that raced with a write
+        if generation == self._generation:
+            self.set(key, value, ttl)
+        return value
+
+    async def get_or_compute(self, key: str, ttl: float, compute) -> Any:
+        """Return the cached value for key, or await compute() once and cache it"""
+        if ttl <= 0:
+            return await self._single_flight(key, compute)
+
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have filled the entry while we waited
+            value = self.get(key)
+            if value is None:
+                generation = self._generation
+                value = await compute()
+                # Do not cache a read that raced with a write
+                if generation == self._generation:
+                    self.set(key, value, ttl)
+            return value
+
+    async def _single_flight(self, key: str, compute) -> Any:
+        """Await compute() once for all concurrent callers of key"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(compute())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled request does not cancel the shared read
+        return await asyncio.shield(future)
+
+status_cache = StatusCache()
+
+# Accepted query values for the mode endpoints, validated by FastAPI (422 otherwise)
+CompressionMode = Literal["beginner", "normal", "fast"]
+OxygenMode = Literal["continuous", "intermittent"]
+ACMode = Literal["auto", "low", "mid", "high"]
+ManualControl = Literal[
+    "release_solenoid", "air_pump1", "air_pump2",
+    "oxygen_supply1", "oxygen_supply2", "release_solenoid_set"
+]
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust serializer.
+
+    Produces the same compact UTF-8 output as JSONResponse without going
+    through the stdlib json module; used as the app's default response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
 
 # Pydantic models for request/response
 class PLCResponse(BaseModel):
@@ -54,5 +298,5 @@ class ModeRequest(BaseModel):
     duration: Optional[int] = None
 
 class ManualControlRequest(BaseModel):
-    control: str
+    control: ManualControl
     value: Any 
\ No newline at end of file
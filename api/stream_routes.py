@@ -0,0 +1,243 @@
+"""
+Server-Sent Events stream for dashboard live state.
+
+A single background poller reads the dashboard values from the PLC with one
+multi-variable read per tick and publishes them only when something changed.
+Every connected dashboard receives the same snapshot from the broker, so PLC
+load no longer grows with the number of open dashboards.
+"""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Optional, Set
+import asyncio
+import math
+import os
+import random
+from datetime import datetime
+
+from pydantic_core import to_json
+
+from .descriptions import DESC
+from .shared import get_plc_async, get_plc_config, logger
+
+# Create router
+router = APIRouter()
+
+# Poll interval of the background reader (milliseconds)
+STREAM_POLL_INTERVAL = int(os.getenv("STREAM_POLL_INTERVAL", "250")) / 1000
+
+# Seconds without a change before a keep-alive comment is sent
+STREAM_KEEPALIVE_INTERVAL = 15.0
+
+# Cap on the retry delay after consecutive PLC read failures (seconds, before jitter)
+STREAM_MAX_RETRY_DELAY = 30.0
+
+# Section -> response key -> (category, function) streamed to dashboards
+STREAM_FIELDS = {
+    "auth": {
+        "proceed_status": ("authentication", "proceed_status"),
+        "change_pw_status": ("authentication", "change_password_status"),
+    },
+    "language": {
+        "english": ("language", "english_active"),
+        "chinese": ("language", "chinese_active"),
+    },
+    "control": {
+        "ac_state": ("control_panel", "ac_state"),
+        "ceiling_lights": ("control_panel", "ceiling_light_state"),
+        "intercom": ("control_panel", "intercom_state"),
+        "reading_lights": ("control_panel", "reading_lights"),
+        "door_light": ("control_panel", "door_light"),
+        "shutdown_status": ("control_panel", "shutdown_status"),
+    },
+    "pressure": {
+        "setpoint": ("pressure_control", "pressure_setpoint"),
+        "internal_pressure_1": ("pressure_control", "internal_pressure_1"),
+        "internal_pressure_2": ("pressure_control", "internal_pressure_2"),
+    },
+    "sensors": {
+        "current_temp": ("sensors", "current_temperature"),
+        "current_humidity": ("sensors", "current_humidity"),
+        "ambient_o2": ("sensors", "ambient_o2"),
+        "ambient_o2_2": ("sensors", "ambient_o2_2"),
+        "ambient_o2_check_flag": ("sensors", "ambient_o2_check_flag"),
+    },
+}
+
+# Flattened (section, key) order and address names for the multi-read
+STREAM_KEYS = [(section, key) for section, fields in STREAM_FIELDS.items() for key in fields]
+STREAM_NAMES = [STREAM_FIELDS[section][key] for section, key in STREAM_KEYS]
+
+
+class StatusBroker:
+    """
+    Fans out the latest PLC snapshot to every subscribed stream client.
+
+    Snapshots are encoded to JSON once on publish; every subscriber receives
+    the same encoded payload.
+    """
+
+    def __init__(self, queue_size: int = 8):
+        self.queue_size = queue_size
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.latest: Optional[str] = None
+        self._has_subscribers = asyncio.Event()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a client; it immediately receives the latest snapshot"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        if self.latest is not None:
+            queue.put_nowait(self.latest)
+        self.subscribers.add(queue)
+        self._has_subscribers.set()
+        logger.info("Stream client subscribed. Total subscribers: %s", len(self.subscribers))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+        if not self.subscribers:
+            self._has_subscribers.clear()
+        logger.info("Stream client unsubscribed. Total subscribers: %s", len(self.subscribers))
+
+    def has_subscribers(self) -> bool:
+        return len(self.subscribers) > 0
+
+    async def wait_for_subscribers(self):
+        """Block until at least one client is subscribed"""
+        await self._has_subscribers.wait()
+
+    def publish(self, snapshot: Dict[str, Any], latest: Optional[Dict[str, Any]] = None):
+        """
+        Queue a snapshot for every subscriber without waiting on slow clients
+
+        When snapshot only carries changes, pass the full state as latest so
+        clients subscribing later still start from a complete snapshot. A
+        client whose queue is full has its backlog collapsed into that one
+        latest message, so no change is lost by dropping an update.
+        """
+        payload = to_json(snapshot).decode()
+        self.latest = payload if latest is None else to_json(latest).decode()
+        for queue in self.subscribers:
+            if queue.full():
+                # A slow client only needs the newest state
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self.latest)
+            else:
+                queue.put_nowait(payload)
+
+status_broker = StatusBroker()
+
+def retry_delay(base: float, failures: int) -> float:
+    """
+    Delay before retrying after consecutive read failures
+
+    Doubles from base up to STREAM_MAX_RETRY_DELAY, with +/-20% jitter so
+    readers failing together do not retry against the PLC in lockstep.
+    """
+    delay = min(STREAM_MAX_RETRY_DELAY, base * 2 ** (failures - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+def schedule_next_tick(next_tick: float, interval: float, now: float) -> float:
+    """
+    Loop time of the tick following next_tick on a fixed interval grid
+
+    Sleeping until this time instead of for interval keeps the cadence from
+    drifting by the duration of each read. Ticks missed because a read overran
+    are skipped rather than run back to back.
+    """
+    if interval <= 0:
+        return now
+    next_tick += interval
+    if now > next_tick:
+        next_tick += math.ceil((now - next_tick) / interval) * interval
+    return next_tick
+
+def build_snapshot(values: List[Any]) -> Dict[str, Any]:
+    """Assemble the nested stream payload from multi-read values"""
+    snapshot: Dict[str, Any] = {section: {} for section in STREAM_FIELDS}
+    for (section, key), value in zip(STREAM_KEYS, values):
+        snapshot[section][key] = value
+    return snapshot
+
+async def run_status_poller():
+    """
+    Background task reading the dashboard values and publishing changes.
+
+    Started from the application lifespan; does not touch the PLC while
+    nobody is subscribed.
+    """
+    logger.info("Status stream poller started with %.3fs interval", STREAM_POLL_INTERVAL)
+    loop = asyncio.get_running_loop()
+    previous = None
+    failures = 0
+    next_tick = loop.time()
+
+    while True:
+        if not status_broker.has_subscribers():
+            previous = None
+            failures = 0
+            # The next subscriber must not start from a snapshot taken before the pause
+            status_broker.latest = None
+            await status_broker.wait_for_subscribers()
+            next_tick = loop.time()
+            continue
+
+        try:
+            plc = await get_plc_async()
+            plan = get_plc_config().build_multi_read(STREAM_NAMES)
+            values = await asyncio.to_thread(plc.readMulti, plan)
+
+            if values != previous:
+                previous = values
+                snapshot = build_snapshot(values)
+                snapshot["timestamp"] = datetime.now().isoformat()
+                status_broker.publish(snapshot)
+            failures = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Status stream poll failed: %s", e)
+            previous = None
+            failures += 1
+            status_broker.publish({"timestamp": datetime.now().isoformat(), "error": str(e)})
+            await asyncio.sleep(retry_delay(2.0, failures))
+            next_tick = loop.time()
+            continue
+
+        next_tick = schedule_next_tick(next_tick, STREAM_POLL_INTERVAL, loop.time())
+        await asyncio.sleep(next_tick - loop.time())
+
+@router.get(
+    "/api/stream",
+    tags=["System Status & Monitoring"],
+    summary="Stream Live Dashboard State",
+    description=DESC["stream_status"],
+    responses={
+        200: {"description": "Event stream opened", "content": {"text/event-stream": {}}}
+    }
+)
+async def stream_status(request: Request):
+    """Push live dashboard state to the client as Server-Sent Events"""
+    async def event_generator():
+        # Subscribed once the response starts, so a client gone before then leaves no queue behind
+        queue = status_broker.subscribe()
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {payload}\n\n"
+        finally:
+            status_broker.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
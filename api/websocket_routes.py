@@ -7,12 +7,15 @@ real-time updates, while HTTP endpoints handle only command operations.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import List, Dict, Any, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 import asyncio
-import json
+import time
 from datetime import datetime
 
-from .shared import get_plc, logger, Addresses
+from pydantic_core import to_json
+
+from .shared import get_plc, get_plc_config, logger
+from .stream_routes import StatusBroker, STREAM_KEEPALIVE_INTERVAL, retry_delay, schedule_next_tick
 
 # Create router
 router = APIRouter()
@@ -20,20 +23,19 @@ router = APIRouter()
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.logger = logger
         # Add tracking for custom addresses
         self.monitored_addresses: Set[str] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        self.logger.info(f"WebSocket connection established. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        self.logger.info("WebSocket connection established. Total connections: %s", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        self.logger.info(f"WebSocket connection closed. Total connections: {len(self.active_connections)}")
+        self.active_connections.discard(websocket)
+        self.logger.info("WebSocket connection closed. Total connections: %s", len(self.active_connections))
 
     def has_active_connections(self) -> bool:
         """Check if there are any active WebSocket connections"""
@@ -49,36 +51,43 @@ class ConnectionManager:
         try:
             await websocket.send_text(message)
         except Exception as e:
-            self.logger.error(f"Failed to send message to WebSocket: {e}")
+            self.logger.error("Failed to send message to WebSocket: %s", e)
             # Remove failed connection
             self.disconnect(websocket)
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all active connections"""
+        """
+        Broadcast message to all active connections
+
+        The message is encoded once and sent to every connection concurrently,
+        so one slow client does not hold up the others.
+        """
         if not self.active_connections:
             return
-            
-        # Clean up closed connections and broadcast to active ones
-        active_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-                active_connections.append(connection)
-            except Exception as e:
-                # Connection is closed or has an error, skip it
-                self.logger.debug(f"Removing inactive WebSocket connection: {e}")
         
-        self.active_connections = active_connections
+        payload = to_json(message).decode()
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+        
+        # Clean up connections whose send failed
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                # Connection is closed or has an error, skip it
+                self.logger.debug("Removing inactive WebSocket connection: %s", result)
+                self.disconnect(connection)
 
     def add_monitored_address(self, address: str):
         """Add an address to the monitoring list"""
         self.monitored_addresses.add(address)
-        self.logger.info(f"Added address {address} to monitoring. Total: {len(self.monitored_addresses)}")
+        self.logger.info("Added address %s to monitoring. Total: %s", address, len(self.monitored_addresses))
 
     def remove_monitored_address(self, address: str):
         """Remove an address from the monitoring list"""
         self.monitored_addresses.discard(address)
-        self.logger.info(f"Removed address {address} from monitoring. Total: {len(self.monitored_addresses)}")
+        self.logger.info("Removed address %s from monitoring. Total: %s", address, len(self.monitored_addresses))
 
     def get_monitored_addresses(self) -> Set[str]:
         """Get the current set of monitored addresses"""
@@ -101,142 +110,349 @@ def get_websocket_client_count() -> int:
     """
     return manager.get_connection_count()
 
-async def read_all_plc_status(plc) -> Dict[str, Any]:
+def field_names(layout: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(category, function) pairs of a response layout, in layout order"""
+    names = []
+    for value in layout.values():
+        names.extend(field_names(value) if isinstance(value, dict) else [value])
+    return names
+
+def read_layout(plc, layout: Dict[str, Any], names: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Read a response layout with one prebuilt multi-read.
+
+    layout maps response keys to (category, function) pairs or to nested
+    sections of them; names is field_names(layout), computed once by the caller.
+    """
+    values = iter(plc.readMulti(get_plc_config().build_multi_read(names)))
+
+    def fill(level: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: fill(value) if isinstance(value, dict) else next(values) for key, value in level.items()}
+
+    return fill(layout)
+
+def diff_snapshot(previous: Dict[str, Any], current: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Fields of current that differ from previous, nested sections per field.
+
+    Returns None when a field of previous is missing from current, since a
+    merged patch cannot express a removal.
+    """
+    if not previous.keys() <= current.keys():
+        return None
+    changes = {}
+    for key, value in current.items():
+        before = previous.get(key)
+        if isinstance(value, dict) and isinstance(before, dict):
+            section = diff_snapshot(before, value)
+            if section is None:
+                return None
+            if section:
+                changes[key] = section
+        elif value != before:
+            changes[key] = value
+    return changes
+
+# Seconds between full-state messages for clients in delta mode
+STREAM_KEYFRAME_INTERVAL = 30.0
+
+class PLCStream:
+    """
+    One background PLC reader shared by every client of a stream endpoint.
+
+    The reader starts with the first subscriber and stops with the last. Each
+    tick reads the layout once and hands the encoded snapshot to all
+    subscribers through a StatusBroker, so PLC load does not grow with the
+    number of connected clients. Unchanged ticks are not sent, except for a
+    refresh every STREAM_KEEPALIVE_INTERVAL seconds.
+
+    Clients in delta mode subscribe to a second broker that carries
+    {"type": "delta", "seq": n, "changes": ...} patches against the previous
+    message, with a {"type": "full", "seq": n, "state": ...} keyframe first,
+    every STREAM_KEYFRAME_INTERVAL seconds and whenever a patch cannot
+    describe the change.
+    """
+
+    def __init__(self, name: str, layout: Dict[str, Any], interval: float, error_delay: float):
+        self.name = name
+        self.layout = layout
+        self.names = field_names(layout)
+        self.interval = interval
+        self.error_delay = error_delay
+        self.broker = StatusBroker()
+        self.delta_broker = StatusBroker()
+        self.seq = 0
+        self.latest_snapshot: Optional[Dict[str, Any]] = None
+        self.last_state: Optional[Dict[str, Any]] = None
+        self.keyframe_at = 0.0
+        self.task: Optional[asyncio.Task] = None
+
+    def subscribe(self, deltas: bool = False) -> asyncio.Queue:
+        if deltas and not self.delta_broker.has_subscribers():
+            # Deltas are only tracked while someone listens; restart from a keyframe
+            self.last_state = None
+            if self.latest_snapshot is not None:
+                self.publish_delta(self.latest_snapshot)
+        queue = (self.delta_broker if deltas else self.broker).subscribe()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.broker.unsubscribe(queue)
+        self.delta_broker.unsubscribe(queue)
+        if not self.broker.has_subscribers() and not self.delta_broker.has_subscribers() and self.task is not None:
+            self.task.cancel()
+            self.task = None
+            # The next subscriber must not start from a snapshot taken before the pause
+            self.broker.latest = None
+            self.delta_broker.latest = None
+            self.latest_snapshot = None
+
+    def read_values(self) -> Dict[str, Any]:
+        return read_layout(get_plc(), self.layout, self.names)
+
+    def snapshot(self, values: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+        """Message published for a tick's values"""
+        return {"timestamp": timestamp, **values}
+
+    def publish_error(self, error: Exception, failures: int, timestamp: str):
+        """Hook for streams that report read failures to their clients"""
+
+    def publish(self, values: Dict[str, Any], timestamp: str):
+        snapshot = self.snapshot(values, timestamp)
+        self.latest_snapshot = snapshot
+        self.broker.publish(snapshot)
+        if self.delta_broker.has_subscribers():
+            self.publish_delta(snapshot)
+
+    def publish_delta(self, snapshot: Dict[str, Any]):
+        self.seq += 1
+        full = {"type": "full", "seq": self.seq, "state": snapshot}
+        changes = None
+        now = time.monotonic()
+        if self.last_state is not None and now - self.keyframe_at < STREAM_KEYFRAME_INTERVAL:
+            changes = diff_snapshot(self.last_state, snapshot)
+        if changes is None:
+            self.delta_broker.publish(full)
+            self.keyframe_at = now
+        else:
+            # Clients subscribing later or falling behind start from the full state
+            self.delta_broker.publish({"type": "delta", "seq": self.seq, "changes": changes}, latest=full)
+        self.last_state = snapshot
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        previous = None
+        published_at = 0.0
+        failures = 0
+        next_tick = loop.time()
+        while True:
+            try:
+                # Blocking PLC reads run in a worker thread, not on the event loop
+                values = await asyncio.to_thread(self.read_values)
+                now = time.monotonic()
+                if values != previous or now - published_at >= STREAM_KEEPALIVE_INTERVAL:
+                    # One timestamp per read, shared by every message built from it
+                    self.publish(values, datetime.now().isoformat())
+                    previous = values
+                    published_at = now
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error reading %s stream: %s", self.name, e)
+                previous = None
+                self.latest_snapshot = None
+                self.last_state = None
+                failures += 1
+                self.publish_error(e, failures, datetime.now().isoformat())
+                await asyncio.sleep(retry_delay(self.error_delay, failures))
+                next_tick = loop.time()
+                continue
+            next_tick = schedule_next_tick(next_tick, self.interval, loop.time())
+            await asyncio.sleep(next_tick - loop.time())
+
+async def serve_stream(websocket: WebSocket, stream: PLCStream, deltas: Optional[bool] = None):
     """
-    Read all PLC status bits and values for comprehensive system monitoring.
-    This replaces the need for individual HTTP status endpoints.
+    Forward a PLCStream's snapshots to one client until it disconnects
+
+    Clients connecting with ?mode=delta receive patches instead of full
+    snapshots; deltas overrides the query parameter.
     """
+    await manager.connect(websocket)
+    if deltas is None:
+        deltas = websocket.query_params.get("mode") == "delta"
+    queue = stream.subscribe(deltas=deltas)
+
+    async def forward():
+        while True:
+            await websocket.send_text(await queue.get())
+
+    async def wait_for_disconnect():
+        # Unchanged ticks are held back, so a closed socket must not wait for the next send
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [asyncio.ensure_future(forward()), asyncio.ensure_future(wait_for_disconnect())]
     try:
-        status_data = {
-            "timestamp": datetime.now().isoformat(),
-            
-            # Authentication & Security Status
-            "auth": {
-                "show_password_screen": plc.getMem(Addresses.auth("show_password_screen")),
-                "proceed_password": plc.getMem(Addresses.auth("proceed_password")),
-                "back_password": plc.getMem(Addresses.auth("back_password")),
-                "password_input": plc.getMem(Addresses.auth("password_input")),
-                "proceed_status": plc.getMem(Addresses.auth("proceed_status")),
-                "change_password_status": plc.getMem(Addresses.auth("change_password_status")),
-                "admin_password": plc.getMem(Addresses.auth("admin_password")),
-                "user_password": plc.getMem(Addresses.auth("user_password"))
-            },
-            
-            # Language Settings
-            "language": {
-                "english_active": plc.getMem(Addresses.language("english_active")),
-                "chinese_active": plc.getMem(Addresses.language("chinese_active")),
-                "language_switch": plc.getMem(Addresses.language("language_switch"))
-            },
-            
-            # Control Panel Status  
-            "control_panel": {
-                "ac_state": plc.getMem(Addresses.control("ac_state")),
-                "shutdown_status": plc.getMem(Addresses.control("shutdown_status")),
-                "ceiling_lights_state": plc.getMem(Addresses.control("ceiling_light_state")),
-                "reading_lights_state": plc.getMem(Addresses.control("reading_lights")),
-                "door_lights_state": plc.getMem(Addresses.control("door_light")),
-                "intercom_state": plc.getMem(Addresses.control("intercom_state"))
-            },
-            
-            # Pressure System Status
-            "pressure": {
-                "setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                "pressure_setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2"))
-            },
-            
-            # Session Status
-            "session": {
-                "running_state": plc.getMem(Addresses.session("running_state")),
-                "pressuring_state": plc.getMem(Addresses.session("pressuring_state")),
-                "stabilising_state": plc.getMem(Addresses.session("stabilising_state")),
-                "depressurise_state": plc.getMem(Addresses.session("depressurise_state")),
-                "equalise_state": plc.getMem(Addresses.session("equalise_state")),
-                "depressurisation_confirm": plc.getMem(Addresses.session("depressurisation_confirm"))
-            },
-            
-            # Operating Modes Status
-            "modes": {
-                "mode_rest": plc.getMem(Addresses.modes("mode_rest")),
-                "mode_health": plc.getMem(Addresses.modes("mode_health")),
-                "mode_professional": plc.getMem(Addresses.modes("mode_professional")),
-                "mode_custom": plc.getMem(Addresses.modes("mode_custom")),
-                "mode_o2_100": plc.getMem(Addresses.modes("mode_o2_100")),
-                "mode_o2_120": plc.getMem(Addresses.modes("mode_o2_120")),
-                "set_duration": plc.getMem(Addresses.modes("set_duration")),
-                "compression_beginner": plc.getMem(Addresses.modes("compression_beginner")),
-                "compression_normal": plc.getMem(Addresses.modes("compression_normal")),
-                "compression_fast": plc.getMem(Addresses.modes("compression_fast")),
-                "continuous_o2_flag": plc.getMem(Addresses.modes("continuous_o2_flag")),
-                "intermittent_o2_flag": plc.getMem(Addresses.modes("intermittent_o2_flag")),
-                "continuous_o2_selection": plc.getMem(Addresses.modes("continuous_o2_selection")),
-                "intermittent_o2_selection": plc.getMem(Addresses.modes("intermittent_o2_selection"))
-            },
-            
-            # Climate Control Status
-            "climate": {
-                "ac_auto": plc.getMem(Addresses.temperature("ac_auto")),
-                "ac_low": plc.getMem(Addresses.temperature("ac_low")),
-                "ac_mid": plc.getMem(Addresses.temperature("ac_mid")),
-                "ac_high": plc.getMem(Addresses.temperature("ac_high")),
-                "temperature_setpoint": plc.getMem(Addresses.temperature("temperature_setpoint")),
-                "heating_cooling_toggle": plc.getMem(Addresses.temperature("heating_cooling_toggle"))
-            },
-            
-            # Sensor Readings
-            "sensors": {
-                "current_temperature": plc.getMem(Addresses.sensors("current_temperature")),
-                "current_humidity": plc.getMem(Addresses.sensors("current_humidity")),
-                "ambient_o2": plc.getMem(Addresses.sensors("ambient_o2")),
-                "ambient_o2_2": plc.getMem(Addresses.sensors("ambient_o2_2")),
-                "ambient_o2_check_flag": plc.getMem(Addresses.sensors("ambient_o2_check_flag"))
-            },
-            
-            # Calibration Status
-            "calibration": {
-                "pressure_sensor_calibration": plc.getMem(Addresses.calibration("pressure_sensor_calibration")),
-                "oxygen_sensor_calibration": plc.getMem(Addresses.calibration("oxygen_sensor_calibration"))
-            },
-            
-            # Manual Control Status
-            "manual": {
-                "manual_mode": plc.getMem(Addresses.manual("manual_mode")),
-                "release_solenoid_manual": plc.getMem(Addresses.manual("release_solenoid_manual")),
-                "air_pump1_manual": plc.getMem(Addresses.manual("air_pump1_manual")),
-                "air_pump2_manual": plc.getMem(Addresses.manual("air_pump2_manual")),
-                "oxygen_supply1_manual": plc.getMem(Addresses.manual("oxygen_supply1_manual")),
-                "oxygen_supply2_manual": plc.getMem(Addresses.manual("oxygen_supply2_manual"))
-            },
-            
-            # System Timers
-            "timers": {
-                "run_time_remaining_sec": plc.getMem(Addresses.timers("run_time_remaining_sec")),
-                "run_time_remaining_min": plc.getMem(Addresses.timers("run_time_remaining_min"))
-            },
-            
-            # System Health
-            "system": {
-                "plc_connected": plc.plc.get_connected(),
-                "communication_errors": 0,  # Could track communication error count
-                "last_update": datetime.now().isoformat()
-            }
-        }
-        
-        return status_data
-        
-    except Exception as e:
-        logger.error(f"Error reading comprehensive PLC status: {e}")
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                logger.error("Failed to send message to WebSocket: %s", error)
+    finally:
+        for task in tasks:
+            task.cancel()
+        stream.unsubscribe(queue)
+        manager.disconnect(websocket)
+        logger.info("%s WebSocket stream ended. Remaining connections: %s", stream.name.capitalize(), manager.get_connection_count())
+
+# Response key -> (category, function) pushed by /ws/system-status
+SYSTEM_STATUS_FIELDS = {
+    "auth": {
+        "show_password_screen": ("authentication", "show_password_screen"),
+        "proceed_password": ("authentication", "proceed_password"),
+        "back_password": ("authentication", "back_password"),
+        "password_input": ("authentication", "password_input"),
+        "proceed_status": ("authentication", "proceed_status"),
+        "change_password_status": ("authentication", "change_password_status"),
+        "admin_password": ("authentication", "admin_password"),
+        "user_password": ("authentication", "user_password")
+    },
+    "language": {
+        "language_switch": ("language", "language_switch"),
+        "english_active": ("language", "english_active"),
+        "chinese_active": ("language", "chinese_active")
+    },
+    "control_panel": {
+        "ac_state": ("control_panel", "ac_state"),
+        "shutdown_status": ("control_panel", "shutdown_status"),
+        "ceiling_lights_state": ("control_panel", "ceiling_light_state"),
+        "reading_lights_state": ("control_panel", "reading_lights"),
+        "door_lights_state": ("control_panel", "door_light"),
+        "intercom_state": ("control_panel", "intercom_state")
+    },
+    "pressure": {
+        "setpoint": ("pressure_control", "pressure_setpoint"),
+        "pressure_setpoint": ("pressure_control", "pressure_setpoint"),
+        "internal_pressure_1": ("pressure_control", "internal_pressure_1"),
+        "internal_pressure_2": ("pressure_control", "internal_pressure_2")
+    },
+    "session": {
+        "equalise_state": ("session_control", "equalise_state"),
+        "pressuring_state": ("session_control", "pressuring_state"),
+        "stabilising_state": ("session_control", "stabilising_state"),
+        "depressurise_state": ("session_control", "depressurise_state"),
+        "running_state": ("session_control", "running_state"),
+        "stop_state": ("session_control", "stop_state"),
+        "depressurisation_confirm": ("session_control", "depressurisation_confirm")
+    },
+    "modes": {
+        "mode_rest": ("operating_modes", "mode_rest"),
+        "mode_health": ("operating_modes", "mode_health"),
+        "mode_professional": ("operating_modes", "mode_professional"),
+        "mode_custom": ("operating_modes", "mode_custom"),
+        "mode_o2_100": ("operating_modes", "mode_o2_100"),
+        "mode_o2_120": ("operating_modes", "mode_o2_120"),
+        "set_duration": ("operating_modes", "set_duration"),
+        "compression_beginner": ("operating_modes", "compression_beginner"),
+        "compression_normal": ("operating_modes", "compression_normal"),
+        "compression_fast": ("operating_modes", "compression_fast"),
+        "continuous_o2_flag": ("operating_modes", "continuous_o2_flag"),
+        "intermittent_o2_flag": ("operating_modes", "intermittent_o2_flag"),
+        "continuous_o2_selection": ("operating_modes", "continuous_o2_selection"),
+        "intermittent_o2_selection": ("operating_modes", "intermittent_o2_selection")
+    },
+    "climate": {
+        "ac_auto": ("temperature_control", "ac_auto"),
+        "ac_low": ("temperature_control", "ac_low"),
+        "ac_mid": ("temperature_control", "ac_mid"),
+        "ac_high": ("temperature_control", "ac_high"),
+        "temperature_setpoint": ("temperature_control", "temperature_setpoint"),
+        "heating_cooling_toggle": ("temperature_control", "heating_cooling_toggle")
+    },
+    "sensors": {
+        "current_temperature": ("sensors", "current_temperature"),
+        "current_humidity": ("sensors", "current_humidity"),
+        "ambient_o2": ("sensors", "ambient_o2"),
+        "ambient_o2_2": ("sensors", "ambient_o2_2"),
+        "ambient_o2_check_flag": ("sensors", "ambient_o2_check_flag")
+    },
+    "calibration": {
+        "pressure_sensor_calibration": ("calibration", "pressure_sensor_calibration"),
+        "oxygen_sensor_calibration": ("calibration", "oxygen_sensor_calibration")
+    },
+    "manual": {
+        "manual_mode": ("manual_controls", "manual_mode")
+    },
+    "timers": {
+        "run_time_remaining_sec": ("timers", "run_time_remaining_sec"),
+        "run_time_remaining_min": ("timers", "run_time_remaining_min")
+    }
+}
+
+
+def read_custom_addresses(plc, addresses: Set[str]) -> Dict[str, Any]:
+    """
+    Read the monitored custom addresses, in one batch when possible.
+
+    A single unreadable address fails the whole batch, so fall back to
+    reading them one by one and report the failing ones as None.
+    """
+    addresses = list(addresses)
+    if not addresses:
+        return {}
+    try:
+        return dict(zip(addresses, plc.getMemBatch(addresses)))
+    except Exception:
+        pass
+
+    custom_data = {}
+    for address in addresses:
+        try:
+            custom_data[address] = plc.getMem(address)
+        except Exception as e:
+            logger.debug("Failed to read custom address %s: %s", address, e)
+            custom_data[address] = None
+    return custom_data
+
+class SystemStatusStream(PLCStream):
+    """
+    PLCStream for /ws/system-status.
+
+    Adds PLC connection health and the monitored custom addresses to the
+    layout, and sends an error message to clients when a read fails.
+    """
+
+    def read_values(self) -> Dict[str, Any]:
+        plc = get_plc()
         return {
-            "timestamp": datetime.now().isoformat(),
-            "error": str(e),
+            **read_layout(plc, self.layout, self.names),
             "system": {
-                "plc_connected": False,
-                "communication_errors": 1,
-                "last_update": datetime.now().isoformat()
-            }
+                "plc_connected": plc.plc.get_connected() if hasattr(plc.plc, 'get_connected') else True,
+                "communication_errors": 0
+            },
+            # Include custom address monitoring data
+            "custom_addresses": read_custom_addresses(plc, manager.get_monitored_addresses())
+        }
+
+    def snapshot(self, values: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+        snapshot = super().snapshot(values, timestamp)
+        snapshot["system"] = {**values["system"], "last_update": timestamp}
+        return snapshot
+
+    def publish_error(self, error: Exception, failures: int, timestamp: str):
+        message = {
+            "timestamp": timestamp,
+            "error": str(error),
+            "communication_errors": failures,
+            "custom_addresses": {}  # Empty custom data on error
         }
+        self.broker.publish(message)
+        self.delta_broker.publish({"type": "error", **message})
+
+system_status_stream = SystemStatusStream("system status", SYSTEM_STATUS_FIELDS, interval=0.3, error_delay=1)
 
 @router.websocket("/ws/system-status")
 async def websocket_comprehensive_status(websocket: WebSocket):
@@ -245,161 +461,47 @@ async def websocket_comprehensive_status(websocket: WebSocket):
     This endpoint provides all PLC status bits and should be used by the frontend
     for real-time monitoring instead of polling HTTP endpoints.
     
-    Update frequency: 0.3 seconds for responsive UI updates and real-time interactions.
+    Read every 0.3 seconds for responsive UI updates; a message is sent when
+    anything changed.
     """
-    await manager.connect(websocket)
-    communication_errors = 0
-    
-    try:
-        while True:
-            # Check if this connection is still active
-            if websocket not in manager.active_connections:
-                logger.info("WebSocket connection no longer active, stopping data stream")
-                break
-                
-            # Pause if no clients are connected to reduce PLC load
-            if not manager.has_active_connections():
-                await asyncio.sleep(1.0)
-                continue
-                
-            try:
-                plc = get_plc()
-                
-                # Read custom addresses if any are being monitored
-                custom_data = {}
-                for address in manager.get_monitored_addresses():
-                    try:
-                        custom_data[address] = plc.getMem(address)
-                    except Exception as e:
-                        logger.debug(f"Failed to read custom address {address}: {e}")
-                        custom_data[address] = None
-                
-                # Collect comprehensive status
-                status_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "auth": {
-                        "show_password_screen": plc.getMem(Addresses.auth("show_password_screen")),
-                        "proceed_password": plc.getMem(Addresses.auth("proceed_password")),
-                        "back_password": plc.getMem(Addresses.auth("back_password")),
-                        "password_input": plc.getMem(Addresses.auth("password_input")),
-                        "proceed_status": plc.getMem(Addresses.auth("proceed_status")),
-                        "change_password_status": plc.getMem(Addresses.auth("change_password_status")),
-                        "admin_password": plc.getMem(Addresses.auth("admin_password")),
-                        "user_password": plc.getMem(Addresses.auth("user_password"))
-                    },
-                    "language": {
-                        "language_switch": plc.getMem(Addresses.language("language_switch")),
-                        "english_active": plc.getMem(Addresses.language("english_active")),
-                        "chinese_active": plc.getMem(Addresses.language("chinese_active"))
-                    },
-                    "control_panel": {
-                        "ac_state": plc.getMem(Addresses.control("ac_state")),
-                        "shutdown_status": plc.getMem(Addresses.control("shutdown_status")),
-                        "ceiling_lights_state": plc.getMem(Addresses.control("ceiling_light_state")),
-                        "reading_lights_state": plc.getMem(Addresses.control("reading_lights")),
-                        "door_lights_state": plc.getMem(Addresses.control("door_light")),
-                        "intercom_state": plc.getMem(Addresses.control("intercom_state"))
-                    },
-                    "pressure": {
-                        "setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                        "pressure_setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                        "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                        "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2"))
-                    },
-                    "session": {
-                        "equalise_state": plc.getMem(Addresses.session("equalise_state")),
-                        "pressuring_state": plc.getMem(Addresses.session("pressuring_state")),
-                        "stabilising_state": plc.getMem(Addresses.session("stabilising_state")),
-                        "depressurise_state": plc.getMem(Addresses.session("depressurise_state")),
-                        "running_state": plc.getMem(Addresses.session("running_state")),
-                        "stop_state": plc.getMem(Addresses.session("stop_state")),
-                        "depressurisation_confirm": plc.getMem(Addresses.session("depressurisation_confirm"))
-                    },
-                    "modes": {
-                        "mode_rest": plc.getMem(Addresses.modes("mode_rest")),
-                        "mode_health": plc.getMem(Addresses.modes("mode_health")),
-                        "mode_professional": plc.getMem(Addresses.modes("mode_professional")),
-                        "mode_custom": plc.getMem(Addresses.modes("mode_custom")),
-                        "mode_o2_100": plc.getMem(Addresses.modes("mode_o2_100")),
-                        "mode_o2_120": plc.getMem(Addresses.modes("mode_o2_120")),
-                        "set_duration": plc.getMem(Addresses.modes("set_duration")),
-                        "compression_beginner": plc.getMem(Addresses.modes("compression_beginner")),
-                        "compression_normal": plc.getMem(Addresses.modes("compression_normal")),
-                        "compression_fast": plc.getMem(Addresses.modes("compression_fast")),
-                        "continuous_o2_flag": plc.getMem(Addresses.modes("continuous_o2_flag")),
-                        "intermittent_o2_flag": plc.getMem(Addresses.modes("intermittent_o2_flag")),
-                        "continuous_o2_selection": plc.getMem(Addresses.modes("continuous_o2_selection")),
-                        "intermittent_o2_selection": plc.getMem(Addresses.modes("intermittent_o2_selection"))
-                    },
-                    "climate": {
-                        "ac_auto": plc.getMem(Addresses.temperature("ac_auto")),
-                        "ac_low": plc.getMem(Addresses.temperature("ac_low")),
-                        "ac_mid": plc.getMem(Addresses.temperature("ac_mid")),
-                        "ac_high": plc.getMem(Addresses.temperature("ac_high")),
-                        "temperature_setpoint": plc.getMem(Addresses.temperature("temperature_setpoint")),
-                        "heating_cooling_toggle": plc.getMem(Addresses.temperature("heating_cooling_toggle"))
-                    },
-                    "sensors": {
-                        "current_temperature": plc.getMem(Addresses.sensors("current_temperature")),
-                        "current_humidity": plc.getMem(Addresses.sensors("current_humidity")),
-                        "ambient_o2": plc.getMem(Addresses.sensors("ambient_o2")),
-                        "ambient_o2_2": plc.getMem(Addresses.sensors("ambient_o2_2")),
-                        "ambient_o2_check_flag": plc.getMem(Addresses.sensors("ambient_o2_check_flag"))
-                    },
-                    "calibration": {
-                        "pressure_sensor_calibration": plc.getMem(Addresses.calibration("pressure_sensor_calibration")),
-                        "oxygen_sensor_calibration": plc.getMem(Addresses.calibration("oxygen_sensor_calibration"))
-                    },
-                    "manual": {
-                        "manual_mode": plc.getMem(Addresses.manual("manual_mode"))
-                    },
-                    "timers": {
-                        "run_time_remaining_sec": plc.getMem(Addresses.timers("run_time_remaining_sec")),
-                        "run_time_remaining_min": plc.getMem(Addresses.timers("run_time_remaining_min"))
-                    },
-                    "system": {
-                        "plc_connected": plc.plc.get_connected() if hasattr(plc.plc, 'get_connected') else True,
-                        "communication_errors": communication_errors,
-                        "last_update": datetime.now().isoformat()
-                    },
-                    # Include custom address monitoring data
-                    "custom_addresses": custom_data
-                }
-                
-                await websocket.send_json(status_data)
-                communication_errors = 0  # Reset error counter on successful read
-                
-            except Exception as e:
-                communication_errors += 1
-                logger.error(f"WebSocket communication error {communication_errors}: {e}")
-                
-                # Send error status
-                error_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "error": str(e),
-                    "communication_errors": communication_errors,
-                    "custom_addresses": {}  # Empty custom data on error
-                }
-                
-                try:
-                    await websocket.send_json(error_data)
-                except:
-                    logger.error("Failed to send error data through WebSocket")
-                    break
-                
-                # If too many errors, break the connection
-                if communication_errors > 10:
-                    logger.error("Too many communication errors, closing WebSocket")
-                    break
-            
-            await asyncio.sleep(0.3)  # 300ms update rate
-            
-    except WebSocketDisconnect:
-        logger.info("WebSocket connection closed by client")
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-    finally:
-        manager.disconnect(websocket)
+    await serve_stream(websocket, system_status_stream)
+
+@router.websocket("/api/status/system/ws")
+async def websocket_system_status_deltas(websocket: WebSocket):
+    """
+    /ws/system-status in delta mode, for clients pushed from /api/status/system.
+
+    Shares the system status stream's reader with /ws/system-status.
+    """
+    await serve_stream(websocket, system_status_stream, deltas=True)
+
+# Response key -> (category, function) pushed by /ws/critical-status
+CRITICAL_STATUS_FIELDS = {
+    "pressure": {
+        "setpoint": ("pressure_control", "pressure_setpoint"),
+        "internal_pressure_1": ("pressure_control", "internal_pressure_1"),
+        "internal_pressure_2": ("pressure_control", "internal_pressure_2")
+    },
+    "session": {
+        "running_state": ("session_control", "running_state"),
+        "pressuring_state": ("session_control", "pressuring_state"),
+        "stabilising_state": ("session_control", "stabilising_state"),
+        "depressurise_state": ("session_control", "depressurise_state"),
+        "equalise_state": ("session_control", "equalise_state")
+    },
+    "safety": {
+        "ambient_o2": ("sensors", "ambient_o2"),
+        "ambient_o2_2": ("sensors", "ambient_o2_2"),
+        "ambient_o2_check_flag": ("sensors", "ambient_o2_check_flag")
+    },
+    "timers": {
+        "run_time_remaining_sec": ("timers", "run_time_remaining_sec"),
+        "run_time_remaining_min": ("timers", "run_time_remaining_min")
+    }
+}
+
+# Ultra-high frequency updates for critical safety data
+critical_status_stream = PLCStream("critical status", CRITICAL_STATUS_FIELDS, interval=0.2, error_delay=2)
 
 @router.websocket("/ws/critical-status")
 async def websocket_critical_status(websocket: WebSocket):
@@ -407,181 +509,76 @@ async def websocket_critical_status(websocket: WebSocket):
     Ultra-high-frequency WebSocket endpoint for critical safety status.
     Updates every 200ms for pressure, session state, and safety-critical data.
     """
-    await manager.connect(websocket)
-    
-    try:
-        while True:
-            # Check if this connection is still active
-            if websocket not in manager.active_connections:
-                logger.info("Critical status WebSocket connection no longer active, stopping data stream")
-                break
-                
-            try:
-                plc = get_plc()
-                critical_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "pressure": {
-                        "setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                        "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                        "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2"))
-                    },
-                    "session": {
-                        "running_state": plc.getMem(Addresses.session("running_state")),
-                        "pressuring_state": plc.getMem(Addresses.session("pressuring_state")),
-                        "stabilising_state": plc.getMem(Addresses.session("stabilising_state")),
-                        "depressurise_state": plc.getMem(Addresses.session("depressurise_state")),
-                        "equalise_state": plc.getMem(Addresses.session("equalise_state"))
-                    },
-                    "safety": {
-                        "ambient_o2": plc.getMem(Addresses.sensors("ambient_o2")),
-                        "ambient_o2_2": plc.getMem(Addresses.sensors("ambient_o2_2")),
-                        "ambient_o2_check_flag": plc.getMem(Addresses.sensors("ambient_o2_check_flag"))
-                    },
-                    "timers": {
-                        "run_time_remaining_sec": plc.getMem(Addresses.timers("run_time_remaining_sec")),
-                        "run_time_remaining_min": plc.getMem(Addresses.timers("run_time_remaining_min"))
-                    }
-                }
-                
-                await manager.send_personal_message(json.dumps(critical_data), websocket)
-                
-                # Ultra-high frequency updates for critical safety data
-                await asyncio.sleep(0.2)
-                
-            except Exception as e:
-                logger.error(f"Error in critical status WebSocket: {e}")
-                await asyncio.sleep(2)
-                
-    except WebSocketDisconnect:
-        pass  # Normal disconnection
-    finally:
-        manager.disconnect(websocket)
-        logger.info(f"Critical status WebSocket stream ended. Remaining connections: {manager.get_connection_count()}")
+    await serve_stream(websocket, critical_status_stream)
 
 # Keep existing specialized endpoints for backward compatibility
+
+# Response key -> (category, function) pushed by /ws/live-data
+LIVE_DATA_FIELDS = {
+    "sensors": {
+        "current_temp": ("sensors", "current_temperature"),
+        "current_humidity": ("sensors", "current_humidity"),
+        "ambient_o2": ("sensors", "ambient_o2"),
+        "ambient_o2_2": ("sensors", "ambient_o2_2"),
+        "internal_pressure_1": ("pressure_control", "internal_pressure_1"),
+        "internal_pressure_2": ("pressure_control", "internal_pressure_2")
+    },
+    "status": {
+        "session_running": ("session_control", "running_state"),
+        "pressuring": ("session_control", "pressuring_state"),
+        "stabilising": ("session_control", "stabilising_state"),
+        "depressurising": ("session_control", "depressurise_state"),
+        "equalising": ("session_control", "equalise_state"),
+        "ac_state": ("control_panel", "ac_state"),
+        "ambient_o2_check": ("sensors", "ambient_o2_check_flag")
+    },
+    "timers": {
+        "run_time_remaining_sec": ("timers", "run_time_remaining_sec"),
+        "run_time_remaining_min": ("timers", "run_time_remaining_min")
+    },
+    "setpoints": {
+        "pressure": ("pressure_control", "pressure_setpoint"),
+        "temperature": ("temperature_control", "temperature_setpoint")
+    }
+}
+
+live_data_stream = PLCStream("live data", LIVE_DATA_FIELDS, interval=1, error_delay=5)
+
 @router.websocket("/ws/live-data")
 async def websocket_live_data(websocket: WebSocket):
     """Legacy endpoint - consider using /ws/system-status instead"""
-    await manager.connect(websocket)
-    try:
-        while True:
-            # Check if this connection is still active
-            if websocket not in manager.active_connections:
-                logger.info("Live data WebSocket connection no longer active, stopping data stream")
-                break
-                
-            try:
-                plc = get_plc()
-                live_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "sensors": {
-                        "current_temp": plc.getMem(Addresses.sensors("current_temperature")),
-                        "current_humidity": plc.getMem(Addresses.sensors("current_humidity")),
-                        "ambient_o2": plc.getMem(Addresses.sensors("ambient_o2")),
-                        "ambient_o2_2": plc.getMem(Addresses.sensors("ambient_o2_2")),
-                        "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                        "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2"))
-                    },
-                    "status": {
-                        "session_running": plc.getMem(Addresses.session("running_state")),
-                        "pressuring": plc.getMem(Addresses.session("pressuring_state")),
-                        "stabilising": plc.getMem(Addresses.session("stabilising_state")),
-                        "depressurising": plc.getMem(Addresses.session("depressurise_state")),
-                        "equalising": plc.getMem(Addresses.session("equalise_state")),
-                        "ac_state": plc.getMem(Addresses.control("ac_state")),
-                        "ambient_o2_check": plc.getMem(Addresses.sensors("ambient_o2_check_flag"))
-                    },
-                    "timers": {
-                        "run_time_remaining_sec": plc.getMem(Addresses.timers("run_time_remaining_sec")),
-                        "run_time_remaining_min": plc.getMem(Addresses.timers("run_time_remaining_min"))
-                    },
-                    "setpoints": {
-                        "pressure": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                        "temperature": plc.getMem(Addresses.temperature("temperature_setpoint"))
-                    }
-                }
-                
-                await manager.send_personal_message(json.dumps(live_data), websocket)
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error reading live data: {e}")
-                await asyncio.sleep(5)
-                
-    except WebSocketDisconnect:
-        pass  # Normal disconnection
-    finally:
-        manager.disconnect(websocket)
-        logger.info(f"Live data WebSocket stream ended. Remaining connections: {manager.get_connection_count()}")
+    await serve_stream(websocket, live_data_stream)
+
+# Response key -> (category, function) pushed by /ws/pressure
+PRESSURE_DATA_FIELDS = {
+    "setpoint": ("pressure_control", "pressure_setpoint"),
+    "internal_pressure_1": ("pressure_control", "internal_pressure_1"),
+    "internal_pressure_2": ("pressure_control", "internal_pressure_2"),
+    "pressuring_state": ("session_control", "pressuring_state"),
+    "stabilising_state": ("session_control", "stabilising_state"),
+    "depressurise_state": ("session_control", "depressurise_state"),
+    "equalise_state": ("session_control", "equalise_state")
+}
+
+pressure_stream = PLCStream("pressure", PRESSURE_DATA_FIELDS, interval=0.5, error_delay=2)
 
 @router.websocket("/ws/pressure")
 async def websocket_pressure_data(websocket: WebSocket):
     """WebSocket endpoint specifically for pressure data"""
-    await manager.connect(websocket)
-    try:
-        while True:
-            # Check if this connection is still active
-            if websocket not in manager.active_connections:
-                logger.info("Pressure WebSocket connection no longer active, stopping data stream")
-                break
-                
-            try:
-                plc = get_plc()
-                pressure_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "setpoint": plc.getMem(Addresses.pressure("pressure_setpoint")),
-                    "internal_pressure_1": plc.getMem(Addresses.pressure("internal_pressure_1")),
-                    "internal_pressure_2": plc.getMem(Addresses.pressure("internal_pressure_2")),
-                    "pressuring_state": plc.getMem(Addresses.session("pressuring_state")),
-                    "stabilising_state": plc.getMem(Addresses.session("stabilising_state")),
-                    "depressurise_state": plc.getMem(Addresses.session("depressurise_state")),
-                    "equalise_state": plc.getMem(Addresses.session("equalise_state"))
-                }
-                
-                await manager.send_personal_message(json.dumps(pressure_data), websocket)
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Error reading pressure data: {e}")
-                await asyncio.sleep(2)
-                
-    except WebSocketDisconnect:
-        pass  # Normal disconnection
-    finally:
-        manager.disconnect(websocket)
-        logger.info(f"Pressure WebSocket stream ended. Remaining connections: {manager.get_connection_count()}")
+    await serve_stream(websocket, pressure_stream)
+
+# Response key -> (category, function) pushed by /ws/sensors
+SENSOR_DATA_FIELDS = {
+    "temperature": ("sensors", "current_temperature"),
+    "humidity": ("sensors", "current_humidity"),
+    "ambient_o2": ("sensors", "ambient_o2"),
+    "ambient_o2_2": ("sensors", "ambient_o2_2"),
+    "ambient_o2_check": ("sensors", "ambient_o2_check_flag")
+}
+
+sensor_stream = PLCStream("sensors", SENSOR_DATA_FIELDS, interval=2, error_delay=5)
 
 @router.websocket("/ws/sensors")
 async def websocket_sensor_data(websocket: WebSocket):
     """WebSocket endpoint specifically for sensor readings"""
-    await manager.connect(websocket)
-    try:
-        while True:
-            # Check if this connection is still active
-            if websocket not in manager.active_connections:
-                logger.info("Sensors WebSocket connection no longer active, stopping data stream")
-                break
-                
-            try:
-                plc = get_plc()
-                sensor_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "temperature": plc.getMem(Addresses.sensors("current_temperature")),
-                    "humidity": plc.getMem(Addresses.sensors("current_humidity")),
-                    "ambient_o2": plc.getMem(Addresses.sensors("ambient_o2")),
-                    "ambient_o2_2": plc.getMem(Addresses.sensors("ambient_o2_2")),
-                    "ambient_o2_check": plc.getMem(Addresses.sensors("ambient_o2_check_flag"))
-                }
-                
-                await manager.send_personal_message(json.dumps(sensor_data), websocket)
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error reading sensor data: {e}")
-                await asyncio.sleep(5)
-                
-    except WebSocketDisconnect:
-        pass  # Normal disconnection
-    finally:
-        manager.disconnect(websocket)
-        logger.info(f"Sensors WebSocket stream ended. Remaining connections: {manager.get_connection_count()}") 
\ No newline at end of file
+    await serve_stream(websocket, sensor_stream)
@@ -5,6 +5,8 @@ This module contains all the API documentation metadata including tag descriptio
 and enhanced documentation for the FastAPI application.
 """
 
+import os
+
 # Enhanced API metadata and tag descriptions for better documentation
 tags_metadata = [
     {
@@ -258,18 +260,22 @@ def get_enhanced_fastapi_config(base_config: dict) -> dict:
     """
     Get enhanced FastAPI configuration with comprehensive metadata
     
+    Set API_DOCS_ENABLED=false (e.g. on the chamber controller) to serve no
+    OpenAPI schema or documentation UIs; the schema is then never built.
+    
     Args:
         base_config: Base FastAPI configuration from app_config
         
     Returns:
         Enhanced configuration dictionary
     """
+    docs_enabled = os.getenv("API_DOCS_ENABLED", "true").lower() == "true"
     return {
         **base_config,
         "openapi_tags": tags_metadata,
-        "openapi_url": "/openapi.json",
-        "docs_url": "/docs",
-        "redoc_url": "/redoc",
+        "openapi_url": "/openapi.json" if docs_enabled else None,
+        "docs_url": "/docs" if docs_enabled else None,
+        "redoc_url": "/redoc" if docs_enabled else None,
         "openapi_prefix": "",
         "swagger_ui_parameters": get_swagger_ui_parameters(),
         "redoc_ui_parameters": get_redoc_ui_parameters(),
@@ -5,7 +5,7 @@ This module provides SQLAlchemy models and database configuration for storing
 hyperbaric chamber session history, parameters, and real-time data.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.sql import func
@@ -17,11 +17,27 @@ import json
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hyperbaric_sessions.db")
 
+# Connection pool settings; connections are reused across requests instead
+# of being opened per session_service call
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+def _pool_options(url: str) -> Dict[str, Any]:
+    """Pool arguments for the engine (in-memory SQLite uses a single shared connection)"""
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/") == "sqlite:"):
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_pre_ping": True
+    }
+
 # Create engine
 engine = create_engine(
     DATABASE_URL, 
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-    echo=os.getenv("DB_ECHO", "false").lower() == "true"
+    echo=os.getenv("DB_ECHO", "false").lower() == "true",
+    **_pool_options(DATABASE_URL)
 )
 
 # Create session factory
@@ -35,6 +51,10 @@ class Session(Base):
     Main session record storing overall session information
     """
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Serves the status filter and the newest-first order of session history
+        Index("ix_sessions_status_start_time", "status", "start_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -43,7 +63,7 @@ class Session(Base):
     session_number = Column(Integer)  # Sequential session number
     
     # Timing information
-    start_time = Column(DateTime, nullable=False)
+    start_time = Column(DateTime, nullable=False, index=True)
     end_time = Column(DateTime, nullable=True)
     planned_duration_minutes = Column(Integer, nullable=True)
     actual_duration_seconds = Column(Integer, nullable=True)
@@ -227,6 +247,11 @@ def init_database():
     Initialize database tables
     """
     Base.metadata.create_all(bind=engine)
+    
+    # create_all only indexes tables it creates; add indexes introduced since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 def get_database_info():
     """
@@ -235,5 +260,6 @@ def get_database_info():
     return {
         "database_url": DATABASE_URL,
         "engine": str(engine),
+        "pool": engine.pool.status(),
         "tables": [table.name for table in Base.metadata.tables.values()]
     } 
\ No newline at end of file
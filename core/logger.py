@@ -8,9 +8,10 @@ all modules and classes in the application.
 import logging
 import logging.handlers
 import os
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 class LoggerConfig:
@@ -84,6 +85,7 @@ def setup_logger(
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
         console_handler.setLevel(level)
+        console_handler.addFilter(_context_filter)
         logger.addHandler(console_handler)
     
     # File handler
@@ -103,6 +105,7 @@ def setup_logger(
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(level)
+        file_handler.addFilter(_context_filter)
         logger.addHandler(file_handler)
     
     # Prevent propagation to root logger to avoid duplicate messages
@@ -127,10 +130,32 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
+# Context attributes for log records created in the current thread/task
+_log_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("log_context", default=None)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the active ContextLogger context onto records (explicit extra= wins)."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        if context:
+            for key, value in context.items():
+                record.__dict__.setdefault(key, value)
+        return True
+
+
+_context_filter = ContextFilter()
+
+
 class ContextLogger:
     """
     Context manager for adding context to log messages.
     
+    The context is bound per thread/asyncio task, so concurrent requests do
+    not see each other's context. Nothing is bound when the logger does not
+    emit INFO messages.
+    
     Example:
         with ContextLogger(logger, operation="PLC_READ", address="VX0.0"):
             logger.info("Starting operation")  # Will include context
@@ -139,22 +164,18 @@ class ContextLogger:
     def __init__(self, logger: logging.Logger, **context):
         self.logger = logger
         self.context = context
-        self.old_factory = None
+        self.token = None
     
     def __enter__(self):
-        self.old_factory = logging.getLogRecordFactory()
-        
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            for key, value in self.context.items():
-                setattr(record, key, value)
-            return record
-        
-        logging.setLogRecordFactory(record_factory)
+        if self.logger.isEnabledFor(logging.INFO):
+            parent = _log_context.get()
+            self.token = _log_context.set({**parent, **self.context} if parent else self.context)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        logging.setLogRecordFactory(self.old_factory)
+        if self.token is not None:
+            _log_context.reset(self.token)
+            self.token = None
 
 
 def log_performance(logger: logging.Logger, operation: str):
@@ -7,9 +7,9 @@ retrieving session history.
 """
 
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import desc, func, and_, or_
+from sqlalchemy import desc, func, and_, or_, insert, case
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 import uuid
 import json
 from statistics import mean
@@ -41,6 +41,42 @@ class SessionService:
         """
         Create a new session record
         
+        Returns:
+            int: Session ID of the created session
+        """
+        return self.create_session_with_initial_logs(
+            treatment_mode=treatment_mode,
+            compression_mode=compression_mode,
+            oxygen_mode=oxygen_mode,
+            target_pressure_ata=target_pressure_ata,
+            target_temperature_c=target_temperature_c,
+            planned_duration_minutes=planned_duration_minutes,
+            patient_id=patient_id,
+            operator_notes=operator_notes,
+            parameters=initial_parameters
+        )
+    
+    def create_session_with_initial_logs(self,
+                                         treatment_mode: Optional[str] = None,
+                                         compression_mode: Optional[str] = None,
+                                         oxygen_mode: Optional[str] = None,
+                                         target_pressure_ata: Optional[float] = None,
+                                         target_temperature_c: Optional[float] = None,
+                                         planned_duration_minutes: Optional[int] = None,
+                                         patient_id: Optional[str] = None,
+                                         operator_notes: Optional[str] = None,
+                                         parameters: Optional[Dict[str, Any]] = None,
+                                         events: Optional[List[Dict[str, Any]]] = None) -> int:
+        """
+        Create a new session together with its initial parameters and events
+        
+        The session row, its parameters, the session_started event and any
+        extra events are written in a single transaction with one commit.
+        
+        Args:
+            parameters: Dict of parameter name -> value pairs to log
+            events: Extra events, each a dict of log_session_event() keyword arguments
+        
         Returns:
             int: Session ID of the created session
         """
@@ -67,28 +103,34 @@ class SessionService:
             )
             
             db.add(session)
+            # Assign the session ID without committing yet
+            db.flush()
+            
+            # Log initial parameters if provided (one multi-row insert)
+            if parameters:
+                db.execute(insert(SessionParameter), self._build_parameters(session.id, parameters))
+            
+            # Log session start event followed by any extra events
+            start_event = {
+                "event_type": "state_change",
+                "event_category": "session",
+                "event_name": "session_started",
+                "event_description": f"Session {session.session_number} started with mode: {treatment_mode}",
+                "severity": "info"
+            }
+            db.execute(insert(SessionEvent), [
+                self._build_event(session.id, elapsed_seconds=0, **event)
+                for event in [start_event] + (events or [])
+            ])
+            
             db.commit()
-            db.refresh(session)
             
             # Store current session info
             self.current_session_id = session.id
             self.session_start_time = session.start_time
             
-            # Log initial parameters if provided
-            if initial_parameters:
-                self.log_session_parameters(session.id, initial_parameters)
-            
-            # Log session start event
-            self.log_session_event(
-                session.id,
-                event_type="state_change",
-                event_category="session",
-                event_name="session_started",
-                event_description=f"Session {session.session_number} started with mode: {treatment_mode}",
-                severity="info"
-            )
-            
-            logger.info(f"Created new session {session.session_number} (ID: {session.id})")
+            logger.info(f"Created new session {session.session_number} (ID: {session.id}) "
+                        f"with {len(parameters or {})} parameters and {1 + len(events or [])} events")
             return session.id
             
         except Exception as e:
@@ -280,16 +322,16 @@ class SessionService:
             if self.session_start_time:
                 elapsed_seconds = int((datetime.now() - self.session_start_time).total_seconds())
             
-            event = SessionEvent(
-                session_id=session_id,
+            event = SessionEvent(**self._build_event(
+                session_id,
                 event_type=event_type,
                 event_category=event_category,
                 event_name=event_name,
                 event_description=event_description,
                 severity=severity,
-                event_data_json=json.dumps(event_data) if event_data else None,
-                session_elapsed_seconds=elapsed_seconds
-            )
+                event_data=event_data,
+                elapsed_seconds=elapsed_seconds
+            ))
             
             db.add(event)
             db.commit()
@@ -315,23 +357,13 @@ class SessionService:
         Returns:
             bool: True if logged successfully
         """
+        # An empty executemany would insert a single row of NULLs
+        if not parameters:
+            return True
+        
         db = SessionLocal()
         try:
-            for param_name, param_value in parameters.items():
-                # Determine parameter type and category
-                param_type = self._get_parameter_type(param_value)
-                category = self._get_parameter_category(param_name)
-                
-                parameter = SessionParameter(
-                    session_id=session_id,
-                    parameter_name=param_name,
-                    parameter_value=str(param_value),
-                    parameter_type=param_type,
-                    category=category
-                )
-                
-                db.add(parameter)
-            
+            db.execute(insert(SessionParameter), self._build_parameters(session_id, parameters))
             db.commit()
             logger.info(f"Logged {len(parameters)} parameters for session {session_id}")
             return True
@@ -365,14 +397,7 @@ class SessionService:
         db = SessionLocal()
         try:
             query = db.query(Session).order_by(desc(Session.start_time))
-            
-            # Apply filters
-            if status_filter:
-                query = query.filter(Session.status == status_filter)
-            if date_from:
-                query = query.filter(Session.start_time >= date_from)
-            if date_to:
-                query = query.filter(Session.start_time <= date_to)
+            query = self._filter_sessions(query, status_filter, date_from, date_to)
             
             # Apply pagination
             sessions = query.offset(offset).limit(limit).all()
@@ -382,6 +407,84 @@ class SessionService:
         finally:
             db.close()
     
+    def count_sessions(self,
+                       status_filter: Optional[str] = None,
+                       date_from: Optional[datetime] = None,
+                       date_to: Optional[datetime] = None) -> int:
+        """
+        Count sessions matching the same filters as get_session_history
+        
+        Returns:
+            Number of matching sessions
+        """
+        db = SessionLocal()
+        try:
+            query = db.query(func.count(Session.id))
+            query = self._filter_sessions(query, status_filter, date_from, date_to)
+            return query.scalar()
+            
+        finally:
+            db.close()
+    
+    def _filter_sessions(self, query, status_filter: Optional[str],
+                         date_from: Optional[datetime], date_to: Optional[datetime]):
+        """Apply the session history filters to a query"""
+        if status_filter:
+            query = query.filter(Session.status == status_filter)
+        if date_from:
+            query = query.filter(Session.start_time >= date_from)
+        if date_to:
+            query = query.filter(Session.start_time <= date_to)
+        return query
+    
+    def get_statistics_summary(self, recent_since: datetime) -> Dict[str, Any]:
+        """
+        Get aggregate statistics over all sessions
+        
+        Counting and averaging run inside the database, so no session rows
+        are loaded.
+        
+        Args:
+            recent_since: Sessions started at or after this time count as recent
+            
+        Returns:
+            Statistics dictionary
+        """
+        db = SessionLocal()
+        try:
+            total_sessions, recent_sessions = db.query(
+                func.count(Session.id),
+                func.count(case((Session.start_time >= recent_since, 1)))
+            ).one()
+            
+            status_counts = dict(
+                db.query(Session.status, func.count(Session.id)).group_by(Session.status).all()
+            )
+            mode_counts = dict(
+                db.query(Session.treatment_mode, func.count(Session.id)).group_by(Session.treatment_mode).all()
+            )
+            
+            # Sessions with a recorded, non-zero duration count as completed
+            completed_sessions, avg_duration_seconds = db.query(
+                func.count(Session.id),
+                func.avg(Session.actual_duration_seconds)
+            ).filter(Session.actual_duration_seconds != 0).one()
+            avg_duration_seconds = avg_duration_seconds or 0
+            
+            return {
+                "total_sessions": total_sessions,
+                "recent_sessions_30_days": recent_sessions,
+                "status_distribution": status_counts,
+                "mode_distribution": mode_counts,
+                "average_duration_seconds": round(avg_duration_seconds),
+                "average_duration_minutes": round(avg_duration_seconds / 60, 1),
+                "completed_sessions": completed_sessions,
+                "completion_rate": round(completed_sessions / total_sessions * 100, 1) if total_sessions > 0 else 0
+            }
+            
+        finally:
+            db.close()
+    
     def get_session_details(self, session_id: int, include_data_points: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get detailed session information
@@ -416,34 +519,50 @@ class SessionService:
             result["events"] = [event.to_dict() for event in session.events]
             
             if include_data_points:
-                result["data_points"] = [
-                    {
-                        "recorded_at": dp.recorded_at.isoformat(),
-                        "elapsed_seconds": dp.session_elapsed_seconds,
-                        "pressure_1": dp.internal_pressure_1_ata,
-                        "pressure_2": dp.internal_pressure_2_ata,
-                        "pressure_setpoint": dp.pressure_setpoint_ata,
-                        "temperature": dp.temperature_c,
-                        "humidity": dp.humidity_percent,
-                        "oxygen_1": dp.oxygen_sensor_1_percent,
-                        "oxygen_2": dp.oxygen_sensor_2_percent,
-                        "session_state": dp.session_state,
-                        "ac_status": dp.ac_status,
-                        "ceiling_lights": dp.ceiling_lights_status,
-                        "reading_lights": dp.reading_lights_status,
-                        "intercom": dp.intercom_status
-                    }
-                    for dp in session.data_points
-                ]
+                result["data_points"] = [self._data_point_to_dict(dp) for dp in session.data_points]
             else:
                 # Include summary statistics
-                result["data_points_count"] = len(session.data_points)
+                result["data_points_count"] = db.query(func.count(SessionDataPoint.id)).filter(
+                    SessionDataPoint.session_id == session_id
+                ).scalar()
             
             return result
             
         finally:
             db.close()
     
+    def iter_data_points(self, session_id: int, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over a session's data points in batches
+        
+        Rows are fetched from a server-side cursor batch_size at a time, so a
+        long session is never loaded into memory at once.
+        
+        Args:
+            session_id: Session ID
+            batch_size: Number of data points per batch
+            
+        Yields:
+            Lists of data point dictionaries, in recording order
+        """
+        db = SessionLocal()
+        try:
+            query = db.query(SessionDataPoint).filter(
+                SessionDataPoint.session_id == session_id
+            ).order_by(SessionDataPoint.id).execution_options(stream_results=True).yield_per(batch_size)
+            
+            batch = []
+            for dp in query:
+                batch.append(self._data_point_to_dict(dp))
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+                
+        finally:
+            db.close()
+    
     def get_current_session(self) -> Optional[Dict[str, Any]]:
         """
         Get the current active session
@@ -455,6 +574,25 @@ class SessionService:
             return self.get_session_details(self.current_session_id)
         return None
     
+    def _data_point_to_dict(self, dp: SessionDataPoint) -> Dict[str, Any]:
+        """Convert a data point to its session details representation"""
+        return {
+            "recorded_at": dp.recorded_at.isoformat(),
+            "elapsed_seconds": dp.session_elapsed_seconds,
+            "pressure_1": dp.internal_pressure_1_ata,
+            "pressure_2": dp.internal_pressure_2_ata,
+            "pressure_setpoint": dp.pressure_setpoint_ata,
+            "temperature": dp.temperature_c,
+            "humidity": dp.humidity_percent,
+            "oxygen_1": dp.oxygen_sensor_1_percent,
+            "oxygen_2": dp.oxygen_sensor_2_percent,
+            "session_state": dp.session_state,
+            "ac_status": dp.ac_status,
+            "ceiling_lights": dp.ceiling_lights_status,
+            "reading_lights": dp.reading_lights_status,
+            "intercom": dp.intercom_status
+        }
+    
     def _calculate_session_statistics(self, db: DBSession, session: Session):
         """Calculate session statistics from data points"""
         data_points = db.query(SessionDataPoint).filter(
@@ -480,6 +618,40 @@ class SessionService:
         if oxygen_readings:
             session.avg_oxygen_percent = mean(oxygen_readings)
     
+    def _build_parameters(self, session_id: int, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build parameter rows with their type and category for a bulk insert"""
+        return [
+            {
+                "session_id": session_id,
+                "parameter_name": param_name,
+                "parameter_value": str(param_value),
+                "parameter_type": self._get_parameter_type(param_value),
+                "category": self._get_parameter_category(param_name)
+            }
+            for param_name, param_value in parameters.items()
+        ]
+    
+    def _build_event(self,
+                     session_id: int,
+                     event_type: str,
+                     event_category: str,
+                     event_name: str,
+                     event_description: Optional[str] = None,
+                     severity: str = "info",
+                     event_data: Optional[Dict[str, Any]] = None,
+                     elapsed_seconds: Optional[int] = None) -> Dict[str, Any]:
+        """Build an event row"""
+        return {
+            "session_id": session_id,
+            "event_type": event_type,
+            "event_category": event_category,
+            "event_name": event_name,
+            "event_description": event_description,
+            "severity": severity,
+            "event_data_json": json.dumps(event_data) if event_data else None,
+            "session_elapsed_seconds": elapsed_seconds
+        }
+    
     def _get_parameter_type(self, value: Any) -> str:
         """Determine parameter type from value"""
         if isinstance(value, bool):
@@ -10,9 +10,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import asyncio
 import time
 import os
+import sys
 import socket
+import importlib.util
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
@@ -22,6 +25,9 @@ from core.logger import setup_logger, ContextLogger
 from core.app_config import get_fastapi_config, get_root_response, get_health_response, get_version, get_name
 from core.database import init_database
 from core.api_metadata import get_enhanced_fastapi_config
+from api.stream_routes import run_status_poller
+from api.http_routes import run_system_status_poller
+from api.shared import status_cache, command_queue, PydanticJSONResponse
 
 # Load environment variables
 load_dotenv()
@@ -50,6 +56,20 @@ def get_local_ip():
         except Exception:
             return "localhost"
 
+def get_server_backends():
+    """
+    Select the event loop and HTTP parser for uvicorn.
+    
+    uvloop and httptools (both pulled in by uvicorn[standard]) replace the
+    pure-Python asyncio selector loop and h11 parser. uvloop does not support
+    Windows, so fall back to the defaults there or when they are missing.
+    """
+    loop = "asyncio"
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop"):
+        loop = "uvloop"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return loop, http
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
@@ -59,17 +79,42 @@ async def lifespan(app: FastAPI):
     logger.info(f"✅ {app_name} v{version} - Application startup")
     logger.info(f"🏷️  Environment: {os.getenv('ENVIRONMENT', 'development')}")
     logger.info(f"🔌 PLC IP: {os.getenv('PLC_IP', 'not configured')}")
+    # Logs the loop actually running, e.g. when started via the uvicorn CLI
+    logger.info(f"⚡ Event loop: {type(asyncio.get_running_loop()).__module__}")
     
     # Initialize database
     init_database()
     logger.info("💾 Database initialized")
     
+    # Start the shared PLC poller behind /api/stream
+    stream_task = asyncio.create_task(run_status_poller())
+    
+    # Keep /api/status/system warm while it is being polled
+    system_status_task = asyncio.create_task(run_system_status_poller())
+    
+    # Start the background writer for queued PLC commands
+    command_task = asyncio.create_task(command_queue.run())
+    
     yield
     
     # Shutdown
     logger.info("=" * 60)
     logger.info(f"🔄 {app_name} - Graceful shutdown initiated")
     
+    for task in (stream_task, system_status_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    
+    command_task.cancel()
+    try:
+        await command_task
+    except asyncio.CancelledError:
+        pass
+    await command_queue.flush()
+    
     # Clean up PLC connections if needed
     try:
         from api.shared import plc_instance
@@ -89,7 +134,7 @@ fastapi_config = get_fastapi_config()
 enhanced_config = get_enhanced_fastapi_config(fastapi_config)
 
 # Create FastAPI app with enhanced configuration and lifespan
-app = FastAPI(**enhanced_config, lifespan=lifespan)
+app = FastAPI(**enhanced_config, lifespan=lifespan, default_response_class=PydanticJSONResponse)
 
 # Add middleware
 app.add_middleware(GZipMiddleware, minimum_size=1000)
@@ -123,6 +168,15 @@ async def log_requests(request: Request, call_next):
         
         return response
 
+# Status cache invalidation middleware
+@app.middleware("http")
+async def invalidate_status_cache(request: Request, call_next):
+    response = await call_next(request)
+    # Any write may change PLC state, so cached status responses are stale
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        status_cache.clear()
+    return response
+
 # Include API routes
 app.include_router(api_router, prefix="", tags=["api"])
 
@@ -138,7 +192,9 @@ async def health_check():
     """Health check endpoint"""
     try:
         # You could add PLC connectivity check here
-        return get_health_response()
+        response = get_health_response()
+        response["plc_commands"] = command_queue.status()
+        return response
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return JSONResponse(
@@ -190,7 +246,11 @@ if __name__ == "__main__":
         logger.info(f"   • http://{local_ip}:{port}")
         logger.info(f"📱 Mobile/Device access: http://{local_ip}:{port}")
     
+    # Single worker only: each process would open its own PLC connection
+    loop, http = get_server_backends()
+    
     logger.info(f"🔧 Debug mode: {'ON' if debug else 'OFF'}")
+    logger.info(f"⚡ Event loop: {loop}, HTTP parser: {http}")
     logger.info("=" * 60)
     
     uvicorn.run(
@@ -198,5 +258,13 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=debug,
+        loop=loop,
+        http=http,
+        # Drop the Server header from every response; TCP_NODELAY is already
+        # set on accepted sockets by both asyncio and uvloop
+        server_header=False,
+        # Compress WebSocket frames for clients that offer permessage-deflate;
+        # the repeated keys of the stream payloads compress well
+        ws_per_message_deflate=True,
         log_level="info"
     )
@@ -1,10 +1,16 @@
+import struct
 import threading
 import time
 import os
+from ctypes import POINTER, byref, c_int32, c_uint8, cast
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
 from dotenv import load_dotenv
 
 import snap7
 from snap7 import Area
+from snap7.error import check_error
+from snap7.type import S7DataItem, WordLen
 from snap7.util import (
     get_bool,
     get_dword,
@@ -26,9 +32,328 @@ class OutputType:
     DWORD = 4
 
 
+class AddressSpec(NamedTuple):
+    """Parsed location and data type of a PLC memory address."""
+    address: str
+    area: Area
+    db_number: int
+    start: int
+    length: int
+    out_type: Optional[int]
+    bit: int
+
+
+def translate_alias(mem: str) -> str:
+    """Translate memory aliases (M, VD, VW) to their standard format."""
+    mem = mem.upper()
+    if mem.startswith("M") and "." in mem:
+        byte, bit = mem[1:].split(".")
+        return f"VX{byte}.{bit}"
+    if mem.startswith("VD"):
+        return f"DB1.DBD{mem[2:]}"
+    if mem.startswith("VW"):
+        return f"DB1.DBW{mem[2:]}"
+    return mem
+
+
+def resolve_area(mem: str) -> Area:
+    """Resolve the snap7 memory area from an address string."""
+    mem_lower = mem.lower()
+    if mem_lower.startswith("db"):
+        return Area.DB
+    if mem_lower.startswith("ai") or mem_lower.startswith("iw"):
+        return Area.PE
+    if mem_lower.startswith("aq") or mem_lower.startswith("qw"):
+        return Area.PA
+    if mem_lower.startswith("q"):
+        return Area.PA
+    if mem_lower.startswith("i"):
+        return Area.PE
+    if mem_lower.startswith("v") or mem_lower.startswith("m"):
+        return Area.MK
+    raise ValueError(f"Unknown memory area for '{mem}'")
+
+
+@lru_cache(maxsize=1024)
+def parse_address(address: str) -> AddressSpec:
+    """
+    Parse a PLC address (e.g. 'M1.4', 'VD504', 'DB1.DBW0') into an AddressSpec.
+
+    Results are cached, so the string handling only happens once per address.
+    """
+    mem = translate_alias(address).lower()
+    length = 1
+    out_type = None
+    bit = 0
+    start = 0
+    db_number = 0
+
+    if mem.startswith("db"):
+        db_number = int(mem.split(".")[0][2:])
+        sub = mem.split(".")[1]
+
+        if sub.startswith("dbx"):
+            out_type = OutputType.BOOL
+            start = int(sub[3:].split(".")[0])
+            bit = int(mem.split(".")[2])
+        elif sub.startswith("dbb"):
+            out_type = OutputType.INT
+            start = int(sub[3:])
+        elif sub.startswith("dbw"):
+            out_type = OutputType.INT
+            start = int(sub[3:])
+            length = 2
+        elif sub.startswith("dbd"):
+            out_type = OutputType.REAL
+            start = int(sub[3:])
+            length = 4
+        area = Area.DB
+    else:
+        area = resolve_area(mem)
+
+        if mem[1] == "x":
+            out_type = OutputType.BOOL
+            start = int(mem[2:].split(".")[0])
+            bit = int(mem.split(".")[1])
+        elif mem[1] == "b":
+            out_type = OutputType.INT
+            start = int(mem[2:])
+        elif mem[1] == "w":
+            out_type = OutputType.INT
+            start = int(mem[2:])
+            length = 2
+        elif mem[1] == "d":
+            start = int(mem[2:])
+            length = 4
+            out_type = OutputType.REAL if mem.startswith("vd") else OutputType.DWORD
+        elif mem.startswith(("aiw", "aqw", "iw", "qw", "vw")):
+            start = int(mem[3:])
+            length = 2
+            out_type = OutputType.INT
+        elif mem.startswith("vd"):
+            start = int(mem[2:])
+            length = 4
+            out_type = OutputType.REAL
+
+    return AddressSpec(address, area, db_number, start, length, out_type, bit)
+
+
+def decode_value(spec: AddressSpec, data: bytearray):
+    """Decode raw bytes read from the PLC according to the address type."""
+    if spec.out_type == OutputType.BOOL:
+        return get_bool(data, 0, spec.bit)
+    if spec.out_type == OutputType.INT:
+        return get_int(data, 0)
+    if spec.out_type == OutputType.REAL:
+        return get_real(data, 0)
+    if spec.out_type == OutputType.DWORD:
+        return get_dword(data, 0)
+    return None
+
+
+# Big-endian layouts of the full-width S7 types
+INT_FORMAT = struct.Struct(">h")
+REAL_FORMAT = struct.Struct(">f")
+DWORD_FORMAT = struct.Struct(">I")
+
+
+def decode_buffer(spec: AddressSpec, buffer, offset: int = 0):
+    """
+    Decode a value straight from a receive buffer, starting at offset.
+
+    Works on the ctypes buffers of a MultiReadPlan without copying them into
+    a bytearray first, so steady-state polling does not allocate per value.
+    """
+    if spec.out_type == OutputType.BOOL:
+        return bool(buffer[offset] >> spec.bit & 1)
+    if spec.out_type == OutputType.INT:
+        return INT_FORMAT.unpack_from(buffer, offset)[0] if spec.length == 2 else buffer[offset]
+    if spec.out_type == OutputType.REAL:
+        return REAL_FORMAT.unpack_from(buffer, offset)[0]
+    if spec.out_type == OutputType.DWORD:
+        return DWORD_FORMAT.unpack_from(buffer, offset)[0]
+    return None
+
+
+def encode_value(spec: AddressSpec, value) -> bytearray:
+    """Encode a value into the bytes stored at a full-width (non-BOOL) address."""
+    data = bytearray(spec.length)
+    if spec.out_type == OutputType.REAL:
+        set_real(data, 0, value)
+    elif spec.out_type == OutputType.DWORD:
+        set_dword(data, 0, value)
+    elif spec.out_type == OutputType.INT and spec.length == 2:
+        set_int(data, 0, value)
+    elif spec.out_type == OutputType.INT:
+        data[0] = int(value) & 0xFF
+    else:
+        raise ValueError(f"Cannot encode value for '{spec.address}'")
+    return data
+
+
+def make_item(area: Area, db_number: int, start: int, buffer) -> S7DataItem:
+    """Build a byte-wise S7DataItem pointing at buffer."""
+    item = S7DataItem()
+    item.Area = area
+    item.WordLen = WordLen.Byte
+    item.DBNumber = db_number
+    item.Start = start
+    item.Amount = len(buffer)
+    item.pData = cast(buffer, POINTER(c_uint8))
+    return item
+
+
+# PDU size the S7-200 SMART negotiates; used until the connection reports its own
+DEFAULT_PDU_LENGTH = 240
+
+# snap7 accepts at most 20 variables per multi-variable request
+MAX_MULTI_VARS = 20
+
+
+def split_items(sizes: List[int], limit: int, overhead: int) -> List[range]:
+    """
+    Split items into consecutive request batches.
+
+    Each batch holds at most MAX_MULTI_VARS items, and their data sizes plus
+    overhead bytes per item (and a fill byte after odd-sized data) add up to
+    no more than limit bytes.
+
+    Returns:
+        Index ranges into sizes, one per batch
+    """
+    batches = []
+    first = 0
+    used = 0
+    for index, size in enumerate(sizes):
+        needed = overhead + size + size % 2
+        if index > first and (index - first == MAX_MULTI_VARS or used + needed > limit):
+            batches.append(range(first, index))
+            first = index
+            used = 0
+        if needed > limit:
+            raise ValueError(f"Item of {size} bytes does not fit a {limit}-byte request")
+        used += needed
+    if sizes:
+        batches.append(range(first, len(sizes)))
+    return batches
+
+
+class MultiReadPlan:
+    """
+    Prebuilt snap7 multi-variable read for a fixed list of addresses.
+
+    The S7DataItem arrays and their receive buffers are allocated once, so a
+    read only costs the read_multi_vars round-trip(s) plus decoding.
+
+    With coalesce=True, addresses in the same area that lie close together
+    (e.g. several bits of one byte, or neighbouring VD values) share one
+    block item, so fewer variables count against the per-request limit.
+
+    Items are split into requests of at most MAX_VARS items whose response
+    fits the connection's PDU; S7_200.readMulti rebatches a plan built for a
+    different PDU length.
+    """
+
+    MAX_VARS = MAX_MULTI_VARS
+
+    # Response bytes taken by the headers, and per item in front of its data
+    RESPONSE_HEADER = 18
+    ITEM_HEADER = 4
+
+    # Coalesced blocks may span up to MAX_GAP unused bytes and MAX_BLOCK bytes in total
+    MAX_GAP = 8
+    MAX_BLOCK = 64
+
+    def __init__(self, addresses: List[str], coalesce: bool = False, pdu_length: int = DEFAULT_PDU_LENGTH):
+        self.specs = [parse_address(address) for address in addresses]
+
+        if coalesce:
+            self.blocks, self.block_of = self._coalesce(self.specs)
+        else:
+            self.blocks = [(spec.area, spec.db_number, spec.start, spec.length) for spec in self.specs]
+            self.block_of = list(range(len(self.specs)))
+
+        self.rebatch(pdu_length)
+
+    def rebatch(self, pdu_length: int):
+        """Allocate the request batches for a connection with pdu_length bytes"""
+        self.pdu_length = pdu_length
+        self.batches = []
+        position = []
+        sizes = [length for _, _, _, length in self.blocks]
+        for number, indexes in enumerate(split_items(sizes, pdu_length - self.RESPONSE_HEADER, self.ITEM_HEADER)):
+            items = (S7DataItem * len(indexes))()
+            buffers = []
+            for item, block in zip(items, indexes):
+                area, db_number, start, length = self.blocks[block]
+                buffer = (c_uint8 * length)()
+                item.Area = area
+                item.WordLen = WordLen.Byte
+                item.DBNumber = db_number
+                item.Start = start
+                item.Amount = length
+                item.pData = cast(buffer, POINTER(c_uint8))
+                buffers.append(buffer)
+                position.append((number, len(buffers) - 1))
+            self.batches.append((items, buffers))
+
+        # Per address: batch, item within the batch and byte offset in its buffer
+        self.slots = []
+        for spec, block in zip(self.specs, self.block_of):
+            start = self.blocks[block][2]
+            self.slots.append((*position[block], spec.start - start))
+
+    @classmethod
+    def _coalesce(cls, specs: List[AddressSpec]):
+        """Merge nearby byte ranges; returns the blocks and each spec's block index."""
+        ranges = sorted({(spec.area, spec.db_number, spec.start, spec.start + spec.length) for spec in specs})
+        blocks = []
+        for area, db_number, start, end in ranges:
+            if blocks:
+                last_area, last_db, last_start, last_end = blocks[-1]
+                if (area, db_number) == (last_area, last_db) and start <= last_end + cls.MAX_GAP \
+                        and max(end, last_end) - last_start <= cls.MAX_BLOCK:
+                    blocks[-1] = (area, db_number, last_start, max(end, last_end))
+                    continue
+            blocks.append((area, db_number, start, end))
+
+        block_of = []
+        for spec in specs:
+            for index, (area, db_number, start, end) in enumerate(blocks):
+                if (area, db_number) == (spec.area, spec.db_number) and start <= spec.start < end:
+                    block_of.append(index)
+                    break
+        return [(area, db_number, start, end - start) for area, db_number, start, end in blocks], block_of
+
+    @property
+    def addresses(self) -> List[str]:
+        return [spec.address for spec in self.specs]
+
+    def decode(self) -> list:
+        """Decode the values currently held in the receive buffers."""
+        values = []
+        for spec, (batch, index, offset) in zip(self.specs, self.slots):
+            items, buffers = self.batches[batch]
+            result = items[index].Result
+            if result != 0:
+                raise RuntimeError(f"Failed to read {spec.address}: snap7 error 0x{result:X}")
+            values.append(decode_buffer(spec, buffers[index], offset))
+        return values
+
+
+@lru_cache(maxsize=256)
+def build_read_plan(addresses: tuple) -> MultiReadPlan:
+    """Get a cached, coalesced MultiReadPlan for a tuple of addresses."""
+    return MultiReadPlan(list(addresses), coalesce=True)
+
+
 load_dotenv()
 
 class S7_200:
+    # Request bytes taken by the headers, and per item by its parameters and data header
+    WRITE_HEADER = 12
+    WRITE_ITEM_HEADER = 16
+
     def __init__(self, ip=None, localtsap=None, remotetsap=None):
         # Set up logger for this class
         self.logger = setup_logger(f"{__name__}.S7_200", format_style="detailed")
@@ -40,174 +365,125 @@ class S7_200:
         localtsap = localtsap or int(os.getenv("PLC_LOCALTSAP"), 16)
         remotetsap = remotetsap or int(os.getenv("PLC_REMOTETSAP"), 16)
         
-        self.logger.debug(f"Connection parameters: IP={ip}, LocalTSAP=0x{localtsap:04X}, RemoteTSAP=0x{remotetsap:04X}")
+        self.logger.debug("Connection parameters: IP=%s, LocalTSAP=0x%04X, RemoteTSAP=0x%04X", ip, localtsap, remotetsap)
         
         self.plc = snap7.client.Client()
         self.plc.set_connection_type(3)
         self.plc.set_connection_params(ip, localtsap, remotetsap)
         self.lock = threading.Lock()
+        self.pdu_length = DEFAULT_PDU_LENGTH
 
         try:
-            self.logger.info(f"Attempting to connect to PLC at {ip}")
+            self.logger.info("Attempting to connect to PLC at %s", ip)
             self.plc.connect(ip, 0, 0)
             if self.plc.get_connected():
                 self.logger.info("Successfully connected to S7-200 Smart PLC")
                 print("Connected to S7-200 Smart")
+                self.pdu_length = self._negotiated_pdu_length()
             else:
                 self.logger.warning("Connection established but PLC reports not connected")
         except Exception as e:
-            self.logger.error(f"Failed to connect to PLC at {ip}: {e}")
+            self.logger.error("Failed to connect to PLC at %s: %s", ip, e)
             print(f"Connection failed: {e}")
 
+    def _negotiated_pdu_length(self) -> int:
+        """PDU length agreed with the PLC, or DEFAULT_PDU_LENGTH if it cannot be read."""
+        try:
+            pdu_length = self.plc.get_pdu_length()
+        except Exception as e:
+            self.logger.warning("Could not read negotiated PDU length: %s", e)
+            return DEFAULT_PDU_LENGTH
+        if not isinstance(pdu_length, int) or pdu_length <= MultiReadPlan.RESPONSE_HEADER:
+            return DEFAULT_PDU_LENGTH
+        self.logger.debug("Negotiated PDU length: %s bytes", pdu_length)
+        return pdu_length
+
     def _translate_alias(self, mem):
         """Translate memory aliases to standard format."""
-        original_mem = mem
-        mem = mem.upper()
-        
-        if mem.startswith("M") and "." in mem:
-            byte, bit = mem[1:].split(".")
-            translated = f"VX{byte}.{bit}"
-            self.logger.debug(f"Translated memory alias: {original_mem} -> {translated}")
-            return translated
-        if mem.startswith("VD"):
-            translated = f"DB1.DBD{mem[2:]}"
-            self.logger.debug(f"Translated memory alias: {original_mem} -> {translated}")
-            return translated
-        if mem.startswith("VW"):
-            translated = f"DB1.DBW{mem[2:]}"
-            self.logger.debug(f"Translated memory alias: {original_mem} -> {translated}")
-            return translated
-        
-        self.logger.debug(f"No translation needed for memory address: {original_mem}")
-        return mem
+        translated = translate_alias(mem)
+        if translated != mem.upper():
+            self.logger.debug("Translated memory alias: %s -> %s", mem, translated)
+        else:
+            self.logger.debug("No translation needed for memory address: %s", mem)
+        return translated
 
     def _resolve_area(self, mem):
         """Resolve memory area from address string."""
-        mem_lower = mem.lower()
-        
-        if mem_lower.startswith("db"):
-            area = Area.DB
-        elif mem_lower.startswith("ai") or mem_lower.startswith("iw"):
-            area = Area.PE
-        elif mem_lower.startswith("aq") or mem_lower.startswith("qw"):
-            area = Area.PA
-        elif mem_lower.startswith("q"):
-            area = Area.PA
-        elif mem_lower.startswith("i"):
-            area = Area.PE
-        elif mem_lower.startswith("v") or mem_lower.startswith("m"):
-            area = Area.MK
-        else:
-            self.logger.error(f"Unknown memory area for address: {mem}")
-            raise ValueError(f"Unknown memory area for '{mem}'")
-        
-        self.logger.debug(f"Resolved memory area for {mem}: {area}")
+        try:
+            area = resolve_area(mem)
+        except ValueError:
+            self.logger.error("Unknown memory area for address: %s", mem)
+            raise
+
+        self.logger.debug("Resolved memory area for %s: %s", mem, area)
         return area
 
     def getMem(self, mem, returnByte=False):
         """Read memory from PLC with comprehensive logging."""
         original_mem = mem
-        self.logger.debug(f"Reading memory from address: {original_mem}")
+        self.logger.debug("Reading memory from address: %s", original_mem)
         
         with ContextLogger(self.logger, operation="MEMORY_READ", address=original_mem):
             try:
-                mem = self._translate_alias(mem).lower()
-                length = 1
-                out_type = None
-                bit = 0
-                start = 0
-                db_number = 0
-
-                if mem.startswith("db"):
-                    db_number = int(mem.split(".")[0][2:])
-                    sub = mem.split(".")[1]
-
-                    if sub.startswith("dbx"):
-                        out_type = OutputType.BOOL
-                        start = int(sub[3:].split(".")[0])
-                        bit = int(sub.split(".")[1])
-                        length = 1
-                    elif sub.startswith("dbb"):
-                        out_type = OutputType.INT
-                        start = int(sub[3:])
-                        length = 1
-                    elif sub.startswith("dbw"):
-                        out_type = OutputType.INT
-                        start = int(sub[3:])
-                        length = 2
-                    elif sub.startswith("dbd"):
-                        out_type = OutputType.REAL
-                        start = int(sub[3:])
-                        length = 4
-                    area = Area.DB
-                else:
-                    area = self._resolve_area(mem)
-
-                    if mem[1] == "x":
-                        out_type = OutputType.BOOL
-                        start = int(mem[2:].split(".")[0])
-                        bit = int(mem.split(".")[1])
-                        length = 1
-                    elif mem[1] == "b":
-                        out_type = OutputType.INT
-                        start = int(mem[2:])
-                        length = 1
-                    elif mem[1] == "w":
-                        out_type = OutputType.INT
-                        start = int(mem[2:])
-                        length = 2
-                    elif mem[1] == "d":
-                        start = int(mem[2:])
-                        length = 4
-                        if mem.startswith("vd"):
-                            out_type = OutputType.REAL
-                        else:
-                            out_type = OutputType.DWORD
-                    elif mem.startswith(("aiw", "aqw", "iw", "qw", "vw")):
-                        start = int(mem[3:])
-                        length = 2
-                        out_type = OutputType.INT
-                    elif mem.startswith("vd"):
-                        start = int(mem[2:])
-                        length = 4
-                        out_type = OutputType.REAL
-
-                self.logger.debug(f"Memory read parameters: area={area}, db={db_number}, start={start}, length={length}, type={out_type}")
+                spec = parse_address(mem)
+                self.logger.debug("Memory read parameters: area=%s, db=%s, start=%s, length=%s, type=%s", spec.area, spec.db_number, spec.start, spec.length, spec.out_type)
 
                 with self.lock:
-                    data = self.plc.read_area(area, db_number, start, length)
-                    self.logger.debug(f"Successfully read {length} bytes from PLC")
+                    data = self.plc.read_area(spec.area, spec.db_number, spec.start, spec.length)
+                    self.logger.debug("Successfully read %s bytes from PLC", spec.length)
 
                 if returnByte:
-                    self.logger.debug(f"Returning raw bytes: {data}")
+                    self.logger.debug("Returning raw bytes: %s", data)
                     return data
-                    
-                # Process the data based on type
-                if out_type == OutputType.BOOL:
-                    result = get_bool(data, 0, bit)
-                    self.logger.debug(f"Read BOOL value: {result}")
-                    return result
-                elif out_type == OutputType.INT:
-                    result = get_int(data, 0)
-                    self.logger.debug(f"Read INT value: {result}")
-                    return result
-                elif out_type == OutputType.REAL:
-                    result = get_real(data, 0)
-                    self.logger.debug(f"Read REAL value: {result}")
-                    return result
-                elif out_type == OutputType.DWORD:
-                    result = get_dword(data, 0)
-                    self.logger.debug(f"Read DWORD value: {result}")
-                    return result
+
+                result = decode_value(spec, data)
+                self.logger.debug("Read value: %s", result)
+                return result
                     
             except Exception as e:
-                self.logger.error(f"Failed to read memory from {original_mem}: {e}")
+                self.logger.error("Failed to read memory from %s: %s", original_mem, e)
                 raise
 
+    def readMulti(self, plan: MultiReadPlan) -> list:
+        """
+        Read all addresses of a prebuilt MultiReadPlan.
+
+        Issues one read_multi_vars request per batch of up to 20 items that
+        fits the negotiated PDU, instead of one read_area round-trip per address.
+
+        Returns:
+            Decoded values in the same order as the plan's addresses
+        """
+        with ContextLogger(self.logger, operation="MEMORY_READ_MULTI", count=len(plan.specs)):
+            try:
+                # The plan's buffers are shared, so decode while still holding the lock
+                with self.lock:
+                    if plan.pdu_length != self.pdu_length:
+                        plan.rebatch(self.pdu_length)
+                    self.logger.debug("Reading %s addresses in %s multi-read request(s)", len(plan.specs), len(plan.batches))
+                    for items, _ in plan.batches:
+                        self.plc.read_multi_vars(items)
+                    return plan.decode()
+            except Exception as e:
+                self.logger.error("Failed to read addresses %s: %s", plan.addresses, e)
+                raise
+
+    def getMemBatch(self, addresses: List[str]) -> list:
+        """
+        Read several addresses in as few PLC round-trips as possible.
+
+        Args:
+            addresses: PLC addresses or aliases, e.g. ["VD500", "M0.1"]
+
+        Returns:
+            Decoded values in the same order as addresses
+        """
+        return self.readMulti(build_read_plan(tuple(addresses)))
+
     def writeMem(self, mem, value):
         """Write memory to PLC with comprehensive logging."""
         original_mem = mem
-        self.logger.debug(f"Writing value {value} to memory address: {original_mem}")
+        self.logger.debug("Writing value %s to memory address: %s", value, original_mem)
         
         with ContextLogger(self.logger, operation="MEMORY_WRITE", address=original_mem, value=value):
             try:
@@ -226,19 +502,19 @@ class S7_200:
                         start = int(sub[3:].split(".")[0])
                         bit = int(sub.split(".")[1])
                         set_bool(data, 0, bit, int(value))
-                        self.logger.debug(f"Set BOOL bit {bit} to {value}")
+                        self.logger.debug("Set BOOL bit %s to %s", bit, value)
                     elif sub.startswith("dbb"):
                         start = int(sub[3:])
                         set_int(data, 0, value)
-                        self.logger.debug(f"Set BYTE to {value}")
+                        self.logger.debug("Set BYTE to %s", value)
                     elif sub.startswith("dbw"):
                         start = int(sub[3:])
                         set_int(data, 0, value)
-                        self.logger.debug(f"Set WORD to {value}")
+                        self.logger.debug("Set WORD to %s", value)
                     elif sub.startswith("dbd"):
                         start = int(sub[3:])
                         set_real(data, 0, value)
-                        self.logger.debug(f"Set REAL to {value}")
+                        self.logger.debug("Set REAL to %s", value)
                     area = Area.DB
                 else:
                     area = self._resolve_area(mem)
@@ -247,45 +523,199 @@ class S7_200:
                         start = int(mem[2:].split(".")[0])
                         bit = int(mem.split(".")[1])
                         set_bool(data, 0, bit, int(value))
-                        self.logger.debug(f"Set BOOL bit {bit} to {value}")
+                        self.logger.debug("Set BOOL bit %s to %s", bit, value)
                     elif mem[1] == "b":
                         start = int(mem[2:])
                         set_int(data, 0, value)
-                        self.logger.debug(f"Set BYTE to {value}")
+                        self.logger.debug("Set BYTE to %s", value)
                     elif mem[1] == "w":
                         start = int(mem[2:])
                         set_int(data, 0, value)
-                        self.logger.debug(f"Set WORD to {value}")
+                        self.logger.debug("Set WORD to %s", value)
                     elif mem[1] == "d":
                         start = int(mem[2:])
                         if mem.startswith("vd"):
                             set_real(data, 0, value)
-                            self.logger.debug(f"Set REAL to {value}")
+                            self.logger.debug("Set REAL to %s", value)
                         else:
                             set_dword(data, 0, value)
-                            self.logger.debug(f"Set DWORD to {value}")
+                            self.logger.debug("Set DWORD to %s", value)
                     elif mem.startswith(("aqw", "qw", "vw")):
                         start = int(mem[3:])
                         set_int(data, 0, value)
-                        self.logger.debug(f"Set WORD to {value}")
+                        self.logger.debug("Set WORD to %s", value)
                     elif mem.startswith("vd"):
                         start = int(mem[2:])
                         set_real(data, 0, value)
-                        self.logger.debug(f"Set REAL to {value}")
+                        self.logger.debug("Set REAL to %s", value)
 
-                self.logger.debug(f"Writing to PLC: area={area}, db={db_number}, start={start}")
+                self.logger.debug("Writing to PLC: area=%s, db=%s, start=%s", area, db_number, start)
 
                 with self.lock:
                     result = self.plc.write_area(area, db_number, start, data)
                     time.sleep(0.05)  # Standard delay after write
                     
-                self.logger.debug(f"Successfully wrote to PLC, result: {result}")
+                self.logger.debug("Successfully wrote to PLC, result: %s", result)
                 return result
                 
             except Exception as e:
-                self.logger.error(f"Failed to write value {value} to {original_mem}: {e}")
+                self.logger.error("Failed to write value %s to %s: %s", value, original_mem, e)
+                raise
+
+    def writeMulti(self, values: Dict[str, Any]):
+        """
+        Write several addresses with at most one read and one write request.
+
+        Full-width values (bytes, words, reals) are encoded directly without a
+        read. BOOL addresses are grouped by byte; those bytes are read together
+        and updated. Everything is then sent as one multi-variable write per
+        request that fits the PDU, so N writes cost one round-trip (and one
+        post-write delay) instead of N.
+
+        Args:
+            values: Mapping of address to value, e.g. {"M4.1": True, "VD682": 90}
+
+        Returns:
+            Number of addresses written
+
+        Raises:
+            RuntimeError: If the PLC rejects reading or writing any item
+        """
+        self.logger.debug("Writing %s addresses: %s", len(values), values)
+
+        bit_groups = {}
+        bit_addresses = {}
+        words = []
+        for address, value in values.items():
+            spec = parse_address(address)
+            if spec.out_type == OutputType.BOOL:
+                key = (spec.area, spec.db_number, spec.start)
+                bit_groups.setdefault(key, []).append((spec.bit, value))
+                bit_addresses.setdefault(key, []).append(address)
+            else:
+                words.append((spec, encode_value(spec, value), address))
+
+        with ContextLogger(self.logger, operation="MEMORY_WRITE_MULTI", count=len(values)):
+            try:
+                # Buffers must stay referenced until snap7 has used them
+                bit_buffers = [(c_uint8 * 1)() for _ in bit_groups]
+                bit_items = [
+                    make_item(area, db_number, start, buffer)
+                    for (area, db_number, start), buffer in zip(bit_groups, bit_buffers)
+                ]
+                word_buffers = [(c_uint8 * len(data)).from_buffer_copy(data) for _, data, _ in words]
+                word_items = [
+                    make_item(spec.area, spec.db_number, spec.start, buffer)
+                    for (spec, _, _), buffer in zip(words, word_buffers)
+                ]
+
+                with self.lock:
+                    read_batches = split_items(
+                        [1] * len(bit_items),
+                        self.pdu_length - MultiReadPlan.RESPONSE_HEADER,
+                        MultiReadPlan.ITEM_HEADER,
+                    )
+                    for batch in read_batches:
+                        chunk = (S7DataItem * len(batch))(*bit_items[batch.start:batch.stop])
+                        self.plc.read_multi_vars(chunk)
+                        # The array holds copies; keep the ones carrying the read results
+                        bit_items[batch.start:batch.stop] = list(chunk)
+
+                    for item, buffer, bits in zip(bit_items, bit_buffers, bit_groups.values()):
+                        if item.Result != 0:
+                            raise RuntimeError(f"Failed to read byte {item.Start}: snap7 error 0x{item.Result:X}")
+                        data = bytearray(buffer)
+                        for bit, value in bits:
+                            set_bool(data, 0, bit, bool(value))
+                        buffer[0] = data[0]
+
+                    items = bit_items + word_items
+                    labels = [", ".join(addresses) for addresses in bit_addresses.values()]
+                    labels += [address for _, _, address in words]
+                    write_batches = split_items(
+                        [item.Amount for item in items],
+                        self.pdu_length - self.WRITE_HEADER,
+                        self.WRITE_ITEM_HEADER,
+                    )
+                    for batch in write_batches:
+                        self._write_items(items[batch.start:batch.stop], labels[batch.start:batch.stop])
+                    time.sleep(0.05)  # Standard delay after write
+
+                self.logger.debug(
+                    "Successfully wrote %s addresses in %s item(s) and %s request(s)",
+                    len(values), len(items), len(write_batches),
+                )
+                return len(values)
+
+            except Exception as e:
+                self.logger.error("Failed to write addresses %s: %s", values, e)
                 raise
 
+    def _write_items(self, items: List[S7DataItem], labels: List[str]):
+        """
+        Send one multi-variable write and check each item's result.
+
+        Client.write_multi_vars writes a copy of the items and drops their
+        per-item results, so the array is built here and passed to snap7
+        directly.
+        """
+        array = (S7DataItem * len(items))(*items)
+        code = self.plc._lib.Cli_WriteMultiVars(self.plc._s7_client, byref(array), c_int32(len(items)))
+        check_error(code, context="client")
+        for item, label in zip(array, labels):
+            if item.Result != 0:
+                raise RuntimeError(f"Failed to write {label}: snap7 error 0x{item.Result:X}")
+
+    def writeBits(self, values: Dict[str, bool]):
+        """
+        Write several BOOL addresses with one read and one write request.
+
+        Args:
+            values: Mapping of bit address to value, e.g. {"M4.0": False, "M4.1": True}
+        """
+        for address in values:
+            if parse_address(address).out_type != OutputType.BOOL:
+                raise ValueError(f"Not a bit address: '{address}'")
+        return self.writeMulti(values)
+
+    def toggleBit(self, mem: str) -> bool:
+        """
+        Invert a BOOL address and return its new value.
+
+        The byte is read, updated and written back while holding the client
+        lock, so no other write from this process can land in between.
+        """
+        spec = parse_address(mem)
+        if spec.out_type != OutputType.BOOL:
+            raise ValueError(f"Not a bit address: '{mem}'")
+
+        with ContextLogger(self.logger, operation="MEMORY_TOGGLE", address=mem):
+            try:
+                with self.lock:
+                    data = self.plc.read_area(spec.area, spec.db_number, spec.start, 1)
+                    value = not get_bool(data, 0, spec.bit)
+                    set_bool(data, 0, spec.bit, value)
+                    self.plc.write_area(spec.area, spec.db_number, spec.start, data)
+                    time.sleep(0.05)  # Standard delay after write
+
+                self.logger.debug("Toggled %s to %s", mem, value)
+                return value
+
+            except Exception as e:
+                self.logger.error("Failed to toggle %s: %s", mem, e)
+                raise
+
+    def pipeline(self) -> "WritePipeline":
+        """
+        Collect writeMem calls and send them together on exit.
+
+        Example:
+            with plc.pipeline() as batch:
+                batch.writeMem("M4.0", False)
+                batch.writeMem("VD682", 90)
+        """
+        return WritePipeline(self)
+
     def disconnect(self):
         """Disconnect from PLC with logging."""
         self.logger.info("Disconnecting from PLC")
@@ -293,9 +723,33 @@ class S7_200:
             self.plc.disconnect()
             self.logger.info("Successfully disconnected from PLC")
         except Exception as e:
-            self.logger.error(f"Error during PLC disconnection: {e}")
+            self.logger.error("Error during PLC disconnection: %s", e)
             raise
 
 
+class WritePipeline:
+    """Queues writes for S7_200.writeMulti; flushed when the with-block exits cleanly."""
+
+    def __init__(self, plc: S7_200):
+        self.plc = plc
+        self.values: Dict[str, Any] = {}
+
+    def writeMem(self, mem: str, value):
+        """Queue a write; a later write to the same address replaces it."""
+        self.values[mem] = value
+
+    def flush(self):
+        if self.values:
+            values, self.values = self.values, {}
+            return self.plc.writeMulti(values)
+
+    def __enter__(self) -> "WritePipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+
+
 if __name__ == "__main__":
     plc = S7_200()
@@ -7,10 +7,11 @@ It provides a centralized way to manage PLC addresses without hardcoding them in
 
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from core.logger import setup_logger
+from plc.plc import MultiReadPlan
 
 class PLCConfig:
     """Manages PLC address configuration"""
@@ -24,6 +25,9 @@ class PLCConfig:
         
         self.config_path = config_path
         self.addresses = {}
+        self._flat_addresses: Dict[Tuple[str, str], str] = {}
+        self._multi_read_cache: Dict[Tuple[Tuple[str, str], ...], MultiReadPlan] = {}
+        self._address_list_cache: Dict[Tuple[Tuple[str, str], ...], List[str]] = {}
         self.load_config()
     
     def load_config(self):
@@ -31,6 +35,17 @@ class PLCConfig:
         try:
             with open(self.config_path, 'r') as f:
                 self.addresses = json.load(f)
+            # (category, function) -> address, so lookups are a single dict get
+            self._flat_addresses = {
+                (category, function): entry["address"]
+                for category, functions in self.addresses.items()
+                if isinstance(functions, dict)
+                for function, entry in functions.items()
+                if isinstance(entry, dict) and "address" in entry
+            }
+            # Prebuilt reads and resolved address lists point at the old addresses
+            self._multi_read_cache = {}
+            self._address_list_cache = {}
             self.logger.info(f"Loaded PLC configuration from {self.config_path}")
             self.logger.info(f"Categories loaded: {list(self.addresses.keys())}")
         except FileNotFoundError:
@@ -62,6 +77,10 @@ class PLCConfig:
         Raises:
             KeyError: If category or function not found
         """
+        address = self._flat_addresses.get((category, function))
+        if address is not None:
+            return address
+        
         try:
             return self.addresses[category][function]["address"]
         except KeyError as e:
@@ -74,6 +93,47 @@ class PLCConfig:
                 self.logger.error(f"Available categories: {available_categories}")
             raise KeyError(f"PLC address not found: {category}.{function}")
     
+    def get_addresses(self, names: List[Tuple[str, str]]) -> List[str]:
+        """
+        Resolve a list of functions to their addresses
+        
+        The result is cached until the configuration is reloaded, so hot
+        request paths do not repeat the lookups.
+        
+        Args:
+            names: List of (category, function) pairs
+        
+        Returns:
+            List of PLC addresses in the same order
+        """
+        key = tuple(names)
+        addresses = self._address_list_cache.get(key)
+        if addresses is None:
+            addresses = [self.get_address(category, function) for category, function in key]
+            self._address_list_cache[key] = addresses
+        return addresses
+    
+    def build_multi_read(self, names: List[Tuple[str, str]]) -> MultiReadPlan:
+        """
+        Get a prebuilt multi-variable read for a list of functions
+        
+        The addresses are parsed and the snap7 request structures allocated
+        only once; the plan is cached until the configuration is reloaded.
+        
+        Args:
+            names: List of (category, function) pairs
+        
+        Returns:
+            MultiReadPlan to pass to S7_200.readMulti(), values in the same order
+        """
+        key = tuple(names)
+        plan = self._multi_read_cache.get(key)
+        if plan is None:
+            plan = MultiReadPlan(self.get_addresses(key), coalesce=True)
+            self._multi_read_cache[key] = plan
+            self.logger.debug(f"Built multi-read plan for {len(key)} addresses")
+        return plan
+    
     def get_comment(self, category: str, function: str) -> str:
         """
         Get comment for a specific category and function
@@ -0,0 +1,21 @@
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from core.database import Base
+
+
+@pytest.fixture
+def db_session_factory():
+    """Session factory for a fresh in-memory database, used by session_service"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with patch("core.session_service.SessionLocal", factory):
+        yield factory
+    engine.dispose()
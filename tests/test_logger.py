@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import uuid
+import pytest
+from unittest.mock import patch
+from core.logger import setup_logger, ContextLogger
+
+
+@pytest.fixture
+def capture(tmp_path):
+    """Logger from setup_logger whose handlers record what they would emit"""
+    logger = setup_logger(f"test.{uuid.uuid4().hex}", level=logging.INFO, log_dir=str(tmp_path))
+    records = {handler: [] for handler in logger.handlers}
+    patches = [patch.object(handler, "emit", side_effect=records[handler].append) for handler in logger.handlers]
+    for patcher in patches:
+        patcher.start()
+    yield logger, records
+    for patcher in patches:
+        patcher.stop()
+    for handler in logger.handlers:
+        handler.close()
+
+
+def context_of(record: logging.LogRecord, *keys):
+    return {key: getattr(record, key, None) for key in keys}
+
+
+class TestContextLogger:
+    """Test suite for ContextLogger and the context filter."""
+
+    def test_handlers_carry_bound_fields(self, capture):
+        """Test that both the console and the file handler see the bound context."""
+        logger, records = capture
+
+        with ContextLogger(logger, operation="PLC_READ", address="VX0.0"):
+            logger.info("Starting operation")
+        logger.info("Done")
+
+        assert len(records) == 2
+        for handler_records in records.values():
+            inside, outside = handler_records
+            assert context_of(inside, "operation", "address") == {"operation": "PLC_READ", "address": "VX0.0"}
+            assert context_of(outside, "operation", "address") == {"operation": None, "address": None}
+
+    def test_explicit_extra_wins(self, capture):
+        """Test that extra= on the call overrides the bound context."""
+        logger, records = capture
+
+        with ContextLogger(logger, operation="PLC_READ"):
+            logger.info("Override", extra={"operation": "PLC_WRITE"})
+
+        for handler_records in records.values():
+            assert handler_records[0].operation == "PLC_WRITE"
+
+    def test_nested_context_restores_outer(self, capture):
+        """Test that an inner context adds fields and the outer one is restored on exit."""
+        logger, records = capture
+
+        with ContextLogger(logger, operation="SESSION", session_id=7):
+            with ContextLogger(logger, operation="PLC_READ", address="VD500"):
+                logger.info("Inner")
+            logger.info("Outer")
+
+        inner, outer = next(iter(records.values()))
+        assert context_of(inner, "operation", "session_id", "address") == {
+            "operation": "PLC_READ", "session_id": 7, "address": "VD500"
+        }
+        assert context_of(outer, "operation", "session_id", "address") == {
+            "operation": "SESSION", "session_id": 7, "address": None
+        }
+
+    def test_concurrent_tasks_do_not_share_context(self, capture):
+        """Test that context bound in one task never appears on another task's records."""
+        logger, records = capture
+
+        async def request(request_id):
+            with ContextLogger(logger, request_id=request_id):
+                for step in range(3):
+                    logger.info("Step %s", step)
+                    # Let the other task bind its context in between
+                    await asyncio.sleep(0)
+
+        async def run():
+            await asyncio.gather(request("a"), request("b"))
+
+        asyncio.run(run())
+
+        handler_records = next(iter(records.values()))
+        assert len(handler_records) == 6
+        # The tasks interleave, and each record keeps its own task's id
+        assert [record.request_id for record in handler_records] == ["a", "b"] * 3
+
+    def test_disabled_logger_binds_nothing(self, capture):
+        """Test that no context is bound when INFO is not enabled."""
+        logger, records = capture
+        logger.setLevel(logging.WARNING)
+
+        with ContextLogger(logger, operation="PLC_READ") as context:
+            logger.warning("Warning")
+
+        assert context.token is None
+        for handler_records in records.values():
+            assert not hasattr(handler_records[0], "operation")
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import patch, call, MagicMock
-from plc.plc import S7_200, OutputType
+from plc.plc import S7_200, OutputType, MultiReadPlan, build_read_plan, parse_address
 from snap7 import Area
 import threading
 
@@ -386,6 +386,135 @@ class TestMemoryWriting:
         assert mock_lock.__exit__.call_count == 2
 
 
+    @patch("plc.plc.snap7.client.Client")
+    def test_write_bits_single_round_trip(self, mock_client):
+        """Test that writeBits updates several flags with one read and one write."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+        written = {}
+
+        def fill_buffers(items):
+            for item in items:
+                item.pData[0] = 0b00000101
+                item.Result = 0
+            return 0, items
+
+        def capture(client, items, count):
+            for item in items._obj:
+                written[item.Start] = item.pData[0]
+                item.Result = 0
+            return 0
+
+        mock_instance.read_multi_vars.side_effect = fill_buffers
+        mock_instance._lib.Cli_WriteMultiVars.side_effect = capture
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        with patch("plc.plc.time.sleep") as mock_sleep:
+            plc.writeBits({"M4.0": False, "M4.1": True, "M4.2": False, "M20.1": True})
+
+        mock_instance.read_multi_vars.assert_called_once()
+        mock_instance._lib.Cli_WriteMultiVars.assert_called_once()
+        mock_instance.write_area.assert_not_called()
+        mock_sleep.assert_called_once()
+        assert written == {4: 0b00000010, 20: 0b00000111}
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_write_bits_rejects_non_bool(self, mock_client):
+        """Test that writeBits only accepts bit addresses."""
+        mock_client.return_value.get_connected.return_value = True
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        with pytest.raises(ValueError, match="Not a bit address"):
+            plc.writeBits({"VD500": True})
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_toggle_bit_flips_under_lock(self, mock_client):
+        """Test that toggleBit inverts only the addressed bit and returns its new value."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+        mock_instance.read_area.return_value = bytearray([0b00000101])
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        with patch("plc.plc.time.sleep"):
+            assert plc.toggleBit("M28.1") is True
+
+        mock_instance.read_area.assert_called_once_with(Area.MK, 0, 28, 1)
+        mock_instance.write_area.assert_called_once_with(Area.MK, 0, 28, bytearray([0b00000111]))
+
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_pipeline_mixes_bits_and_values(self, mock_client):
+        """Test that a pipeline sends bits and full-width values in one write."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+        written = {}
+
+        def fill_buffers(items):
+            for item in items:
+                item.pData[0] = 0xFF
+                item.Result = 0
+            return 0, items
+
+        def capture(client, items, count):
+            for item in items._obj:
+                written[item.Start] = bytes(item.pData[i] for i in range(item.Amount))
+                item.Result = 0
+            return 0
+
+        mock_instance.read_multi_vars.side_effect = fill_buffers
+        mock_instance._lib.Cli_WriteMultiVars.side_effect = capture
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        with patch("plc.plc.time.sleep"):
+            with plc.pipeline() as batch:
+                batch.writeMem("M4.0", False)
+                batch.writeMem("VD682", 90.0)
+                batch.writeMem("VW82", 256)
+
+        # Only the bit byte is read back; words and reals are written as-is
+        mock_instance.read_multi_vars.assert_called_once()
+        assert len(mock_instance.read_multi_vars.call_args[0][0]) == 1
+        mock_instance._lib.Cli_WriteMultiVars.assert_called_once()
+        assert written == {4: bytes([0xFE]), 682: bytes([0x42, 0xB4, 0x00, 0x00]), 82: bytes([0x01, 0x00])}
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_write_multi_read_error_aborts(self, mock_client):
+        """Test that a failed bit read aborts the write."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+
+        def fail_items(items):
+            for item in items:
+                item.Result = 0x0A
+            return 0, items
+
+        mock_instance.read_multi_vars.side_effect = fail_items
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        with pytest.raises(RuntimeError, match="Failed to read byte 4"):
+            plc.writeMulti({"M4.0": True})
+        mock_instance._lib.Cli_WriteMultiVars.assert_not_called()
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_write_multi_item_error_raises(self, mock_client):
+        """Test that an item the PLC rejects fails the write instead of passing silently."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+
+        def reject_real(client, items, count):
+            for item in items._obj:
+                item.Result = 0x0A if item.Start == 682 else 0
+            return 0
+
+        mock_instance._lib.Cli_WriteMultiVars.side_effect = reject_real
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        with patch("plc.plc.time.sleep"):
+            assert plc.writeMulti({"VW82": 256}) == 1
+            with pytest.raises(RuntimeError, match="Failed to write VD682: snap7 error 0xA"):
+                plc.writeMulti({"VW82": 256, "VD682": 90.0})
+
+
 class TestParameterizedMemoryOperations:
     """Parameterized tests for various memory address formats."""
     
@@ -416,6 +545,138 @@ class TestParameterizedMemoryOperations:
         mock_instance.read_area.assert_called_with(expected_area, expected_db, expected_start, expected_length)
 
 
+class TestMultiRead:
+    """Test suite for prebuilt multi-variable reads."""
+
+    def test_parse_address_specs(self):
+        """Test that addresses parse to the same locations getMem reads."""
+        spec = parse_address("M11.4")
+        assert (spec.area, spec.db_number, spec.start, spec.length, spec.out_type, spec.bit) == (Area.MK, 0, 11, 1, OutputType.BOOL, 4)
+
+        spec = parse_address("VD504")
+        assert (spec.area, spec.db_number, spec.start, spec.length, spec.out_type) == (Area.DB, 1, 504, 4, OutputType.REAL)
+
+        spec = parse_address("VW82")
+        assert (spec.area, spec.db_number, spec.start, spec.length, spec.out_type) == (Area.DB, 1, 82, 2, OutputType.INT)
+
+    def test_plan_splits_into_batches_of_twenty(self):
+        """Test that large plans are split to respect the snap7 variable limit."""
+        plan = MultiReadPlan([f"M{i}.0" for i in range(45)])
+
+        assert [len(items) for items, _ in plan.batches] == [20, 20, 5]
+        assert plan.batches[0][0][3].Start == 3
+        assert plan.batches[0][0][3].Amount == 1
+
+    def test_wide_blocks_split_to_fit_pdu(self):
+        """Test that coalesced blocks are batched so each response fits the PDU."""
+        addresses = [f"VD{base + offset}" for base in range(0, 800, 100) for offset in range(0, 64, 4)]
+        plan = MultiReadPlan(addresses, coalesce=True)
+
+        assert [item.Amount for items, _ in plan.batches for item in items] == [64] * 8
+        # 3 * (4 + 64) bytes fit the 222 bytes a 240-byte PDU leaves for data
+        assert [len(items) for items, _ in plan.batches] == [3, 3, 2]
+
+        plan.rebatch(480)
+        assert [len(items) for items, _ in plan.batches] == [6, 2]
+        assert plan.slots[-1] == (1, 1, 60)
+
+    def test_coalesced_plan_merges_nearby_addresses(self):
+        """Test that coalescing reads nearby addresses as shared block items."""
+        plan = MultiReadPlan(["M3.3", "M3.4", "M6.0", "VD408", "VD420", "VD800"], coalesce=True)
+        items = plan.batches[0][0]
+
+        assert [(item.Start, item.Amount) for item in items] == [(3, 4), (408, 16), (800, 4)]
+
+        buffers = plan.batches[0][1]
+        buffers[0][0] = 0b00010000
+        buffers[0][3] = 0b00000001
+        buffers[1][12:16] = [0x42, 0x28, 0x00, 0x00]
+        for item in items:
+            item.Result = 0
+
+        assert plan.decode() == [False, True, True, 0.0, 42.0, 0.0]
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_read_multi_decodes_values(self, mock_client):
+        """Test that readMulti issues one request and decodes each item."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+        raw = {0: [0x10], 1: [0x42, 0x28, 0x00, 0x00], 2: [0x01, 0x00]}
+
+        def fill_buffers(items):
+            for index, item in enumerate(items):
+                for offset, byte in enumerate(raw[index]):
+                    item.pData[offset] = byte
+                item.Result = 0
+            return 0, items
+
+        mock_instance.read_multi_vars.side_effect = fill_buffers
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        values = plc.readMulti(MultiReadPlan(["M11.4", "VD504", "VW82"]))
+
+        mock_instance.read_multi_vars.assert_called_once()
+        mock_instance.read_area.assert_not_called()
+        assert values == [True, 42.0, 256]
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_read_multi_uses_negotiated_pdu(self, mock_client):
+        """Test that readMulti rebatches a plan for the connection's PDU length."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+        mock_instance.get_pdu_length.return_value = 960
+
+        def fill_buffers(items):
+            for item in items:
+                item.Result = 0
+            return 0, items
+
+        mock_instance.read_multi_vars.side_effect = fill_buffers
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+        addresses = [f"VD{base + offset}" for base in range(0, 800, 100) for offset in range(0, 64, 4)]
+        plan = MultiReadPlan(addresses, coalesce=True)
+
+        assert plc.pdu_length == 960
+        assert plc.readMulti(plan) == [0.0] * 128
+        mock_instance.read_multi_vars.assert_called_once()
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_read_multi_item_error(self, mock_client):
+        """Test that a failed item raises instead of returning stale data."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+
+        def fail_items(items):
+            for item in items:
+                item.Result = 0x0A
+            return 0, items
+
+        mock_instance.read_multi_vars.side_effect = fail_items
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        with pytest.raises(RuntimeError, match="Failed to read M11.4"):
+            plc.readMulti(MultiReadPlan(["M11.4"]))
+
+    @patch("plc.plc.snap7.client.Client")
+    def test_get_mem_batch_reuses_plan(self, mock_client):
+        """Test that getMemBatch reads aliases in one request with a cached plan."""
+        mock_instance = mock_client.return_value
+        mock_instance.get_connected.return_value = True
+
+        def fill_buffers(items):
+            for item in items:
+                item.pData[0] = 0x01
+                item.Result = 0
+            return 0, items
+
+        mock_instance.read_multi_vars.side_effect = fill_buffers
+        plc = S7_200(ip="192.168.1.100", localtsap=0x0100, remotetsap=0x0200)
+
+        assert plc.getMemBatch(["M0.0", "M0.1", "VW82"]) == [True, False, 256]
+        assert build_read_plan(("M0.0", "M0.1", "VW82")) is build_read_plan(("M0.0", "M0.1", "VW82"))
+        mock_instance.read_multi_vars.assert_called_once()
+
+
 class TestErrorHandling:
     """Test suite for error handling scenarios."""
     
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+import api.shared as shared
+from api.shared import PLCReadLoader
+
+
+def fake_plc(side_effect=None):
+    """PLC whose getMemBatch returns "value:<address>" for each address"""
+    plc = MagicMock()
+    plc.getMemBatch.side_effect = side_effect or (lambda batch: [f"value:{address}" for address in batch])
+    return plc
+
+
+class TestPLCReadLoader:
+    """Test suite for the batching PLC read loader."""
+
+    def test_same_address_is_read_once(self):
+        """Test that identical addresses in one window share one read."""
+        plc = fake_plc()
+
+        async def load():
+            loader = PLCReadLoader()
+            return await asyncio.gather(loader.load("M0.0"), loader.load("VD500"), loader.load("M0.0"))
+
+        with patch.object(shared, "plc_instance", plc):
+            assert asyncio.run(load()) == ["value:M0.0", "value:VD500", "value:M0.0"]
+
+        plc.getMemBatch.assert_called_once_with(["M0.0", "VD500"])
+
+    def test_one_batch_per_window(self):
+        """Test that each window costs one getMemBatch call."""
+        plc = fake_plc()
+
+        async def load():
+            loader = PLCReadLoader()
+            first = await asyncio.gather(loader.load_many(["M0.0", "M0.1"]), loader.load("VW82"))
+            second = await loader.load_many(["M0.0"])
+            return first, second
+
+        with patch.object(shared, "plc_instance", plc):
+            first, second = asyncio.run(load())
+
+        assert first == [["value:M0.0", "value:M0.1"], "value:VW82"]
+        assert second == ["value:M0.0"]
+        assert [sorted(c.args[0]) for c in plc.getMemBatch.call_args_list] == [["M0.0", "M0.1", "VW82"], ["M0.0"]]
+
+    def test_error_reaches_every_waiter(self):
+        """Test that a failed batch raises in every caller waiting on it."""
+        plc = fake_plc(side_effect=RuntimeError("PLC timeout"))
+
+        async def load():
+            loader = PLCReadLoader()
+            return await asyncio.gather(
+                loader.load("M0.0"), loader.load("M0.0"), loader.load("VD500"),
+                return_exceptions=True
+            )
+
+        with patch.object(shared, "plc_instance", plc):
+            results = asyncio.run(load())
+
+        assert [str(result) for result in results] == ["PLC timeout"] * 3
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_cancelled_caller_does_not_cancel_shared_read(self):
+        """Test that the read survives one of its callers being cancelled."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_read(batch):
+            started.set()
+            release.wait(timeout=1)
+            return [f"value:{address}" for address in batch]
+
+        plc = fake_plc(side_effect=slow_read)
+
+        async def load():
+            loader = PLCReadLoader()
+            cancelled = asyncio.ensure_future(loader.load("M0.0"))
+            waiting = asyncio.ensure_future(loader.load("M0.0"))
+            await asyncio.to_thread(started.wait, 1)
+            # The fetch task is referenced by the loader while it runs
+            assert len(loader._tasks) == 1
+            cancelled.cancel()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            value = await waiting
+            await asyncio.sleep(0)
+            return value, len(loader._tasks)
+
+        with patch.object(shared, "plc_instance", plc):
+            assert asyncio.run(load()) == ("value:M0.0", 0)
+
+        plc.getMemBatch.assert_called_once_with(["M0.0"])
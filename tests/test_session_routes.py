@@ -0,0 +1,126 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from functools import partial
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from core.database import Session, SessionDataPoint
+from core.session_service import session_service
+from api.shared import PLCResponse
+from main import app
+
+
+@pytest.fixture
+def client(db_session_factory):
+    # No lifespan: init_database would touch the configured database
+    return TestClient(app)
+
+
+def seed_session(factory, data_points: int) -> int:
+    """Insert one session with data_points readings and return its id"""
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    db = factory()
+    session = Session(status="completed", treatment_mode="rest", start_time=start, actual_duration_seconds=60)
+    db.add(session)
+    db.flush()
+    db.add_all([
+        SessionDataPoint(
+            session_id=session.id,
+            recorded_at=start + timedelta(seconds=index),
+            session_elapsed_seconds=index,
+            internal_pressure_1_ata=1.0 + index / 100,
+            session_state="running",
+            ac_status=index % 2 == 0
+        )
+        for index in range(data_points)
+    ])
+    db.commit()
+    session_id = session.id
+    db.close()
+    return session_id
+
+
+def buffered_details(session_id: int) -> dict:
+    """The response the endpoint would send if it built the PLCResponse in memory"""
+    details = session_service.get_session_details(session_id, include_data_points=True)
+    response = PLCResponse(success=True, data=details, message="Session details retrieved")
+    return json.loads(response.model_dump_json())
+
+
+class TestStreamSessionDetails:
+    """Test suite for the streamed session details with data points."""
+
+    @pytest.mark.parametrize("data_points,batch_size", [(0, 1000), (1, 1000), (5, 2), (6, 2)])
+    def test_streamed_body_matches_buffered_response(self, db_session_factory, client, data_points, batch_size):
+        """Test that the hand-assembled JSON parses and equals the PLCResponse."""
+        session_id = seed_session(db_session_factory, data_points)
+        batches = partial(session_service.iter_data_points, batch_size=batch_size)
+
+        with patch.object(session_service, "iter_data_points", side_effect=lambda sid: batches(sid)):
+            response = client.get(f"/api/sessions/{session_id}", params={"include_data_points": "true"})
+
+        assert response.status_code == 200
+        body = json.loads(response.content)
+        expected = buffered_details(session_id)
+        assert set(body) == set(expected)
+        assert {key: body[key] for key in ("success", "data", "message")} == \
+               {key: expected[key] for key in ("success", "data", "message")}
+        assert len(body["data"]["data_points"]) == data_points
+        datetime.fromisoformat(body["timestamp"])
+
+    def test_empty_batches_are_skipped(self, db_session_factory, client):
+        """Test that empty batches do not leave stray commas in the array."""
+        session_id = seed_session(db_session_factory, 2)
+        points = buffered_details(session_id)["data"]["data_points"]
+
+        with patch.object(session_service, "iter_data_points", return_value=iter([[], [points[0]], [], [points[1]], []])):
+            response = client.get(f"/api/sessions/{session_id}", params={"include_data_points": "true"})
+
+        assert json.loads(response.content)["data"]["data_points"] == points
+
+
+def seed_history(factory, count: int, status: str = "completed"):
+    """Insert count sessions, one per hour"""
+    start = datetime(2024, 1, 1)
+    db = factory()
+    db.add_all([Session(status=status, start_time=start + timedelta(hours=index)) for index in range(count)])
+    db.commit()
+    db.close()
+
+
+class TestSessionHistory:
+    """Test suite for session history pagination."""
+
+    @pytest.mark.parametrize("rows,has_more", [(4, False), (5, False), (6, True)])
+    def test_has_more_around_page_size(self, db_session_factory, client, rows, has_more):
+        """Test that has_more is only set when a row exists beyond the page."""
+        seed_history(db_session_factory, rows)
+
+        data = client.get("/api/sessions/history", params={"limit": 5}).json()["data"]
+
+        assert data["has_more"] is has_more
+        assert len(data["sessions"]) == min(rows, 5)
+        assert data["page_size"] == 5
+
+    def test_last_page_has_no_more(self, db_session_factory, client):
+        """Test that the page holding the last row reports has_more false."""
+        seed_history(db_session_factory, 6)
+
+        data = client.get("/api/sessions/history", params={"limit": 5, "offset": 5}).json()["data"]
+
+        assert (data["page"], len(data["sessions"]), data["has_more"]) == (2, 1, False)
+
+    def test_total_count_only_on_request(self, db_session_factory, client):
+        """Test that total_count stays None unless include_total=true."""
+        seed_history(db_session_factory, 6)
+        seed_history(db_session_factory, 2, status="aborted")
+
+        plain = client.get("/api/sessions/history", params={"limit": 5}).json()["data"]
+        counted = client.get("/api/sessions/history", params={"limit": 5, "include_total": "true"}).json()["data"]
+        filtered = client.get(
+            "/api/sessions/history", params={"limit": 5, "status": "aborted", "include_total": "true"}
+        ).json()["data"]
+
+        assert plain["total_count"] is None
+        assert counted["total_count"] == 8
+        assert (filtered["total_count"], len(filtered["sessions"]), filtered["has_more"]) == (2, 2, False)
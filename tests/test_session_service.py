@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from core.database import Session
+from core.session_service import session_service
+
+
+def seed_sessions(factory, rows):
+    """Insert Session rows given as (status, treatment_mode, actual_duration_seconds, days_ago)"""
+    now = datetime.now()
+    db = factory()
+    db.add_all([
+        Session(
+            status=status,
+            treatment_mode=mode,
+            actual_duration_seconds=duration,
+            start_time=now - timedelta(days=days_ago)
+        )
+        for status, mode, duration, days_ago in rows
+    ])
+    db.commit()
+    db.close()
+
+
+def python_summary(sessions, recent_since):
+    """The aggregation /api/sessions/statistics/summary did in Python before it moved to SQL"""
+    recent = [s for s in sessions if datetime.fromisoformat(s["start_time"]) >= recent_since]
+    status_counts, mode_counts = {}, {}
+    for session in sessions:
+        status_counts[session["status"]] = status_counts.get(session["status"], 0) + 1
+        mode_counts[session["treatment_mode"]] = mode_counts.get(session["treatment_mode"], 0) + 1
+    completed = [s for s in sessions if s.get("actual_duration_seconds")]
+    avg = sum(s["actual_duration_seconds"] for s in completed) / len(completed) if completed else 0
+    return {
+        "total_sessions": len(sessions),
+        "recent_sessions_30_days": len(recent),
+        "status_distribution": status_counts,
+        "mode_distribution": mode_counts,
+        "average_duration_seconds": round(avg),
+        "average_duration_minutes": round(avg / 60, 1),
+        "completed_sessions": len(completed),
+        "completion_rate": round(len(completed) / len(sessions) * 100, 1) if sessions else 0
+    }
+
+
+class TestStatisticsSummary:
+    """Test suite for the SQL session statistics."""
+
+    ROWS = [
+        ("completed", "rest", 3600, 1),
+        ("completed", "health", 1800, 5),
+        ("completed", "rest", 2701, 45),
+        ("aborted", "rest", None, 2),    # never finished: no duration
+        ("error", "custom", 0, 3),       # ended immediately: zero duration
+        ("running", None, None, 0),
+    ]
+
+    def test_matches_python_aggregation(self, db_session_factory):
+        """Test that the SQL summary equals the former Python aggregation."""
+        seed_sessions(db_session_factory, self.ROWS)
+        recent_since = datetime.now() - timedelta(days=30)
+
+        summary = session_service.get_statistics_summary(recent_since=recent_since)
+
+        all_sessions = session_service.get_session_history(limit=1000)
+        assert summary == python_summary(all_sessions, recent_since)
+
+    def test_null_and_zero_durations_are_not_completed(self, db_session_factory):
+        """Test that NULL and 0 durations are excluded from completion and averages."""
+        seed_sessions(db_session_factory, self.ROWS)
+
+        summary = session_service.get_statistics_summary(recent_since=datetime.now() - timedelta(days=30))
+
+        assert summary["completed_sessions"] == 3
+        assert summary["average_duration_seconds"] == round((3600 + 1800 + 2701) / 3)
+        assert summary["average_duration_minutes"] == round((3600 + 1800 + 2701) / 3 / 60, 1)
+        assert summary["completion_rate"] == 50.0
+        assert summary["status_distribution"] == {"completed": 3, "aborted": 1, "error": 1, "running": 1}
+        assert summary["mode_distribution"] == {"rest": 3, "health": 1, "custom": 1, None: 1}
+        assert summary["recent_sessions_30_days"] == 5
+
+    def test_empty_database(self, db_session_factory):
+        """Test the summary without any sessions."""
+        summary = session_service.get_statistics_summary(recent_since=datetime.now() - timedelta(days=30))
+
+        assert summary == {
+            "total_sessions": 0,
+            "recent_sessions_30_days": 0,
+            "status_distribution": {},
+            "mode_distribution": {},
+            "average_duration_seconds": 0,
+            "average_duration_minutes": 0.0,
+            "completed_sessions": 0,
+            "completion_rate": 0
+        }
+
+
+class TestCountSessions:
+    """Test suite for counting sessions with the history filters."""
+
+    def test_count_applies_history_filters(self, db_session_factory):
+        """Test that count_sessions matches the rows get_session_history filters to."""
+        seed_sessions(db_session_factory, TestStatisticsSummary.ROWS)
+        since = datetime.now() - timedelta(days=4)
+
+        assert session_service.count_sessions() == 6
+        assert session_service.count_sessions(status_filter="completed") == 3
+        assert session_service.count_sessions(date_from=since) == \
+               len(session_service.get_session_history(limit=100, date_from=since)) == 4
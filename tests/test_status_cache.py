@@ -0,0 +1,186 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi.testclient import TestClient
+import api.shared as shared
+from api.shared import StatusCache, status_cache
+from main import app
+
+
+class FakePLC:
+    """Stands in for S7_200; every read returns the current value of state"""
+
+    def __init__(self):
+        self.state = {"proceed_status": False}
+        self.getMemBatch = MagicMock(side_effect=self.read)
+        self.writeMem = MagicMock()
+        self.plc = MagicMock()
+
+    def read(self, batch):
+        return [self.state["proceed_status"]] * len(batch)
+
+
+@pytest.fixture
+def plc():
+    fake = FakePLC()
+    status_cache.clear()
+    with patch.object(shared, "plc_instance", fake):
+        yield fake
+    status_cache.clear()
+
+
+@pytest.fixture
+def client(plc):
+    # No lifespan: the background pollers and the database are not needed here
+    return TestClient(app)
+
+
+class TestStatusCaching:
+    """Test suite for cached status GET responses."""
+
+    def test_repeat_get_within_ttl_skips_plc(self, plc, client):
+        """Test that a second GET within the TTL is answered from the cache."""
+        first = client.get("/api/auth/status")
+        second = client.get("/api/auth/status")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        plc.getMemBatch.assert_called_once()
+
+    def test_post_forces_fresh_read(self, plc, client):
+        """Test that a write request clears the cache through the middleware."""
+        assert client.get("/api/auth/status").json()["data"]["proceed_status"] is False
+
+        plc.state["proceed_status"] = True
+        assert client.post("/api/auth/show").status_code == 200
+
+        assert client.get("/api/auth/status").json()["data"]["proceed_status"] is True
+        assert plc.getMemBatch.call_count == 2
+
+    def test_read_overlapping_clear_is_not_cached(self):
+        """Test that a read finishing after clear() is returned but not stored."""
+        cache = StatusCache()
+        reads = []
+
+        async def run():
+            release = asyncio.Event()
+
+            async def slow_read():
+                reads.append("slow")
+                await release.wait()
+                return "stale"
+
+            async def read():
+                reads.append("fresh")
+                return "fresh"
+
+            pending = asyncio.ensure_future(cache.get_or_compute("auth", 10, slow_read))
+            await asyncio.sleep(0)
+            # A write lands while the read is in flight
+            cache.clear()
+            release.set()
+            first = await pending
+            second = await cache.get_or_compute("auth", 10, read)
+            return first, second
+
+        assert asyncio.run(run()) == ("stale", "fresh")
+        assert reads == ["slow", "fresh"]
+
+    def test_concurrent_misses_share_one_read(self):
+        """Test that callers arriving during a miss wait for the same read."""
+        cache = StatusCache()
+        compute = MagicMock(return_value="value")
+
+        async def read():
+            await asyncio.sleep(0.01)
+            return compute()
+
+        async def run():
+            return await asyncio.gather(*(cache.get_or_compute("auth", 10, read) for _ in range(5)))
+
+        assert asyncio.run(run()) == ["value"] * 5
+        compute.assert_called_once()
+
+    def test_disabled_cache_still_shares_inflight_read(self):
+        """Test that with ttl <= 0 concurrent callers share one read but nothing is kept."""
+        cache = StatusCache()
+        compute = MagicMock(return_value="value")
+
+        async def read():
+            await asyncio.sleep(0.01)
+            return compute()
+
+        async def run():
+            shared_reads = await asyncio.gather(*(cache.get_or_compute("auth", 0, read) for _ in range(3)))
+            later = await cache.get_or_compute("auth", 0, read)
+            return shared_reads, later
+
+        assert asyncio.run(run()) == (["value"] * 3, "value")
+        assert compute.call_count == 2
+        assert cache.get("auth") is None
+
+    def test_expired_and_evicted_entries(self):
+        """Test TTL expiry and oldest-first eviction at maxsize."""
+        cache = StatusCache(maxsize=2)
+
+        with patch("api.shared.time.monotonic", return_value=100.0):
+            cache.set("auth", "a", 1)
+            cache.set("language", "b", 1)
+            cache.set("control", "c", 1)
+            assert (cache.get("auth"), cache.get("language"), cache.get("control")) == (None, "b", "c")
+
+        with patch("api.shared.time.monotonic", return_value=101.0):
+            assert cache.get("language") is None
+
+
+class TestETagRevalidation:
+    """Test suite for ETag / If-None-Match handling of status responses."""
+
+    def test_matching_tag_returns_304(self, client):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get("/api/auth/status").headers["ETag"]
+
+        response = client.get("/api/auth/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_matching_tag_in_list_returns_304(self, client):
+        """Test that the tag may be one of several listed by the client."""
+        etag = client.get("/api/auth/status").headers["ETag"]
+
+        response = client.get("/api/auth/status", headers={"If-None-Match": f'W/"other", {etag}'})
+
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize("headers", [{}, {"If-None-Match": 'W/"0000000000000000"'}])
+    def test_other_or_missing_tag_returns_body(self, client, headers):
+        """Test that a stale or missing tag gets the full body with the same ETag."""
+        first = client.get("/api/auth/status")
+
+        response = client.get("/api/auth/status", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["data"] == first.json()["data"]
+        assert response.headers["ETag"] == first.headers["ETag"]
+
+    def test_changed_value_changes_etag(self, plc, client):
+        """Test that a different PLC value yields a different ETag and a 200."""
+        etag = client.get("/api/auth/status").headers["ETag"]
+
+        plc.state["proceed_status"] = True
+        status_cache.clear()
+        response = client.get("/api/auth/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["data"]["proceed_status"] is True
+
+    def test_etag_ignores_timestamp(self, client):
+        """Test that re-reading unchanged values keeps the ETag stable."""
+        first = client.get("/api/auth/status")
+        status_cache.clear()
+        second = client.get("/api/auth/status")
+
+        assert first.headers["ETag"] == second.headers["ETag"]
@@ -0,0 +1,424 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+import api.stream_routes as stream_routes
+import api.websocket_routes as websocket_routes
+from api.stream_routes import retry_delay, schedule_next_tick, STREAM_MAX_RETRY_DELAY
+from api.websocket_routes import PLCStream, SystemStatusStream, diff_snapshot, STREAM_KEYFRAME_INTERVAL
+
+
+LAYOUT = {"pressure": {"setpoint": ("pressure_control", "pressure_setpoint")}}
+
+
+def drain(queue: asyncio.Queue) -> list:
+    """Decode every message waiting in a subscriber queue"""
+    messages = []
+    while not queue.empty():
+        messages.append(json.loads(queue.get_nowait()))
+    return messages
+
+
+class TestDiffSnapshot:
+    """Test suite for the patches sent to delta-mode clients."""
+
+    def test_only_changed_fields_are_returned(self):
+        """Test that nested sections only carry the fields that changed."""
+        previous = {"timestamp": "t1", "pressure": {"setpoint": 1.5, "internal_pressure_1": 1.2}, "auth": {"proceed_status": False}}
+        current = {"timestamp": "t2", "pressure": {"setpoint": 1.5, "internal_pressure_1": 1.3}, "auth": {"proceed_status": False}}
+
+        assert diff_snapshot(previous, current) == {"timestamp": "t2", "pressure": {"internal_pressure_1": 1.3}}
+
+    def test_unchanged_snapshot_is_empty(self):
+        """Test that identical snapshots produce an empty patch."""
+        snapshot = {"pressure": {"setpoint": 1.5}}
+        assert diff_snapshot(snapshot, {"pressure": {"setpoint": 1.5}}) == {}
+
+    def test_added_fields_are_included(self):
+        """Test that a field missing from previous is sent as a change."""
+        previous = {"custom_addresses": {}}
+        current = {"custom_addresses": {"M1.0": True}}
+
+        assert diff_snapshot(previous, current) == {"custom_addresses": {"M1.0": True}}
+
+    @pytest.mark.parametrize("previous,current", [
+        ({"error": "timeout", "pressure": {}}, {"pressure": {}}),
+        ({"custom_addresses": {"M1.0": True}}, {"custom_addresses": {}}),
+    ])
+    def test_removed_fields_need_full_state(self, previous, current):
+        """Test that a removal at any depth cannot be expressed as a patch."""
+        assert diff_snapshot(previous, current) is None
+
+
+class TestDeltaStream:
+    """Test suite for PLCStream delta mode."""
+
+    def test_full_state_then_patches(self):
+        """Test that delta clients get a keyframe followed by numbered patches."""
+        stream = PLCStream("test", LAYOUT, interval=1, error_delay=1)
+        queue = stream.delta_broker.subscribe()
+
+        with patch("api.websocket_routes.time.monotonic", return_value=100.0):
+            stream.publish({"pressure": {"setpoint": 1.5}}, "t1")
+            stream.publish({"pressure": {"setpoint": 1.6}}, "t2")
+
+        assert drain(queue) == [
+            {"type": "full", "seq": 1, "state": {"timestamp": "t1", "pressure": {"setpoint": 1.5}}},
+            {"type": "delta", "seq": 2, "changes": {"timestamp": "t2", "pressure": {"setpoint": 1.6}}},
+        ]
+        # A client subscribing now starts from the full state, not the last patch
+        late = stream.delta_broker.subscribe()
+        assert drain(late) == [{"type": "full", "seq": 2, "state": {"timestamp": "t2", "pressure": {"setpoint": 1.6}}}]
+
+    def test_first_delta_client_starts_from_latest_snapshot(self):
+        """Test that a delta client joining a running stream gets a keyframe at once."""
+        stream = PLCStream("test", LAYOUT, interval=1, error_delay=1)
+        stream.publish({"pressure": {"setpoint": 1.5}}, "t1")
+        stream.last_state = {"timestamp": "t0", "pressure": {"setpoint": 1.0}}
+
+        async def subscribe():
+            with patch.object(stream, "read_values", return_value={"pressure": {"setpoint": 1.5}}):
+                queue = stream.subscribe(deltas=True)
+                # Taken before the reader's first tick gets to run
+                messages = drain(queue)
+                stream.unsubscribe(queue)
+                return messages
+
+        # The stale delta state is dropped rather than patched against
+        assert asyncio.run(subscribe()) == [
+            {"type": "full", "seq": 1, "state": {"timestamp": "t1", "pressure": {"setpoint": 1.5}}}
+        ]
+
+    def test_keyframe_cadence(self):
+        """Test that a full state is resent every STREAM_KEYFRAME_INTERVAL seconds."""
+        stream = PLCStream("test", LAYOUT, interval=1, error_delay=1)
+        queue = stream.delta_broker.subscribe()
+        times = [100.0, 100.0 + STREAM_KEYFRAME_INTERVAL - 1, 100.0 + STREAM_KEYFRAME_INTERVAL, 101.0 + STREAM_KEYFRAME_INTERVAL]
+
+        with patch("api.websocket_routes.time.monotonic", side_effect=times):
+            for index in range(4):
+                stream.publish({"pressure": {"setpoint": index}}, f"t{index}")
+
+        assert [message["type"] for message in drain(queue)] == ["full", "delta", "full", "delta"]
+
+    def test_removed_key_falls_back_to_full(self):
+        """Test that a snapshot dropping a field is sent as a full state."""
+        stream = PLCStream("test", LAYOUT, interval=1, error_delay=1)
+        queue = stream.delta_broker.subscribe()
+
+        with patch("api.websocket_routes.time.monotonic", return_value=100.0):
+            stream.publish({"pressure": {"setpoint": 1.5}, "custom_addresses": {"M1.0": True}}, "t1")
+            stream.publish({"pressure": {"setpoint": 1.5}, "custom_addresses": {}}, "t2")
+
+        messages = drain(queue)
+        assert [message["type"] for message in messages] == ["full", "full"]
+        assert messages[1]["state"]["custom_addresses"] == {}
+
+    def test_error_then_recovery_resyncs(self):
+        """Test that the first read after a failure is sent as a full state."""
+        values = {"pressure": {"setpoint": 1.5}, "system": {"plc_connected": True, "communication_errors": 0}}
+        stream = SystemStatusStream("test", LAYOUT, interval=0.01, error_delay=1)
+
+        async def collect():
+            with patch.object(stream, "read_values", side_effect=[values, RuntimeError("timeout"), values, values]), \
+                 patch("api.websocket_routes.retry_delay", return_value=0):
+                queue = stream.subscribe(deltas=True)
+                messages = [json.loads(await asyncio.wait_for(queue.get(), timeout=1)) for _ in range(3)]
+                task = stream.task
+                stream.unsubscribe(queue)
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                return messages
+
+        full, error, resync = asyncio.run(collect())
+
+        assert (full["type"], full["seq"]) == ("full", 1)
+        assert (error["type"], error["error"], error["communication_errors"]) == ("error", "timeout", 1)
+        # Unchanged values, but the client cannot patch on top of an error
+        assert (resync["type"], resync["seq"]) == ("full", 2)
+        assert resync["state"]["pressure"] == {"setpoint": 1.5}
+        assert resync["state"]["system"]["last_update"] == resync["state"]["timestamp"]
+
+
+class TestReaderScheduling:
+    """Test suite for the shared poll cadence."""
+
+    @pytest.mark.parametrize("next_tick,now,expected", [
+        (10.0, 10.1, 10.5),   # read finished in time: next grid point
+        (10.0, 10.7, 11.0),   # overran one tick: skip it
+        (10.0, 11.8, 12.0),   # overran several ticks: skip them all
+    ])
+    def test_schedule_next_tick_stays_on_grid(self, next_tick, now, expected):
+        """Test that ticks stay on the interval grid and missed ticks are skipped."""
+        assert schedule_next_tick(next_tick, 0.5, now) == pytest.approx(expected)
+
+    def test_schedule_next_tick_without_interval(self):
+        """Test that a zero interval schedules the next read immediately."""
+        assert schedule_next_tick(10.0, 0, 12.5) == 12.5
+
+    def test_reader_ticks_follow_the_grid(self):
+        """Test that each tick is scheduled from the previous one, not from when the read finished."""
+        stream = PLCStream("test", LAYOUT, interval=0.02, error_delay=1)
+        schedule = MagicMock(wraps=schedule_next_tick)
+
+        async def run():
+            with patch.object(stream, "read_values", return_value={"pressure": {"setpoint": 1.5}}), \
+                    patch.object(websocket_routes, "schedule_next_tick", schedule):
+                queue = stream.subscribe()
+                await asyncio.sleep(0.15)
+                stream.unsubscribe(queue)
+
+        asyncio.run(run())
+
+        ticks = [c.args[0] for c in schedule.call_args_list]
+        assert len(ticks) > 2
+        assert all(c.args[1] == 0.02 for c in schedule.call_args_list)
+        # A slow read may skip grid points, but never shifts the grid
+        steps = [(b - a) / 0.02 for a, b in zip(ticks, ticks[1:])]
+        assert all(round(step) >= 1 and step == pytest.approx(round(step)) for step in steps)
+
+
+class TestStatusPoller:
+    """Test suite for the shared /api/stream poller."""
+
+    def test_parked_poller_drops_stale_snapshot(self):
+        """Test that a client arriving after the pause does not get the old snapshot."""
+        broker = stream_routes.StatusBroker()
+        plc = MagicMock()
+        plc.readMulti.side_effect = lambda plan: [0] * len(stream_routes.STREAM_NAMES)
+
+        async def get_plc():
+            return plc
+
+        async def run():
+            poller = asyncio.ensure_future(stream_routes.run_status_poller())
+            queue = broker.subscribe()
+            first = json.loads(await asyncio.wait_for(queue.get(), timeout=1))
+            broker.unsubscribe(queue)
+            await asyncio.sleep(0.05)
+            latest = broker.latest
+            late = broker.subscribe()
+            poller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await poller
+            return first, latest, late.empty()
+
+        with patch.object(stream_routes, "status_broker", broker), \
+             patch.object(stream_routes, "get_plc_async", get_plc), \
+             patch.object(stream_routes, "get_plc_config"), \
+             patch.object(stream_routes, "STREAM_POLL_INTERVAL", 0.01):
+            first, latest, late_empty = asyncio.run(run())
+
+        assert first["pressure"]["setpoint"] == 0
+        assert latest is None
+        assert late_empty
+
+
+class TestSharedReader:
+    """Test suite for the one PLC reader shared by all clients of a stream."""
+
+    def test_clients_share_each_read(self):
+        """Test that every subscriber receives every read, and no client reads on its own."""
+        stream = PLCStream("test", LAYOUT, interval=0.01, error_delay=1)
+        reads = iter(range(1000))
+
+        async def collect():
+            with patch.object(stream, "read_values", side_effect=lambda: {"pressure": {"setpoint": next(reads)}}):
+                first, second = stream.subscribe(), stream.subscribe()
+                messages = [
+                    [json.loads(await asyncio.wait_for(queue.get(), timeout=1))["pressure"]["setpoint"] for _ in range(3)]
+                    for queue in (first, second)
+                ]
+                stream.unsubscribe(first)
+                stream.unsubscribe(second)
+                return messages
+
+        first, second = asyncio.run(collect())
+
+        assert first == second == [0, 1, 2]
+
+    def test_reader_runs_while_subscribed(self):
+        """Test that the reader starts with the first client and stops with the last."""
+        stream = PLCStream("test", LAYOUT, interval=0.01, error_delay=1)
+
+        async def run():
+            with patch.object(stream, "read_values", return_value={"pressure": {"setpoint": 1.5}}):
+                assert stream.task is None
+                first = stream.subscribe()
+                task = stream.task
+                second = stream.subscribe(deltas=True)
+                assert stream.task is task
+                await first.get()
+                stream.unsubscribe(first)
+                assert not task.done()
+                stream.unsubscribe(second)
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                return stream.task
+
+        assert asyncio.run(run()) is None
+        # A client after the pause starts from a new read, not the old snapshot
+        assert stream.broker.latest is None and stream.latest_snapshot is None
+
+
+class TestUnchangedTicks:
+    """Test suite for skipping identical ticks on a stream."""
+
+    def run_stream(self, keepalive: float, duration: float = 0.2):
+        """Subscribe two clients to a stream of constant values; return their raw messages and the read count"""
+        stream = PLCStream("test", LAYOUT, interval=0.01, error_delay=1)
+        read = MagicMock(return_value={"pressure": {"setpoint": 1.5}})
+
+        async def collect():
+            with patch.object(stream, "read_values", read), \
+                    patch.object(websocket_routes, "STREAM_KEEPALIVE_INTERVAL", keepalive):
+                first, second = stream.subscribe(), stream.subscribe()
+                await asyncio.sleep(duration)
+                messages = [[queue.get_nowait() for _ in range(queue.qsize())] for queue in (first, second)]
+                stream.unsubscribe(first)
+                stream.unsubscribe(second)
+                return messages
+
+        first, second = asyncio.run(collect())
+        return first, second, read.call_count
+
+    def test_unchanged_values_are_sent_once(self):
+        """Test that repeated identical reads are not re-sent."""
+        first, second, reads = self.run_stream(keepalive=60)
+
+        assert reads > 3
+        assert len(first) == len(second) == 1
+
+    def test_keepalive_resends_unchanged_values(self):
+        """Test that unchanged values are refreshed after the keep-alive interval."""
+        first, _, reads = self.run_stream(keepalive=0.05)
+
+        assert 1 < len(first) < reads
+        assert {json.dumps(json.loads(message)["pressure"]) for message in first} == {'{"setpoint": 1.5}'}
+
+    def test_payload_is_encoded_once_for_all_clients(self):
+        """Test that every subscriber receives the same encoded payload."""
+        first, second, _ = self.run_stream(keepalive=60)
+
+        assert first[0] is second[0]
+
+
+class TestRetryBackoff:
+    """Test suite for the backoff between failed stream reads."""
+
+    def test_retry_delay_doubles_up_to_cap(self):
+        """Test that the retry delay backs off exponentially and is capped."""
+        with patch("api.stream_routes.random.uniform", return_value=1.0):
+            delays = [retry_delay(2.0, failures) for failures in range(1, 7)]
+
+        assert delays == [2.0, 4.0, 8.0, 16.0, STREAM_MAX_RETRY_DELAY, STREAM_MAX_RETRY_DELAY]
+
+    def test_retry_delay_jitter_bounds(self):
+        """Test that jitter stays within +/-20% of the backoff delay."""
+        for failures in range(1, 10):
+            base_delay = min(STREAM_MAX_RETRY_DELAY, 1.0 * 2 ** (failures - 1))
+            assert 0.8 * base_delay <= retry_delay(1.0, failures) <= 1.2 * base_delay
+
+    def test_failed_reads_back_off_until_recovery(self):
+        """Test that consecutive failures grow the delay and a good read resets it."""
+        stream = PLCStream("test", LAYOUT, interval=0.01, error_delay=2.0)
+        results = [RuntimeError("PLC offline")] * 3 + [{"pressure": {"setpoint": 1.5}}, RuntimeError("PLC offline")]
+        delay = MagicMock(return_value=0)
+
+        def read():
+            result = results.pop(0) if results else {"pressure": {"setpoint": 1.5}}
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        async def run():
+            with patch.object(stream, "read_values", side_effect=read), \
+                    patch.object(websocket_routes, "retry_delay", delay):
+                queue = stream.subscribe()
+                await asyncio.sleep(0.1)
+                stream.unsubscribe(queue)
+
+        asyncio.run(run())
+
+        assert [c.args for c in delay.call_args_list] == [(2.0, 1), (2.0, 2), (2.0, 3), (2.0, 1)]
+
+
+class FakeWebSocket:
+    """Client socket that stays silent until closed"""
+
+    def __init__(self):
+        self.query_params = {}
+        self.sent = []
+        self.closed = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        self.sent.append(json.loads(text))
+
+    async def receive(self):
+        await self.closed.wait()
+        return {"type": "websocket.disconnect", "code": 1000}
+
+
+class TestServeStream:
+    """Test suite for forwarding a shared stream to WebSocket clients."""
+
+    def test_disconnect_is_seen_without_waiting_for_a_send(self):
+        """Test that a closed socket is released at once, even while ticks are held back."""
+        stream = PLCStream("test", LAYOUT, interval=0.01, error_delay=1)
+        disconnect = MagicMock(wraps=websocket_routes.manager.disconnect)
+
+        async def serve():
+            websocket = FakeWebSocket()
+            serving = asyncio.ensure_future(websocket_routes.serve_stream(websocket, stream))
+            while not websocket.sent:
+                await asyncio.sleep(0.01)
+            # Values stay unchanged, so nothing more is sent until the keep-alive
+            websocket.closed.set()
+            await asyncio.wait_for(serving, timeout=1)
+            return websocket
+
+        with patch.object(stream, "read_values", return_value={"pressure": {"setpoint": 1.5}}), \
+             patch.object(websocket_routes.manager, "disconnect", disconnect):
+            websocket = asyncio.run(serve())
+
+        assert [message["pressure"] for message in websocket.sent] == [{"setpoint": 1.5}]
+        disconnect.assert_called_once_with(websocket)
+        assert websocket not in websocket_routes.manager.active_connections
+        assert stream.task is None
+        assert not stream.broker.has_subscribers()
+
+    def test_failed_send_ends_the_stream_once(self):
+        """Test that a send error releases the client and disconnects it only once."""
+        stream = PLCStream("test", LAYOUT, interval=0.01, error_delay=1)
+        disconnect = MagicMock(wraps=websocket_routes.manager.disconnect)
+        websocket = FakeWebSocket()
+        websocket.send_text = MagicMock(side_effect=RuntimeError("connection reset"))
+
+        with patch.object(stream, "read_values", return_value={"pressure": {"setpoint": 1.5}}), \
+             patch.object(websocket_routes.manager, "disconnect", disconnect):
+            asyncio.run(asyncio.wait_for(websocket_routes.serve_stream(websocket, stream), timeout=1))
+
+        disconnect.assert_called_once_with(websocket)
+        assert stream.task is None
+
+    @pytest.mark.parametrize("query,expected", [({}, "pressure"), ({"mode": "delta"}, "type")])
+    def test_mode_query_selects_deltas(self, query, expected):
+        """Test that ?mode=delta subscribes the client to patches instead of snapshots."""
+        stream = PLCStream("test", LAYOUT, interval=0.01, error_delay=1)
+        websocket = FakeWebSocket()
+        websocket.query_params = query
+
+        async def serve():
+            serving = asyncio.ensure_future(websocket_routes.serve_stream(websocket, stream))
+            while not websocket.sent:
+                await asyncio.sleep(0.01)
+            websocket.closed.set()
+            await asyncio.wait_for(serving, timeout=1)
+
+        with patch.object(stream, "read_values", return_value={"pressure": {"setpoint": 1.5}}):
+            asyncio.run(serve())
+
+        assert expected in websocket.sent[0]